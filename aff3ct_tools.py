@@ -5,6 +5,14 @@ import re
 import filecmp
 from subprocess import call
 import copy
+import fnmatch
+import hashlib
+import pickle
+import tempfile
+import multiprocessing
+import time
+from contextlib import contextmanager
+import xmltodict
 
 class bcolors:
     HEADER    = '\033[95m'
@@ -17,6 +25,74 @@ class bcolors:
     BOLD      = '\033[1m'
     UNDERLINE = '\033[4m'
 
+def is_LDPC_BP_HL(module):
+	return (("Decoder_LDPC_BP_horizontal_layered" in module['short_name']
+	or       "Decoder_LDPC_BP_vertical_layered"   in module['short_name']
+	or       "Decoder_LDPC_BP_flooding"           in module['short_name'])
+	and     ("ONMS" not in module['short_name'] and "Gallager" not in module['short_name']))
+
+def load_templates(template_path):
+	# the templates are read once and then shared by all the modules (and by the workers of the pool)
+	templates = {}
+	for key, file_name in [("hpp",         "Wrapper_template.hpp"                                      ),
+	                       ("cpp",         "Wrapper_template.cpp"                                      ),
+	                       ("LDPC_BP_hpp", "special/Wrapper_Decoder_LDPC_BP_horizontal_layered_template.hpp"),
+	                       ("LDPC_BP_cpp", "special/Wrapper_Decoder_LDPC_BP_horizontal_layered_template.cpp")]:
+		with open(template_path + "/" + file_name,"r") as f:
+			templates[key] = f.read()
+	return templates
+
+_pool_data = None
+
+def pool_map(func, items, n_jobs = 1, data = None):
+	# Applies 'func' on each element of 'items' in a pool of 'n_jobs' processes (0 = one per CPU) and returns the results
+	# in the order of 'items'. 'data' is given to the workers through the fork (read it with 'get_pool_data()'), it is
+	# not serialized. Falls back to a serial loop if there is only one job or if the processes cannot be forked.
+	global _pool_data
+	items = list(items)
+	if not n_jobs or n_jobs < 0:
+		n_jobs = os.cpu_count() or 1
+	n_jobs = min(n_jobs, len(items))
+
+	_pool_data = data
+	try:
+		if n_jobs <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+			return [func(item) for item in items]
+		with multiprocessing.get_context("fork").Pool(n_jobs) as pool:
+			return pool.map(func, items, chunksize = max(1, len(items) // (4 * n_jobs)))
+	finally:
+		_pool_data = None
+
+def get_pool_data():
+	return _pool_data
+
+def log_message(message, messages = None):
+	# the jobs of 'pool_map' collect their messages in 'messages', the parent process prints them in order
+	if messages is None:
+		print(message)
+	else:
+		messages.append(message)
+
+class Phase_timer:
+	# measures the elapsed time of the successive phases of the configuration
+	def __init__(self):
+		self.phases = []
+
+	@contextmanager
+	def phase(self, name):
+		start = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.phases.append((name, time.perf_counter() - start))
+
+	def report(self):
+		width = max([len(name) for name, _ in self.phases] + [len("Total")])
+		print("Timing:")
+		for name, elapsed in self.phases:
+			print("  " + name.ljust(width) + " : " + "{:8.3f}".format(elapsed) + " s")
+		print("  " + "Total".ljust(width) + " : " + "{:8.3f}".format(sum(e for _, e in self.phases)) + " s")
+
 def make_dir_tree(modules, verbose = False):
 	for _,module in modules.items():
 		folder_path = module['mk_dir_path']
@@ -25,180 +101,207 @@ def make_dir_tree(modules, verbose = False):
 			if verbose:
 				print("Creating folder : " + folder_path)
 
-def write_hpp_wrappers(modules, template_path, verbose = False):
-	for _,module in modules.items():
-		if (("Decoder_LDPC_BP_horizontal_layered" in module['short_name']
-		or   "Decoder_LDPC_BP_vertical_layered"   in module['short_name']
-		or   "Decoder_LDPC_BP_flooding"           in module['short_name'])
-		and ("ONMS" not in module['short_name'] and "Gallager" not in module['short_name'])):
-			write_LDPC_BP_HL_hpp_wrapper(template_path, module['mk_dir_path'], module['short_name'], verbose)
-			continue
+def write_wrappers(files, verbose = False):
+	for file_list in files:
+		for file_path, content in file_list:
+			write_if_different(file_path, content, verbose)
 
-		wrapper_hpp = ""
-		with open(template_path + "/Wrapper_template.hpp","r") as f:
-			wrapper_hpp = f.read()
-			if 'parent' in module.keys() and module['parent']:
-				wrapper_hpp = wrapper_hpp.replace("{parent}", ", " + module['parent'])
-			else:
-				wrapper_hpp = wrapper_hpp.replace("{parent}", "")
-			wrapper_hpp = wrapper_hpp.replace("{SHORT_NAME}"      , module['short_name'     ].upper())
-			wrapper_hpp = wrapper_hpp.replace("{short_name}"      , module['short_name'     ]        )
-			wrapper_hpp = wrapper_hpp.replace("{name}"            , module['name'           ]        )
-			wrapper_hpp = wrapper_hpp.replace("{full_template}"   , module['template']['full'   ]    )
-			wrapper_hpp = wrapper_hpp.replace("{medium_template}" , module['template']['medium' ]    )
-			wrapper_hpp = wrapper_hpp.replace("{short_template}"  , module['template']['short'  ]    )
-			wrapper_hpp = wrapper_hpp.replace("{default_template}", module['template']['default']    )
-			wrapper_hpp = wrapper_hpp.replace("{dtor_trick}"      , module['dtor_trick'     ]        )
+def write_hpp_wrappers(modules, template_path, verbose = False, n_jobs = 1, templates = None):
+	if templates is None:
+		templates = load_templates(template_path)
+	write_wrappers(pool_map(gen_hpp_wrapper_job, modules.values(), n_jobs, templates), verbose)
 
+def gen_hpp_wrapper_job(module):
+	return gen_hpp_wrapper(module, get_pool_data())
 
-		file_path = module['mk_dir_path'] + "/" + module['short_name'] + ".hpp"
-		write_if_different(file_path, wrapper_hpp, verbose)
+def gen_hpp_wrapper(module, templates):
+	if is_LDPC_BP_HL(module):
+		return gen_LDPC_BP_HL_hpp_wrapper(templates, module['mk_dir_path'], module['short_name'])
 
-def write_LDPC_BP_HL_hpp_wrapper(template_path, mk_dir_path, short_name, verbose):
+	wrapper_hpp = templates["hpp"]
+	if 'parent' in module.keys() and module['parent']:
+		wrapper_hpp = wrapper_hpp.replace("{parent}", ", " + module['parent'])
+	else:
+		wrapper_hpp = wrapper_hpp.replace("{parent}", "")
+	wrapper_hpp = wrapper_hpp.replace("{SHORT_NAME}"      , module['short_name'     ].upper())
+	wrapper_hpp = wrapper_hpp.replace("{short_name}"      , module['short_name'     ]        )
+	wrapper_hpp = wrapper_hpp.replace("{name}"            , module['name'           ]        )
+	wrapper_hpp = wrapper_hpp.replace("{full_template}"   , module['template']['full'   ]    )
+	wrapper_hpp = wrapper_hpp.replace("{medium_template}" , module['template']['medium' ]    )
+	wrapper_hpp = wrapper_hpp.replace("{short_template}"  , module['template']['short'  ]    )
+	wrapper_hpp = wrapper_hpp.replace("{default_template}", module['template']['default']    )
+	wrapper_hpp = wrapper_hpp.replace("{dtor_trick}"      , module['dtor_trick'     ]        )
+
+	file_path = module['mk_dir_path'] + "/" + module['short_name'] + ".hpp"
+	return [(file_path, wrapper_hpp)]
+
+def gen_LDPC_BP_HL_hpp_wrapper(templates, mk_dir_path, short_name):
 	types              = [ "MS", "OMS",       "NMS",            "SPA",           "LSPA"]
 
+	files = []
 	for i in range(len(types)):
-		wrapper_hpp = ""
-		with open(template_path + "/special/Wrapper_Decoder_LDPC_BP_horizontal_layered_template.hpp","r") as f:
-			wrapper_hpp = f.read()
-			if "inter" in short_name:
-				wrapper_hpp = wrapper_hpp.replace("{simd}", "_simd")
-			else:
-				wrapper_hpp = wrapper_hpp.replace("{simd}", "")
+		wrapper_hpp = templates["LDPC_BP_hpp"]
+		if "inter" in short_name:
+			wrapper_hpp = wrapper_hpp.replace("{simd}", "_simd")
+		else:
+			wrapper_hpp = wrapper_hpp.replace("{simd}", "")
 
-			wrapper_hpp = wrapper_hpp.replace("{type}", types[i])
-			wrapper_hpp = wrapper_hpp.replace("{TYPE}", types[i].upper())
-			wrapper_hpp = wrapper_hpp.replace("{short_name}", short_name)
-			wrapper_hpp = wrapper_hpp.replace("{SHORT_NAME}", short_name.upper())
-			file_path = mk_dir_path + "/" + short_name + "_" + types[i] + ".hpp"
-			write_if_different(file_path, wrapper_hpp, verbose)
+		wrapper_hpp = wrapper_hpp.replace("{type}", types[i])
+		wrapper_hpp = wrapper_hpp.replace("{TYPE}", types[i].upper())
+		wrapper_hpp = wrapper_hpp.replace("{short_name}", short_name)
+		wrapper_hpp = wrapper_hpp.replace("{SHORT_NAME}", short_name.upper())
+		file_path = mk_dir_path + "/" + short_name + "_" + types[i] + ".hpp"
+		files.append((file_path, wrapper_hpp))
+	return files
 
-def write_LDPC_BP_HL_cpp_wrapper(template_path, mk_dir_path, include_path, short_name, verbose):
+def gen_LDPC_BP_HL_cpp_wrapper(templates, mk_dir_path, include_path, short_name, instances = None):
 	types              = [ "MS", "OMS",       "NMS",            "SPA",           "LSPA"]
 	update_rule_args   = [ "",   "(R)offset", "(R)norm_factor", "max_CN_degree", "max_CN_degree"]
 	max_CN_degree_decl = "const auto max_CN_degree = (unsigned int)H.get_cols_max_degree();\n"
 	offset_decl        = "const float offset, "
 	norm_factor_decl   = "const float norm_factor, "
 
+	if instances is None:
+		instances = []
+
+	files = []
 	for i in range(len(types)):
-		wrapper_cpp = ""
-		with open(template_path + "/special/Wrapper_Decoder_LDPC_BP_horizontal_layered_template.cpp","r") as f:
-			wrapper_cpp = f.read()
-			wrapper_cpp = wrapper_cpp.replace("{short_name}", short_name)
-			wrapper_cpp = wrapper_cpp.replace("{path}", include_path)
-			wrapper_cpp = wrapper_cpp.replace("{type}", types           [i])
-			wrapper_cpp = wrapper_cpp.replace("{args}", update_rule_args[i])
-			if "inter" in short_name:
-				wrapper_cpp = wrapper_cpp.replace("{simd}", "_simd")
-			else:
-				wrapper_cpp = wrapper_cpp.replace("{simd}", "")
+		wrapper_cpp = templates["LDPC_BP_cpp"]
+		wrapper_cpp = wrapper_cpp.replace("{short_name}", short_name)
+		wrapper_cpp = wrapper_cpp.replace("{path}", include_path)
+		wrapper_cpp = wrapper_cpp.replace("{type}", types           [i])
+		wrapper_cpp = wrapper_cpp.replace("{args}", update_rule_args[i])
+		if "inter" in short_name:
+			wrapper_cpp = wrapper_cpp.replace("{simd}", "_simd")
+		else:
+			wrapper_cpp = wrapper_cpp.replace("{simd}", "")
 
-			if update_rule_args[i] == "(R)offset":
-				wrapper_cpp = wrapper_cpp.replace("{offset_decl}", offset_decl)
-				wrapper_cpp = wrapper_cpp.replace("{offset_arg}", '"offset"_a=(R)0.0f, ')
-			else:
-				wrapper_cpp = wrapper_cpp.replace("{offset_decl}", "")
-				wrapper_cpp = wrapper_cpp.replace("{offset_arg}", '')
+		if update_rule_args[i] == "(R)offset":
+			wrapper_cpp = wrapper_cpp.replace("{offset_decl}", offset_decl)
+			wrapper_cpp = wrapper_cpp.replace("{offset_arg}", '"offset"_a=(R)0.0f, ')
+		else:
+			wrapper_cpp = wrapper_cpp.replace("{offset_decl}", "")
+			wrapper_cpp = wrapper_cpp.replace("{offset_arg}", '')
 
-			if update_rule_args[i] == "(R)norm_factor":
-				wrapper_cpp = wrapper_cpp.replace("{norm_factor_decl}", norm_factor_decl)
-				wrapper_cpp = wrapper_cpp.replace("{norm_factor_arg}", '"norm_factor"_a=(R)1.0f, ')
-			else:
-				wrapper_cpp = wrapper_cpp.replace("{norm_factor_decl}", "")
-				wrapper_cpp = wrapper_cpp.replace("{norm_factor_arg}", '')
+		if update_rule_args[i] == "(R)norm_factor":
+			wrapper_cpp = wrapper_cpp.replace("{norm_factor_decl}", norm_factor_decl)
+			wrapper_cpp = wrapper_cpp.replace("{norm_factor_arg}", '"norm_factor"_a=(R)1.0f, ')
+		else:
+			wrapper_cpp = wrapper_cpp.replace("{norm_factor_decl}", "")
+			wrapper_cpp = wrapper_cpp.replace("{norm_factor_arg}", '')
 
-			if update_rule_args[i] == "max_CN_degree":
-				wrapper_cpp = wrapper_cpp.replace("{max_CN_degree_decl}", max_CN_degree_decl)
+		if update_rule_args[i] == "max_CN_degree":
+			wrapper_cpp = wrapper_cpp.replace("{max_CN_degree_decl}", max_CN_degree_decl)
+		else:
+			wrapper_cpp = wrapper_cpp.replace("{max_CN_degree_decl}", "")
+
+		instance_lines = ""
+		for inst in instances:
+			instance_lines += '\ntemplate class aff3ct::wrapper::Wrapper_' + short_name + '_' + types[i] + inst['template'] + ';'
+		wrapper_cpp = wrapper_cpp.replace("{instances}", instance_lines)
+
+		file_path = mk_dir_path + "/" + short_name + "_" + types[i] + ".cpp"
+		files.append((file_path, wrapper_cpp))
+	return files
+
+def write_cpp_wrappers(modules, template_path, verbose = False, n_jobs = 1, templates = None):
+	if templates is None:
+		templates = load_templates(template_path)
+	write_wrappers(pool_map(gen_cpp_wrapper_job, modules.values(), n_jobs, templates), verbose)
+
+def gen_cpp_wrapper_job(module):
+	return gen_cpp_wrapper(module, get_pool_data())
+
+def gen_cpp_wrapper(module, templates):
+	if is_LDPC_BP_HL(module):
+		return gen_LDPC_BP_HL_cpp_wrapper(templates, module['mk_dir_path'], module['include_path'], module['short_name'],
+		                                  module.get('instances', []))
+	init_lines = ""
+	wrapper_cpp = ""
+
+	class_constructors = module['constructors']
+	if not module['is_abstract']:
+		for constructor in class_constructors:
+			arg_types = ""
+			arg_init  = ""
+			new_line  = '\n\tthis->def(py::init<{types}>(){init}, R"pbdoc(' + constructor['doc']+ ')pbdoc", py::return_value_policy::take_ownership);'
+			arg_nbr = len(constructor['args'])
+			for a_idx in range(arg_nbr):
+				arg_types += constructor['args'][a_idx]['type'] + ", "
+				arg_init  += '"' + constructor['args'][a_idx]['name'] +'"_a' + constructor['args'][a_idx]['default'] + ', '
+			arg_types = arg_types[:-2]
+			arg_init  = arg_init [:-2]
+			new_line  = new_line.replace("{types}", arg_types)
+			if arg_init:
+				arg_init = "," + arg_init
+
+			new_line  = new_line.replace("{init}", arg_init)
+			init_lines += new_line
+	if init_lines:
+		init_lines += '\n'
+
+	def_lines = ""
+
+	if module['short_name'] == 'Encoder':
+		def_lines += '\n\tthis->def("get_info_bits_pos", &Encoder<B>::get_info_bits_pos);\n'
+	if module['short_name'] == "dvbs2_values":
+		def_lines += '\n\tthis->def("build_H", [](const aff3ct::tools::dvbs2_values & self)\n{\n\treturn aff3ct::tools::build_H(self);\n});\n'
+
+	if 'definitions' in module.keys():
+		for def_ in module['definitions']:
+			if module['short_name'] == 'Decoder' and def_['short_name'] == 'reset':
+				def_lines += 'this->def("reset", [](aff3ct::module::Decoder& self){self.reset();});'
 			else:
-				wrapper_cpp = wrapper_cpp.replace("{max_CN_degree_decl}", "")
-
-			file_path = mk_dir_path + "/" + short_name + "_" + types[i] + ".cpp"
-			write_if_different(file_path, wrapper_cpp, verbose)
-
-def write_cpp_wrappers(modules, template_path, verbose = False):
-	for _,module in modules.items():
-		if (("Decoder_LDPC_BP_horizontal_layered" in module['short_name']
-		or   "Decoder_LDPC_BP_vertical_layered"   in module['short_name']
-		or   "Decoder_LDPC_BP_flooding"           in module['short_name'])
-		and ("ONMS" not in module['short_name'] and "Gallager" not in module['short_name'])):
-			write_LDPC_BP_HL_cpp_wrapper(template_path, module['mk_dir_path'], module['include_path'], module['short_name'], verbose)
-			continue
-		init_lines = ""
-		wrapper_cpp = ""
-
-		class_constructors = module['constructors']
-		if not module['is_abstract']:
-			for constructor in class_constructors:
-				arg_types = ""
-				arg_init  = ""
-				new_line  = '\n\tthis->def(py::init<{types}>(){init}, R"pbdoc(' + constructor['doc']+ ')pbdoc", py::return_value_policy::take_ownership);'
-				arg_nbr = len(constructor['args'])
-				for a_idx in range(arg_nbr):
-					arg_types += constructor['args'][a_idx]['type'] + ", "
-					arg_init  += '"' + constructor['args'][a_idx]['name'] +'"_a' + constructor['args'][a_idx]['default'] + ', '
-				arg_types = arg_types[:-2]
-				arg_init  = arg_init [:-2]
-				new_line  = new_line.replace("{types}", arg_types)
-				if arg_init:
-					arg_init = "," + arg_init
-
-				new_line  = new_line.replace("{init}", arg_init)
-				init_lines += new_line
-		if init_lines:
-			init_lines += '\n'
-
-		def_lines = ""
-
-		if module['short_name'] == 'Encoder':
-			def_lines += '\n\tthis->def("get_info_bits_pos", &Encoder<B>::get_info_bits_pos);\n'
-		if module['short_name'] == "dvbs2_values":
-			def_lines += '\n\tthis->def("build_H", [](const aff3ct::tools::dvbs2_values & self)\n{\n\treturn aff3ct::tools::build_H(self);\n});\n'
+				def_lines += '\n\tthis->def("' + def_['short_name'] + '"'
+				def_lines += ', &' + module['short_name'] + module['template']['short'] + '::' + def_['short_name'] + ');'
 
+	if 'tasks' in module.keys():
+		defs_names = ['reset']
 		if 'definitions' in module.keys():
-			for def_ in module['definitions']:
-				if module['short_name'] == 'Decoder' and def_['short_name'] == 'reset':
-					def_lines += 'this->def("reset", [](aff3ct::module::Decoder& self){self.reset();});'
-				else:
-					def_lines += '\n\tthis->def("' + def_['short_name'] + '"'
-					def_lines += ', &' + module['short_name'] + module['template']['short'] + '::' + def_['short_name'] + ');'
+			defs_names += [def_['short_name'] for def_ in module['definitions']]
+		for task in module['tasks']:
+			if task not in defs_names:
+				def_lines += '\n\tthis->def("' + task + '", [](aff3ct::module::Module& self, py::args args, py::kwargs kwargs)'
+				def_lines += '{ return Wrapper_Task::call(self("' + task + '"), args, kwargs); }'
+				def_lines += ', R"pbdoc(Executes the \'' + task + '\' task on NumPy arrays (see \'Task.__call__\').)pbdoc");'
 
-		if 'tasks_doc' in module.keys():
-			if module["tasks_doc"]:
-				def_lines += '\n\tthis->def_property_readonly("tasks", [](' + module['short_name'] + module['template']['short'] + '& self)-> std::vector<std::shared_ptr<Task>> { return self.tasks; },R"pbdoc(List of tasks:\n\n'+ module["tasks_doc"]+ ')pbdoc");'
+	if 'tasks_doc' in module.keys():
+		if module["tasks_doc"]:
+			def_lines += '\n\tthis->def_property_readonly("tasks", [](' + module['short_name'] + module['template']['short'] + '& self)-> std::vector<std::shared_ptr<Task>> { return self.tasks; },R"pbdoc(List of tasks:\n\n'+ module["tasks_doc"]+ ')pbdoc");'
 
-		if 'class_doc' in module.keys():
-			if module["class_doc"]:
-				def_lines += '\n\tthis->doc() = R"pbdoc('+ module["class_doc"]+ ')pbdoc";'
+	if 'class_doc' in module.keys():
+		if module["class_doc"]:
+			def_lines += '\n\tthis->doc() = R"pbdoc('+ module["class_doc"]+ ')pbdoc";'
 
 
-		if def_lines:
-			def_lines += '\n'
+	if def_lines:
+		def_lines += '\n'
 
-		wrapper_cpp = ""
-		with open(template_path + "/Wrapper_template.cpp","r") as f:
-			wrapper_cpp = f.read()
-			if 'parent' in module.keys() and module['parent']:
-				wrapper_cpp = wrapper_cpp.replace("{parent}", "," + module['parent'])
-			else:
-				wrapper_cpp = wrapper_cpp.replace("{parent}", "")
+	wrapper_cpp = templates["cpp"]
+	if 'parent' in module.keys() and module['parent']:
+		wrapper_cpp = wrapper_cpp.replace("{parent}", "," + module['parent'])
+	else:
+		wrapper_cpp = wrapper_cpp.replace("{parent}", "")
 
-			if module['has_template']:
-				footer = '#include "Tools/types.h"\ntemplate class aff3ct::wrapper::Wrapper_'+ module['short_name'] + module['template']['default']+';'
-			else:
-				footer = ''
-			wrapper_cpp = wrapper_cpp.replace("{short_name}",       module['short_name'         ])
-			wrapper_cpp = wrapper_cpp.replace("{name}",             module['name'               ])
-			wrapper_cpp = wrapper_cpp.replace("{short_template}",   module['template']['short'  ])
-			wrapper_cpp = wrapper_cpp.replace("{medium_template}" , module['template']['medium' ])
-			wrapper_cpp = wrapper_cpp.replace("{default_template}", module['template']['default'])
-			wrapper_cpp = wrapper_cpp.replace("{footer}",           footer                       )
-			wrapper_cpp = wrapper_cpp.replace("{path}",             module['include_path'       ])
-			wrapper_cpp = wrapper_cpp.replace("{init_lines}",       init_lines                   )
-			wrapper_cpp = wrapper_cpp.replace("{def_lines}",        def_lines                    )
-			wrapper_cpp = wrapper_cpp.replace("{dtor_trick}"      , module['dtor_trick'         ])
-
-		file_path = module['mk_dir_path'] + "/" + module['short_name'] + ".cpp"
-		write_if_different(file_path, wrapper_cpp, verbose)
+	if module['has_template']:
+		footer = '#include "Tools/types.h"\ntemplate class aff3ct::wrapper::Wrapper_'+ module['short_name'] + module['template']['default']+';'
+		for inst in module.get('instances', []):
+			footer += '\ntemplate class aff3ct::wrapper::Wrapper_'+ module['short_name'] + inst['template'] + ';'
+	else:
+		footer = ''
+	wrapper_cpp = wrapper_cpp.replace("{short_name}",       module['short_name'         ])
+	wrapper_cpp = wrapper_cpp.replace("{name}",             module['name'               ])
+	wrapper_cpp = wrapper_cpp.replace("{short_template}",   module['template']['short'  ])
+	wrapper_cpp = wrapper_cpp.replace("{medium_template}" , module['template']['medium' ])
+	wrapper_cpp = wrapper_cpp.replace("{default_template}", module['template']['default'])
+	wrapper_cpp = wrapper_cpp.replace("{footer}",           footer                       )
+	wrapper_cpp = wrapper_cpp.replace("{path}",             module['include_path'       ])
+	wrapper_cpp = wrapper_cpp.replace("{init_lines}",       init_lines                   )
+	wrapper_cpp = wrapper_cpp.replace("{def_lines}",        def_lines                    )
+	wrapper_cpp = wrapper_cpp.replace("{dtor_trick}"      , module['dtor_trick'         ])
+
+	file_path = module['mk_dir_path'] + "/" + module['short_name'] + ".cpp"
+	return [(file_path, wrapper_cpp)]
 
 def gen_wrapper_cpp_lines_LDPC_BP_HL(module_info, the_mod):
 	types = [ "MS", "OMS", "NMS", "SPA", "LSPA"]
@@ -218,45 +321,80 @@ def gen_wrapper_cpp_line(module_info, the_mod):
 		line +=  module_info["short_name"].lower() + '(new aff3ct::wrapper::Wrapper_' + module_info["short_name"] + '(' + the_mod + '));\n'
 
 	line += '\twrappers.push_back(wrapper_' + module_info["short_name"].lower() + '.get()); \n\n'
+
+	for inst in module_info.get('instances', []):
+		var   = 'wrapper_' + module_info["short_name"].lower() + '_' + inst['suffix'].lower()
+		line += '\tstd::unique_ptr<aff3ct::wrapper::Wrapper_py> ' + var + '(new aff3ct::wrapper::Wrapper_' + module_info["short_name"] + inst['template'] + '(' + the_mod + ', "' + inst['suffix'] + '"));\n'
+		line += '\twrappers.push_back(' + var + '.get()); \n\n'
 	return line
 
-def gen_py_aff3ct_cpp(modules, tree, mod, root_mod, cpp_content):
+def walk_py_aff3ct_groups(modules, tree, mod, root_mod, visit):
+	# Calls 'visit(module_info, the_mod, mod)' on the wrapped classes in their order of registration, 'the_mod' being
+	# the Python submodule of the class and 'mod' its parent. A root class of the modules gets its own submodule, a
+	# root class of the tools only if it has children (the leaves are registered in 'm0').
 	for key, value in tree.items():
 		if key in modules:
 			module_info = modules[key]
 			the_mod = mod
-			if not module_info["leaf"] and mod == root_mod and mod == 'm0':
-				cpp_content += '\tpy::module_ mod_' + module_info['short_name'].lower() + " = " + mod + '.def_submodule("' +  module_info['short_name'].lower() + '");\n'
-				the_mod = 'mod_' + module_info['short_name'].lower()
-				cpp_content += '\t' + the_mod + '.doc() = ' + 'R"pbdoc(AFF3CT Tools inheritating from ' + module_info['short_name'] + '.)pbdoc";\n'
-				cpp_content += '\t' + 'doc_m0 += R"pbdoc(           ' + module_info['short_name'].lower() + '\n' + ')pbdoc";\n'
-			elif mod == root_mod and mod == 'm1':
-				cpp_content += '\tpy::module_ mod_' + module_info['short_name'].lower() + " = " + mod + '.def_submodule("' +  module_info['short_name'].lower() + '");\n'
+			if (not module_info["leaf"] and mod == root_mod and mod == 'm0') or (mod == root_mod and mod == 'm1'):
 				the_mod = 'mod_' + module_info['short_name'].lower()
-				cpp_content += '\t' + the_mod + '.doc() = ' + 'R"pbdoc(AFF3CT Modules inheritating from ' + module_info['short_name'] + '.)pbdoc";\n'
-				cpp_content += '\t' + 'doc_m1 += R"pbdoc(           ' + module_info['short_name'].lower() + '\n' + ')pbdoc";\n'
-
-			if (("Decoder_LDPC_BP_horizontal_layered" in module_info['short_name']
-			or   "Decoder_LDPC_BP_vertical_layered"   in module_info['short_name']
-			or   "Decoder_LDPC_BP_flooding"           in module_info['short_name'])
-			and ("ONMS" not in module_info['short_name'] and "Gallager" not in module_info['short_name'])):
-				cpp_content += gen_wrapper_cpp_lines_LDPC_BP_HL(module_info, the_mod)
-			else:
-				cpp_content += gen_wrapper_cpp_line(module_info, the_mod)
+			visit(module_info, the_mod, mod)
 
 			if not module_info["leaf"]:
-				cpp_content = gen_py_aff3ct_cpp(modules, value, the_mod, root_mod, cpp_content)
+				walk_py_aff3ct_groups(modules, value, the_mod, root_mod, visit)
+
+def gen_py_aff3ct_groups(modules, tree, mod, root_mod, groups):
+	# gathers the wrappers by Python submodule: {submodule: [declaration of the submodule, wrappers]}
+	def visit(module_info, the_mod, mod):
+		if the_mod != mod:
+			kind = 'Tools' if mod == 'm0' else 'Modules'
+			decl  = '\tpy::module_ ' + the_mod + " = " + mod + '.def_submodule("' +  module_info['short_name'].lower() + '");\n'
+			decl += '\t' + the_mod + '.doc() = ' + 'R"pbdoc(AFF3CT ' + kind + ' inheritating from ' + module_info['short_name'] + '.)pbdoc";\n'
+			decl += '\t' + 'doc_' + mod + ' += R"pbdoc(           ' + module_info['short_name'].lower() + '\n' + ')pbdoc";\n'
+			groups.setdefault(the_mod, [decl, ""])
+		groups.setdefault(the_mod, ["", ""])
+
+		if is_LDPC_BP_HL(module_info):
+			groups[the_mod][1] += gen_wrapper_cpp_lines_LDPC_BP_HL(module_info, the_mod)
+		else:
+			groups[the_mod][1] += gen_wrapper_cpp_line(module_info, the_mod)
+
+	walk_py_aff3ct_groups(modules, tree, mod, root_mod, visit)
+	return groups
+
+def gen_py_aff3ct_cpp(groups, deps = []):
+	# The submodules are declared at import time but their classes are registered on the first access (see
+	# 'Lazy_submodule'), after the ones of the 'deps' submodules.
+	cpp_content = ""
+	for _, (decl, _) in groups.items():
+		cpp_content += decl
+	if cpp_content:
+		cpp_content += '\n'
+
+	for the_mod, (_, lines) in groups.items():
+		cpp_content += '\twrapper::Lazy_submodule::define(' + the_mod + ', {' + ', '.join(deps) + '}, [](py::module_ ' + the_mod + ')\n'
+		cpp_content += '\t{\n'
+		cpp_content += '\t\tstd::vector<wrapper::Wrapper_py*> wrappers;\n'
+		cpp_content += ''.join(['\t' + l + '\n' if l else '\n' for l in lines.rstrip('\n').split('\n')])
+		cpp_content += '\n'
+		cpp_content += '\t\tfor (size_t i = 0; i < wrappers.size(); i++)\n'
+		cpp_content += '\t\t\twrappers[i]->definitions();\n'
+		cpp_content += '\t});\n\n'
 
 	return cpp_content
 
 def write_py_aff3ct_cpp(tools, tools_tree, modules, module_tree, command_path, template_path, verbose = False):
-	other_tool_wrappers   = gen_py_aff3ct_cpp(tools, tools_tree, 'm0', 'm0', '')
-	other_module_wrappers = gen_py_aff3ct_cpp(modules, module_tree, 'm1', 'm1', '')
+	tools_groups  = gen_py_aff3ct_groups(tools,   tools_tree,  'm0', 'm0', {})
+	module_groups = gen_py_aff3ct_groups(modules, module_tree, 'm1', 'm1', {})
+	# the constructors of the modules can take (and have default values of) the types of the tools
+	other_tool_wrappers   = gen_py_aff3ct_cpp(tools_groups)
+	other_module_wrappers = gen_py_aff3ct_cpp(module_groups, list(tools_groups.keys()))
 	py_aff3ct_cpp = ""
 	with open(template_path + "/py_aff3ct_template.cpp","r") as f:
 		py_aff3ct_cpp = f.read()
 		py_aff3ct_cpp = py_aff3ct_cpp.replace("{other_tool_wrappers}", other_tool_wrappers[0:-2])
 		py_aff3ct_cpp = py_aff3ct_cpp.replace("{other_module_wrappers}", other_module_wrappers[0:-2])
+		py_aff3ct_cpp = py_aff3ct_cpp.replace("{tool_submodules}", ", ".join(tools_groups.keys()))
 
 	file_path = command_path + "/src/py_aff3ct.cpp"
 	write_if_different(file_path, py_aff3ct_cpp, verbose)
@@ -291,6 +429,59 @@ def gen_py_aff3ct_hpp(modules):
 			hpp_content += gen_include_line_hpp(module)
 	return hpp_content
 
+def get_cpp_wrapper_files(module):
+	if is_LDPC_BP_HL(module):
+		types = [ "MS", "OMS", "NMS", "SPA", "LSPA"]
+		return [module['include_path'] + "/" + module['short_name'] + "_" + t + ".cpp" for t in types]
+	return [module['include_path'] + "/" + module['short_name'] + ".cpp"]
+
+def gen_unity_groups(modules, tree, root_mod, groups = None):
+	# gathers the generated cpp files (relative to the 'src' folder) by Python submodule (see 'walk_py_aff3ct_groups'):
+	# the tools in 'm0' are in the "tools" group and the ones of a submodule 'mod_x' in "tools_x" ("module_x" for the
+	# modules of 'm1')
+	if groups is None:
+		groups = {}
+	root_name = "tools" if root_mod == 'm0' else "module"
+	seen = set()
+	def visit(module_info, the_mod, mod):
+		if module_info['name'] in seen:
+			return
+		seen.add(module_info['name'])
+		group = root_name if the_mod == root_mod else root_name + "_" + the_mod[len('mod_'):]
+		groups.setdefault(group, []).extend(get_cpp_wrapper_files(module_info))
+
+	walk_py_aff3ct_groups(modules, tree, root_mod, root_mod, visit)
+	return groups
+
+def write_unity_build(groups, command_path, template_path, batch_size = 16, verbose = False):
+	# The generated wrappers of a submodule are compiled in batches of 'batch_size' files (CMake unity build, one
+	# translation unit per batch) and all the files share a precompiled header with the pybind11 and AFF3CT includes.
+	src = "${CMAKE_CURRENT_SOURCE_DIR}/src/"
+	cmake = "# File generated by 'configure.py --unity', do not edit.\n"
+	cmake += "set_target_properties(py_aff3ct-module-lib PROPERTIES UNITY_BUILD ON UNITY_BUILD_MODE GROUP)\n"
+	cmake += "target_precompile_headers(py_aff3ct-module-lib PRIVATE " + src + "py_aff3ct_pch.hpp)\n"
+	for group, files in groups.items():
+		n_batches = (len(files) + batch_size - 1) // batch_size if batch_size > 0 else 1
+		for b in range(n_batches):
+			batch = files[b * batch_size : (b + 1) * batch_size] if batch_size > 0 else files
+			name  = group if n_batches == 1 else group + "_" + str(b)
+			cmake += "set_source_files_properties(\n"
+			for f in batch:
+				cmake += "\t" + src + f + "\n"
+			cmake += '\tPROPERTIES UNITY_GROUP "' + name + '")\n'
+
+	write_if_different(command_path + "/src/py_aff3ct_unity.cmake", cmake, verbose)
+	with open(template_path + "/py_aff3ct_pch_template.hpp","r") as f:
+		write_if_different(command_path + "/src/py_aff3ct_pch.hpp", f.read(), verbose)
+
+def clean_unity_build(command_path, verbose = False):
+	for file_name in ["py_aff3ct_unity.cmake", "py_aff3ct_pch.hpp"]:
+		file_path = command_path + "/src/" + file_name
+		if Path(file_path).is_file():
+			if verbose:
+				print("Removing file : " + file_path)
+			os.remove(file_path)
+
 def write_if_different(file_path, new_content, verbose):
 	old_content = ""
 	if Path(file_path).is_file():
@@ -346,6 +537,109 @@ def doxyname_to_stdname(doxyname):
 	stdname = re.sub(".xml",    "",   stdname)
 	return stdname
 
+DOXYGEN_CACHE_VERSION = 1
+DOXYGEN_REF_PATTERN   = re.compile("<ref[^>]*>")
+DOXYGEN_FILE_PATTERN  = re.compile("^class|^struct")
+DOXYGEN_NAME_PATTERN  = re.compile("^aff3ct::module::|^aff3ct::tools::")
+
+def strip_doxygen_refs(data):
+	# removes the "<ref ...>" and "</ref>" tags but keeps their text, in a single pass
+	return DOXYGEN_REF_PATTERN.sub("", data).replace("</ref>", "")
+
+def parse_doxygen_file(file_path, real_name):
+	with open(file_path, "rb") as f:
+		raw = f.read()
+	dict = xmltodict.parse(strip_doxygen_refs(raw.decode("utf-8")))
+	if ("doxygen" not in dict or "compounddef" not in dict["doxygen"]
+	or  "compoundname" not in dict["doxygen"]["compounddef"]
+	or  dict["doxygen"]["compounddef"]["compoundname"] != real_name):
+		raise RuntimeError("The compound name of '" + file_path + "' is not '" + real_name + "'.")
+	return dict["doxygen"], hashlib.sha1(raw).hexdigest()
+
+def parse_doxygen_job(args):
+	return parse_doxygen_file(*args)
+
+def load_doxygen(xml_path, cache_path = "", verbose = False, n_jobs = 1):
+	# The parsed files are saved in 'cache_path' with their mtime, size and hash: a file is parsed again only if its
+	# content has changed.
+	cache = {}
+	if cache_path and os.path.isfile(cache_path):
+		try:
+			with open(cache_path, "rb") as f:
+				content = pickle.load(f)
+			if content["version"] == DOXYGEN_CACHE_VERSION:
+				cache = content["files"]
+		except Exception:
+			cache = {}
+
+	files   = {}
+	changed = False
+	stale   = [] # the files to parse
+	for f in os.listdir(xml_path):
+		file_path = os.path.join(xml_path, f)
+		if not DOXYGEN_FILE_PATTERN.match(f) or not os.path.isfile(file_path):
+			continue
+		real_name = doxyname_to_stdname(f)
+		if not DOXYGEN_NAME_PATTERN.match(real_name):
+			continue
+
+		st = os.stat(file_path)
+		entry = cache.get(f)
+		if entry is None or entry["mtime"] != st.st_mtime_ns or entry["size"] != st.st_size:
+			with open(file_path, "rb") as fid:
+				digest = hashlib.sha1(fid.read()).hexdigest()
+			if entry is None or entry["hash"] != digest:
+				stale.append((f, file_path, real_name))
+				entry = {"data": None}
+			entry = {"data": entry["data"], "hash": digest, "mtime": st.st_mtime_ns, "size": st.st_size}
+			changed = True
+		files[f] = dict(entry, name = real_name)
+
+	# the XML parsing is the costly part, the stale files are parsed in parallel
+	parsed = pool_map(parse_doxygen_job, [(file_path, real_name) for _, file_path, real_name in stale], n_jobs)
+	for (f, _, _), (data, digest) in zip(stale, parsed):
+		files[f]["data"] = data
+		files[f]["hash"] = digest
+	n_parsed = len(stale)
+
+	doxygen = {}
+	for f, entry in files.items():
+		doxygen[entry.pop("name")] = entry["data"]
+
+	if verbose:
+		print("Doxygen: " + str(n_parsed) + " parsed file(s), " + str(len(files) - n_parsed) + " from the cache.")
+
+	if cache_path and (changed or files.keys() != cache.keys()):
+		# a unique temporary file: two concurrent builds sharing the cache do not write into the same file
+		with tempfile.NamedTemporaryFile(dir=os.path.dirname(cache_path) or ".", delete=False) as f:
+			try:
+				pickle.dump({"version": DOXYGEN_CACHE_VERSION, "files": files}, f, pickle.HIGHEST_PROTOCOL)
+			except BaseException:
+				f.close()
+				os.remove(f.name)
+				raise
+		os.replace(f.name, cache_path)
+
+	return doxygen
+
+def add_derived_compounds(doxygen):
+	# rebuilds the `derivedcompoundref` field from the `basecompoundref` fields, with an index of the derived classes
+	def strip(name):
+		return name.replace('aff3ct::module::', '').replace('aff3ct::tools::', '')
+
+	derived = {}
+	for key, value in doxygen.items():
+		refs_list = value["compounddef"].get("basecompoundref", [])
+		if type(refs_list) is not list:
+			refs_list = [refs_list]
+		for ref in refs_list:
+			derived.setdefault(strip(ref["#text"].split("<")[0]), []).append(key)
+
+	for key, value in doxygen.items():
+		children = [{"#text": key2} for key2 in derived.get(strip(key), []) if key2 != key]
+		if children or "derivedcompoundref" in value["compounddef"].keys():
+			value["compounddef"]["derivedcompoundref"] = children
+
 def recursive_build_classes_list(data, include_list, exclude_list, prefix, tree = {}):
 	classes_list = []
 	for i in include_list:
@@ -432,6 +726,7 @@ def gen_template(entry):
 	medium  = ""
 	short   = ""
 	default = ""
+	params  = [] # the (name, default value) of the template parameters
 
 	if has_template(entry):
 
@@ -474,10 +769,17 @@ def gen_template(entry):
 				full += tp["type"] + " = " + tp["defval"] + ","
 		full = full[:-1] + ">"
 
+		for tp in templates_list:
+			if "defname" in tp.keys():
+				params.append((tp["defname"], tp["defval"]))
+			else:
+				params.append((tp["type"].split(" ")[1], tp["defval"]))
+
 	return {"full":    full,
 	        "medium":  medium,
 	        "short":   short,
-	        "default": default}
+	        "default": default,
+	        "params":  params}
 
 def get_parent(entry, dictio, classes_list):
 	if "basecompoundref" in entry["compounddef"].keys():
@@ -506,7 +808,7 @@ def get_parent(entry, dictio, classes_list):
 			return ""
 	return ""
 
-def get_dtor_trick(entry):
+def get_dtor_trick(entry, messages = None):
 	dtor_trick = ""
 
 	sectiondef_list = entry["compounddef"]["sectiondef"]
@@ -522,11 +824,11 @@ def get_dtor_trick(entry):
 			for mb in memberdef_list:
 				if mb["name"] == dtor_name:
 					message = bcolors.OKBLUE + "(II) Protected destructor for class " + get_name(entry) + '.'+ bcolors.ENDC
-					print(message)
+					log_message(message, messages)
 					dtor_trick = ", std::unique_ptr<" + get_name(entry) + gen_template(entry)['short'] + ", py::nodelete>"
 	return dtor_trick
 
-def gen_constructors(entry, existing_tools):
+def gen_constructors(entry, existing_tools, messages = None):
 	sectiondef_list = entry["compounddef"]["sectiondef"]
 	if type(sectiondef_list) is not list:
 		sectiondef_list = [sectiondef_list]
@@ -568,7 +870,7 @@ def gen_constructors(entry, existing_tools):
 										break
 								if not tools_available:
 									message = bcolors.WARNING + "(WW) Constructor not wrapped for class '" + get_name(entry) + "' -> argument '" + name_val + "' has unknown type '" + type_val + "'." + bcolors.ENDC
-									print(message)
+									log_message(message, messages)
 									continue
 							# end of the trick
 						default_val = ""
@@ -634,8 +936,8 @@ def gen_definitions(entry, dictio):
 							print (message)
 	return defs
 
-def gen_tasks_doc(entry):
-	tasks_doc = ""
+def get_task_methods(entry):
+	methods = []
 	is_module = False
 	if "basecompoundref" in entry["compounddef"]:
 		refs_list = entry["compounddef"]["basecompoundref"]
@@ -659,24 +961,38 @@ def gen_tasks_doc(entry):
 						if mb["briefdescription"]:
 							brief = mb["briefdescription"]["para"]
 							if 'Task method' in brief:
-								if tasks_doc:
-									tasks_doc += '\n\n'
-								tasks_doc += "* **" + mb['name'] + "**: " +brief
-								if mb["detaileddescription"]:
-									para = mb["detaileddescription"]["para"]
-									if type(para) is not list:
-										para = [para]
-									for p in para:
-										if type(p) is str:
-											tasks_doc += ' ' + p + '\n\n'
-										else:
-											if tasks_doc[-1] != '\n':
-												tasks_doc += '\n\n'
-											desc = p["parameterlist"]["parameteritem"]
-											if type(desc) is not list:
-												desc = [desc]
-											for item in desc:
-												tasks_doc += "  * " + item['parameternamelist']['parametername'] + ': ' + item['parameterdescription']['para'] + '\n'
+								methods.append(mb)
+	return methods
+
+def gen_tasks(entry):
+	tasks = []
+	for mb in get_task_methods(entry):
+		if mb['name'] not in tasks:
+			tasks.append(mb['name'])
+	return tasks
+
+def gen_tasks_doc(entry):
+	tasks_doc = ""
+	for mb in get_task_methods(entry):
+		brief = mb["briefdescription"]["para"]
+		if tasks_doc:
+			tasks_doc += '\n\n'
+		tasks_doc += "* **" + mb['name'] + "**: " +brief
+		if mb["detaileddescription"]:
+			para = mb["detaileddescription"]["para"]
+			if type(para) is not list:
+				para = [para]
+			for p in para:
+				if type(p) is str:
+					tasks_doc += ' ' + p + '\n\n'
+				else:
+					if tasks_doc[-1] != '\n':
+						tasks_doc += '\n\n'
+					desc = p["parameterlist"]["parameteritem"]
+					if type(desc) is not list:
+						desc = [desc]
+					for item in desc:
+						tasks_doc += "  * " + item['parameternamelist']['parametername'] + ': ' + item['parameterdescription']['para'] + '\n'
 	return tasks_doc
 def gen_class_doc(entry):
 	class_doc = ""
@@ -700,22 +1016,97 @@ def gen_class_doc(entry):
 							class_doc += "  * " + item['parameternamelist']['parametername'] + ': ' + item['parameterdescription']['para'] + '\n'
 	return class_doc
 
-def build_modules(data, install_path, path, classes_list, existing_tools = {}):
-	dictio = {}
-	for class_name in classes_list:
-		dictio[class_name] = {"name":         get_name        (data[class_name]),
-		                      "short_name":   get_short_name  (data[class_name]),
-		                      "is_abstract":  is_abstract     (data[class_name]),
-		                      "has_template": has_template    (data[class_name]),
-		                      "template":     gen_template    (data[class_name]),
-		                      "dtor_trick":   get_dtor_trick  (data[class_name]),
-		                      "leaf":         is_leaf         (data[class_name]),
-		                      "parent":       get_parent      (data[class_name], data, classes_list),
-		                      "definitions":  gen_definitions (data[class_name], data),
-		                      "include_path": get_include_path(data[class_name], path),
-		                      "constructors": gen_constructors(data[class_name], existing_tools),
-		                      "mk_dir_path":  get_include_path(data[class_name], install_path + "/" + path),
-		                      "tasks_doc":    gen_tasks_doc   (data[class_name]),
-							  "class_doc":    gen_class_doc   (data[class_name])
-							  }
-	return dictio
+def build_module(data, install_path, path, classes_list, existing_tools, class_name, messages = None):
+	return {"name":         get_name        (data[class_name]),
+	        "short_name":   get_short_name  (data[class_name]),
+	        "is_abstract":  is_abstract     (data[class_name]),
+	        "has_template": has_template    (data[class_name]),
+	        "template":     gen_template    (data[class_name]),
+	        "dtor_trick":   get_dtor_trick  (data[class_name], messages),
+	        "leaf":         is_leaf         (data[class_name]),
+	        "parent":       get_parent      (data[class_name], data, classes_list),
+	        "definitions":  gen_definitions (data[class_name], data),
+	        "include_path": get_include_path(data[class_name], path),
+	        "constructors": gen_constructors(data[class_name], existing_tools, messages),
+	        "mk_dir_path":  get_include_path(data[class_name], install_path + "/" + path),
+	        "tasks":        gen_tasks       (data[class_name]),
+	        "tasks_doc":    gen_tasks_doc   (data[class_name]),
+	        "class_doc":    gen_class_doc   (data[class_name])
+	        }
+
+def build_module_job(class_name):
+	messages = []
+	return build_module(*get_pool_data(), class_name, messages), messages
+
+def build_modules(data, install_path, path, classes_list, existing_tools = {}, n_jobs = 1):
+	shared  = (data, install_path, path, classes_list, existing_tools)
+	results = pool_map(build_module_job, classes_list, n_jobs, shared)
+	# the messages of the workers are printed in the order of the classes, as in a serial run
+	for _, messages in results:
+		for message in messages:
+			print(message)
+	return dict(zip(classes_list, [module for module, _ in results]))
+
+def parse_template_instances(specs):
+	# "SUFFIX:GLOB[,GLOB...]:NAME=TYPE[,NAME=TYPE...]" -> [{"suffix": ..., "globs": [...], "types": {NAME: TYPE}}]
+	instances = []
+	for spec in specs:
+		message = "Invalid template instance '" + spec + "', expected 'SUFFIX:GLOB[,GLOB...]:NAME=TYPE[,NAME=TYPE...]'."
+		fields = spec.split(":", 2)
+		if len(fields) != 3 or not re.match(r"^\w+$", fields[0]):
+			raise RuntimeError(message)
+		globs = [g.strip() for g in fields[1].split(",")]
+		if not all(globs):
+			raise RuntimeError(message)
+		types = {}
+		for assignment in fields[2].split(","):
+			name, _, type_ = assignment.partition("=")
+			if not re.match(r"^\w+$", name.strip()) or not type_.strip():
+				raise RuntimeError(message)
+			types[name.strip()] = type_.strip()
+		instances.append({"suffix": fields[0], "globs": globs, "types": types})
+	return instances
+
+def gen_template_instance(params, types):
+	# the default values can refer to the previous parameters (e.g. "typename Q = R")
+	values = {}
+	for name, defval in params:
+		if name in types:
+			values[name] = types[name]
+		elif values:
+			pattern = r"\b(" + "|".join([re.escape(n) for n in values.keys()]) + r")\b"
+			values[name] = re.sub(pattern, lambda m: values[m.group(1)], defval)
+		else:
+			values[name] = defval
+	return "<" + ",".join([values[name] for name, _ in params]) + ">"
+
+def add_template_instances(modules, instances):
+	# Adds the instances of the templated classes matching the globs. The parents are instantiated too: the Python class
+	# of a parent has to be registered before the ones of its children.
+	for inst in instances:
+		selected = []
+		for key, module in modules.items():
+			if any([fnmatch.fnmatchcase(module['short_name'], g) for g in inst['globs']]):
+				while key in modules and key not in selected:
+					selected.append(key)
+					key = modules[key]['parent'].split("<")[0]
+
+		for key in selected:
+			module = modules[key]
+			if is_LDPC_BP_HL(module):
+				params = [("B", "int"), ("R", "float")] # the template parameters of the 'special' wrappers
+			else:
+				params = module['template']['params']
+			# an instance with the default types would register the same C++ type twice
+			template = gen_template_instance(params, inst['types'])
+			defaults = [gen_template_instance(params, {}), module['template']['default']]
+			if template.replace(" ", "") in [d.replace(" ", "") for d in defaults]:
+				continue
+			module_instances = module.setdefault('instances', [])
+			same = [i for i in module_instances if i['template'] == template or i['suffix'] == inst['suffix']]
+			if not same:
+				module_instances.append({"suffix": inst['suffix'], "template": template})
+			elif same[0]['template'] != template:
+				message = "The template instances '" + same[0]['template'] + "' and '" + template + "' of the class '"
+				message += module['short_name'] + "' have the same suffix '" + inst['suffix'] + "'."
+				raise RuntimeError(message)
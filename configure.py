@@ -5,10 +5,8 @@ import json
 from pathlib import Path
 import aff3ct_tools
 from subprocess import call
-import re
 from os import listdir
 from os.path import isfile, isdir, join
-import xmltodict
 
 command_path, _ = os.path.split(sys.argv[0])
 
@@ -20,6 +18,11 @@ parser.add_argument(      "--verbose", help = "Set the configuration verbose."
 parser.add_argument(        "--clean", help = "Clean before doing configuration."       , action="store_true")
 parser.add_argument("--doxy-xml-path", help = "Path of the Doxygen XML files."          , default= command_path + "/lib/aff3ct/doc/build/doxygen/xml/")
 parser.add_argument("--template-path", help = "Path of the py_aff3ct *template* folder.", default= command_path + "/template")
+parser.add_argument(  "--doxy-cache", help = "Cache file of the parsed Doxygen XML files (empty to disable).", default= command_path + "/.doxygen_cache.pkl")
+parser.add_argument("--template-instance", nargs="+", help = "Additional instances of the templated tools/modules, with a type-suffixed Python name, as 'SUFFIX:GLOB[,GLOB...]:NAME=TYPE[,NAME=TYPE...]' (the types of the template parameters NAME, the parents are instantiated too, the types have to be instantiated in AFF3CT). Example : --template-instance 'int8:Decoder_polar_SC*:B=int8_t,R=int8_t' 'int16:Modem_BPSK*:Q=int16_t'", default=[])
+parser.add_argument(        "--unity", help = "Generate the unity build layout of the wrappers (grouped by submodule) with a precompiled header (CMake >= 3.16).", action="store_true")
+parser.add_argument(  "--unity-batch", help = "Maximum number of wrappers compiled in the same unity translation unit (0 = no limit).", default=16, type=int)
+parser.add_argument(         "--jobs", help = "Number of processes to parse the XML files and to generate the wrappers (0 = one per CPU).", default=0, type=int)
 
 parser.add_argument( "--include-module", nargs="+", help = "List of aff3ct Modules to be wrapped. Example : --include-module Source Modem", default=['CRC', 'Channel', 'Modem', 'Source', 'Encoder', 'Decoder', 'Iterator', 'Sink'])
 parser.add_argument( "--exclude-module", nargs="+", help = "List of aff3ct Modules to be excluded from the wrapper. (prioritary over --include-module). Example : --exclude-module Source Modem", default=['Modem_CPM', 'Modem_OOK', 'Encoder_RSC_generic_json_sys', 'Decoder_LDPC_bit_flipping', 'Decoder_chase_pyndiah', 'Decoder_turbo_product', 'Decoder_RSC_BCJR_seq_generic_std_json', 'Reporter', 'Decoder_LDPC_BP_flooding_inter', 'Decoder_LDPC_BP_flooding_SPA', 'Decoder_LDPC_bit_flipping_hard', 'Decoder_polar_MK_SC_naive', 'Encoder_polar_MK', 'Decoder_polar_MK_SCL_naive', 'Decoder_polar_MK_SCL_naive_CA', 'Decoder_polar_MK_ASCL_naive_CA', 'Decoder_polar_MK_SCL_naive_CA_sys', 'Decoder_polar_MK_ASCL_naive_CA_sys', 'Decoder_polar_MK_SCL_naive_sys'])
@@ -28,10 +31,20 @@ parser.add_argument( "--exclude-tool",   nargs="+", help = "List of aff3ct Tools
 
 args = parser.parse_args()
 
+try:
+	template_instances = aff3ct_tools.parse_template_instances(args.template_instance)
+except RuntimeError as e:
+	print(str(e))
+	exit(-1)
+
+timer = aff3ct_tools.Phase_timer()
+
 if args.clean:
 	if args.verbose:
 		print("Clean: delete the current src folder.")
 	call('rm -rf "' + command_path + '/src"', shell=True)
+	if args.doxy_cache and isfile(args.doxy_cache):
+		os.remove(args.doxy_cache)
 
 cp_path = args.template_path + "/src"
 aff3ct_tools.src_repair(cp_path, command_path + "/src", args.verbose)
@@ -52,60 +65,31 @@ doxyFiles = [f for f in listdir(args.doxy_xml_path) if isfile(join(args.doxy_xml
 if len(doxyFiles) == 0:
 	print("The '" + args.doxy_xml_path + "' dir. is empty, no documentation files have been generated.")
 	exit(-1)
-doxygen = {}
-for f in doxyFiles:
-	pattern = re.compile("^class|^struct")
-	if pattern.match(f):
-		realName = aff3ct_tools.doxyname_to_stdname(f)
-		pattern = re.compile("^aff3ct::module::|^aff3ct::tools::")
-		if pattern.match(realName):
-			data = open(join(args.doxy_xml_path, f), 'r').read()
-			start_ref = data.find('<ref')
-			while start_ref > -1:
-				end_ref = data.find('>', start_ref)
-				data = data[:start_ref] + data[end_ref+1:]
-				start_ref = data.find('<ref')
-
-			data = data.replace("</ref>", "")
-			dict = xmltodict.parse(data)
-			doxygen[realName] = dict["doxygen"]
-			error = True
-			if "doxygen" in dict:
-				if "compounddef" in dict["doxygen"]:
-					if "compoundname" in dict["doxygen"]["compounddef"]:
-						if dict["doxygen"]["compounddef"]["compoundname"] == realName:
-							error = False
-			if error:
-				print("There is a problem :-(")
-				exit(-1)
+try:
+	with timer.phase("Doxygen loading"):
+		doxygen = aff3ct_tools.load_doxygen(args.doxy_xml_path, args.doxy_cache, args.verbose, args.jobs)
+except RuntimeError as e:
+	print("There is a problem :-( " + str(e))
+	exit(-1)
 
 # add the missing `derivedcompoundref` field to the Doxygen JSON
-for key, value in doxygen.items():
-	if "derivedcompoundref" in value["compounddef"].keys():
-		value["compounddef"]["derivedcompoundref"] = []
-
-	for key2, value2 in doxygen.items():
-		if key != key2 and "basecompoundref" in value2["compounddef"].keys():
-			refs_list = value2["compounddef"]["basecompoundref"]
-			if type(refs_list) is not list:
-				refs_list = [refs_list]
-			for ref in refs_list:
-				if ref["#text"].split("<")[0].replace('aff3ct::module::', '').replace('aff3ct::tools::', '') == key.replace('aff3ct::module::', '').replace('aff3ct::tools::', ''):
-					elmt = {"#text": key2}
-					if "derivedcompoundref" not in value["compounddef"].keys():
-						value["compounddef"]["derivedcompoundref"] = [elmt]
-					else:
-						value["compounddef"]["derivedcompoundref"].append(elmt)
+with timer.phase("Class hierarchy"):
+	aff3ct_tools.add_derived_compounds(doxygen)
+
+templates = aff3ct_tools.load_templates(args.template_path)
 
 #with open('doxygen.json', 'w') as fid:
 #	json.dump(doxygen, fid)
 tools_tree = {}
-tools_classes_list = aff3ct_tools.recursive_build_classes_list(doxygen, args.include_tool, args.exclude_tool, "aff3ct::tools::", tools_tree)
-tools = aff3ct_tools.build_modules(doxygen, command_path + "/src", "Wrapper_py", tools_classes_list)
+with timer.phase("Tools analysis"):
+	tools_classes_list = aff3ct_tools.recursive_build_classes_list(doxygen, args.include_tool, args.exclude_tool, "aff3ct::tools::", tools_tree)
+	tools = aff3ct_tools.build_modules(doxygen, command_path + "/src", "Wrapper_py", tools_classes_list, n_jobs=args.jobs)
+	aff3ct_tools.add_template_instances(tools, template_instances)
 
-aff3ct_tools.make_dir_tree     (tools,                     args.verbose)
-aff3ct_tools.write_hpp_wrappers(tools, args.template_path              )
-aff3ct_tools.write_cpp_wrappers(tools, args.template_path              )
+with timer.phase("Tools generation"):
+	aff3ct_tools.make_dir_tree     (tools,                     args.verbose)
+	aff3ct_tools.write_hpp_wrappers(tools, args.template_path, n_jobs=args.jobs, templates=templates)
+	aff3ct_tools.write_cpp_wrappers(tools, args.template_path, n_jobs=args.jobs, templates=templates)
 
 existing_tools = tools.copy()
 existing_tools["aff3ct::tools::Gaussian_noise_generator_implem"] = {}
@@ -115,17 +99,31 @@ existing_tools["aff3ct::tools::Pipeline"] = {}
 existing_tools["aff3ct::tools::Sparse_matrix"] = {}
 
 module_tree = {}
-module_classes_list = aff3ct_tools.recursive_build_classes_list(doxygen, args.include_module, args.exclude_module, "aff3ct::module::", module_tree)
+with timer.phase("Modules analysis"):
+	module_classes_list = aff3ct_tools.recursive_build_classes_list(doxygen, args.include_module, args.exclude_module, "aff3ct::module::", module_tree)
+	module = aff3ct_tools.build_modules(doxygen, command_path + "/src", "Wrapper_py", module_classes_list, existing_tools, args.jobs)
+	aff3ct_tools.add_template_instances(module, template_instances)
 
-module = aff3ct_tools.build_modules(doxygen, command_path + "/src", "Wrapper_py", module_classes_list, existing_tools)
-
-aff3ct_tools.make_dir_tree     (module,                     args.verbose)
-aff3ct_tools.write_hpp_wrappers(module, args.template_path, args.verbose)
-aff3ct_tools.write_cpp_wrappers(module, args.template_path, args.verbose)
+with timer.phase("Modules generation"):
+	aff3ct_tools.make_dir_tree     (module,                     args.verbose)
+	aff3ct_tools.write_hpp_wrappers(module, args.template_path, args.verbose, args.jobs, templates)
+	aff3ct_tools.write_cpp_wrappers(module, args.template_path, args.verbose, args.jobs, templates)
 
 full_dict = {}
 full_dict.update(tools)
 full_dict.update(module)
 
-aff3ct_tools.write_py_aff3ct_hpp(full_dict, command_path, args.template_path, args.verbose)
-aff3ct_tools.write_py_aff3ct_cpp(tools, tools_tree, module, module_tree, command_path, args.template_path, args.verbose)
+with timer.phase("Library generation"):
+	aff3ct_tools.write_py_aff3ct_hpp(full_dict, command_path, args.template_path, args.verbose)
+	aff3ct_tools.write_py_aff3ct_cpp(tools, tools_tree, module, module_tree, command_path, args.template_path, args.verbose)
+
+with timer.phase("Unity build layout"):
+	if args.unity:
+		unity_groups = aff3ct_tools.gen_unity_groups(tools, tools_tree, 'm0')
+		aff3ct_tools.gen_unity_groups(module, module_tree, 'm1', unity_groups)
+		aff3ct_tools.write_unity_build(unity_groups, command_path, args.template_path, args.unity_batch, args.verbose)
+	else:
+		aff3ct_tools.clean_unity_build(command_path, args.verbose)
+
+if args.verbose:
+	timer.report()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+# Measures the import time of py_aff3ct: each measure runs in a new interpreter (the registration of the classes is
+# done once per process).
+#
+# usage: python3 bench_import.py [n_runs] [lib_path]
+
+import sys
+import subprocess
+import statistics
+
+n_runs   = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+lib_path = sys.argv[2] if len(sys.argv) > 2 else '../../build/lib'
+
+scenarios = [
+	("import py_aff3ct",
+	 "pass"),
+	("source + modem",
+	 "aff3ct.module.source.Source_random; aff3ct.module.modem.Modem_BPSK"),
+	("all the submodules",
+	 "aff3ct.load_submodules()"),
+]
+
+code = """
+import sys, time
+sys.path.insert(0, {path!r})
+t0 = time.perf_counter()
+import py_aff3ct as aff3ct
+{stmt}
+print(time.perf_counter() - t0)
+"""
+
+print("# runs: " + str(n_runs))
+print("# {:<20} | {:>12} | {:>12} | {:>12}".format("Scenario", "Median (ms)", "Min (ms)", "Max (ms)"))
+for name, stmt in scenarios:
+	times = []
+	for r in range(n_runs):
+		out = subprocess.check_output([sys.executable, "-c", code.format(path=lib_path, stmt=stmt)])
+		times.append(float(out.decode().strip().split("\n")[-1]) * 1e3)
+	print("  {:<20} | {:>12.1f} | {:>12.1f} | {:>12.1f}".format(name, statistics.median(times), min(times), max(times)))
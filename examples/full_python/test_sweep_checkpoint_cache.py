@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+# Checks the result cache and the checkpointing of Sweep_BFER used together: a point interrupted and resumed from its
+# checkpoint must not replay the frames already counted and has to be merged into the cache entry of the point.
+
+import os
+import sys
+sys.path.insert(0, os.environ.get("PY_AFF3CT_PATH",
+                                  os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "build", "lib")))
+
+import shutil
+import tempfile
+import numpy as np
+import py_aff3ct as aff3ct
+from py_aff3ct.module.py_module import Py_Module
+
+K = 32
+N = 64
+
+frames = [] # the source frames of the current run
+
+class Recorder(Py_Module):
+	def record(self, U):
+		frames.append(U.tobytes())
+		if self.stop_at and len(frames) == self.stop_at:
+			self.sweep.save_checkpoint()
+			raise KeyboardInterrupt("interrupted")
+		return 0
+
+	def __init__(self, K):
+		Py_Module.__init__(self)
+		self.name    = "recorder"
+		self.stop_at = 0
+		self.sweep   = None
+		t_rec = self.create_task("record")
+		self.create_socket_in(t_rec, "U", K, np.int32)
+		self.create_codelet(t_rec, lambda m,l,f: m.record(l[0]))
+
+src = aff3ct.module.source.Source_random(K, 12)
+enc = aff3ct.module.encoder.Encoder_repetition_sys(K,N)
+mdm = aff3ct.module.modem.Modem_BPSK_fast(N)
+gen = aff3ct.tools.Gaussian_noise_generator_implem.FAST
+chn = aff3ct.module.channel.Channel_AWGN_LLR(N, gen)
+dec = aff3ct.module.decoder.Decoder_repetition_fast(K, N)
+mnt = aff3ct.module.monitor.Monitor_BFER_AR(K, 0)
+rec = Recorder(K)
+
+sigma = np.ndarray(shape = (1,1),  dtype = np.float32)
+rec["record       ::U   "].bind(src["generate   ::U_K "])
+enc["encode       ::U_K "].bind(src["generate   ::U_K "])
+mdm["modulate     ::X_N1"].bind(enc["encode     ::X_N "])
+chn["add_noise    ::X_N "].bind(mdm["modulate   ::X_N2"])
+mdm["demodulate   ::Y_N1"].bind(chn["add_noise  ::Y_N "])
+dec["decode_siho  ::Y_N "].bind(mdm["demodulate ::Y_N2"])
+mnt["check_errors ::U   "].bind(src["generate   ::U_K "])
+mnt["check_errors ::V   "].bind(dec["decode_siho::V_K "])
+chn["add_noise    ::CP  "].bind(                 sigma  )
+mdm["demodulate   ::CP  "].bind(                 sigma  )
+
+seq = aff3ct.tools.sequence.Sequence(src("generate"), 1)
+
+tmp_dir   = tempfile.mkdtemp()
+cache_dir = os.path.join(tmp_dir, "cache")
+ckpt_file = os.path.join(tmp_dir, "sweep.ckpt")
+
+def new_sweep(max_n_frames):
+	sweep = aff3ct.tools.sweep.Sweep_BFER(seq, mnt, [sigma], max_n_frames = max_n_frames)
+	sweep.set_cache(cache_dir, "rep K=" + str(K) + " N=" + str(N))
+	sweep.set_checkpoint(ckpt_file, 3600., 42)
+	rec.sweep = sweep
+	return sweep
+
+def read_cache_entry():
+	sweep = aff3ct.tools.sweep.Sweep_BFER(seq, mnt, [sigma])
+	sweep.set_cache(cache_dir, "rep K=" + str(K) + " N=" + str(N))
+	entry = sweep.get_cache_entry(0.7)
+	assert entry is not None
+	return entry["n_frames"], entry["n_runs"]
+
+try:
+	# 1) a first complete run on the point fills the cache
+	del frames[:]
+	res = new_sweep(200).run([0.7])
+	assert res["n_frames"][0] == 200, res["n_frames"]
+	run1 = set(frames)
+	assert read_cache_entry() == (200, 1)
+	os.remove(ckpt_file)
+
+	# 2) a longer run is continued from the cache and interrupted after 150 frames
+	del frames[:]
+	rec.stop_at = 150
+	try:
+		new_sweep(600).run([0.7])
+		assert False, "the run should have been interrupted"
+	except KeyboardInterrupt:
+		pass
+	run2 = set(frames)
+	rec.stop_at = 0
+	assert read_cache_entry() == (200, 1) # the interrupted point is not saved in the cache
+
+	# 3) the run is resumed from the checkpoint
+	del frames[:]
+	res = new_sweep(600).run([0.7])
+	run3 = set(frames)
+	assert res["n_frames"][0] == 600, res["n_frames"]
+
+	# the frames counted by the three runs are all different (no replay of the seeds)
+	assert not (run1 & run2), "the continued point replays the frames of the cache entry"
+	assert not (run1 & run3), "the resumed point replays the frames of the cache entry"
+	assert not (run2 & run3), "the resumed point replays the frames of the interrupted run"
+
+	# the counters of the checkpoint are not counted twice and the runs are merged in the cache entry
+	assert read_cache_entry() == (600, 2)
+	print("OK")
+finally:
+	shutil.rmtree(tmp_dir)
@@ -1,4 +1,5 @@
 #include "{path}/{short_name}.hpp"
+#include "Wrapper_py/Module/Task.hpp"
 
 namespace py = pybind11;
 using namespace py::literals;
@@ -9,9 +10,9 @@ using namespace aff3ct::wrapper;
 
 {medium_template}
 Wrapper_{short_name}{short_template}
-::Wrapper_{short_name}(py::handle scope)
+::Wrapper_{short_name}(py::handle scope, const std::string& suffix)
 : Wrapper_py(),
-  py::class_<{name}{short_template}{parent}{dtor_trick}>(scope, "{short_name}")
+  py::class_<{name}{short_template}{parent}{dtor_trick}>(scope, (std::string("{short_name}") + (suffix.empty() ? "" : "_" + suffix)).c_str())
 {
 }
 
@@ -4,6 +4,7 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/iostream.h>
+#include <string>
 
 #include <aff3ct.hpp>
 
@@ -23,7 +24,7 @@ class Wrapper_{short_name} : public Wrapper_py,
                              public py::class_<{name}{short_template}{parent}{dtor_trick}>
 {
 	public:
-	Wrapper_{short_name}(py::handle scope);
+	Wrapper_{short_name}(py::handle scope, const std::string& suffix = "");
 	virtual void definitions();
 	virtual ~Wrapper_{short_name}() = default;
 };
@@ -0,0 +1,14 @@
+#ifndef PY_AFF3CT_PCH_HPP_
+#define PY_AFF3CT_PCH_HPP_
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+#include <pybind11/iostream.h>
+#include <pybind11/numpy.h>
+#include <pybind11/functional.h>
+
+#include <aff3ct.hpp>
+
+#include "Wrapper_py/Wrapper_py.hpp"
+#include "Wrapper_py/Module/Task.hpp"
+
+#endif //PY_AFF3CT_PCH_HPP_
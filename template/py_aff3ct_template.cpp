@@ -36,6 +36,8 @@ R"pbdoc(
 
            sequence
            pipeline
+           tracer
+           sweep
            frozenbits_generator
 )pbdoc";
 
@@ -47,10 +49,21 @@ R"pbdoc(
 	std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_pipeline(new aff3ct::wrapper::Wrapper_Pipeline(m_pipeline));
 	wrappers.push_back(wrapper_pipeline.get());
 
+	py::module_ m_tracer = m0.def_submodule("tracer");
+	std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_tracer(new aff3ct::wrapper::Wrapper_Tracer(m_tracer));
+	wrappers.push_back(wrapper_tracer.get());
+
+	py::module_ m_sweep = m0.def_submodule("sweep");
+	std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_sweep_bfer(new aff3ct::wrapper::Wrapper_Sweep_BFER(m_sweep));
+	wrappers.push_back(wrapper_sweep_bfer.get());
+
 	py::module_ mod_frozenbits_generator = m0.def_submodule("frozenbits_generator");
 	std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_frozenbits_generator(new aff3ct::wrapper::Wrapper_Frozenbits_generator(mod_frozenbits_generator));
 	wrappers.push_back(wrapper_frozenbits_generator.get());
 
+	std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_frozenbits_cache(new aff3ct::wrapper::Wrapper_Frozenbits_cache(mod_frozenbits_generator));
+	wrappers.push_back(wrapper_frozenbits_cache.get());
+
 	std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_frozenbits_generator_bec(new aff3ct::wrapper::Wrapper_Frozenbits_generator_BEC(mod_frozenbits_generator));
 	wrappers.push_back(wrapper_frozenbits_generator_bec.get());
 
@@ -117,27 +130,41 @@ R"pbdoc(
 	wrappers.push_back(wrapper_monitor_mi.get());
 	std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_monitor_bfer_reduction(new aff3ct::wrapper::Wrapper_Monitor_reduction_BFER(mod_monitor));
 	wrappers.push_back(wrapper_monitor_bfer_reduction.get());
+	std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_progress_bfer(new aff3ct::wrapper::Wrapper_Progress_BFER(mod_monitor));
+	wrappers.push_back(wrapper_progress_bfer.get());
 
 	py::module_ mod_switcher = m1.def_submodule("switcher");
 	std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_switcher(new aff3ct::wrapper::Wrapper_Switcher(mod_switcher));
 	wrappers.push_back(wrapper_switcher.get());
 
+	// the six instances of the interleaver are registered on the first access, after the tools (Interleaver_core)
 	py::module_ mod_ilv = m1.def_submodule("interleaver");
-	std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_interleaver_int8  (new aff3ct::wrapper::Wrapper_Interleaver<int8_t,  uint32_t>(mod_ilv, "int8"));
-	std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_interleaver_int16 (new aff3ct::wrapper::Wrapper_Interleaver<int16_t, uint32_t>(mod_ilv, "int16"));
-	std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_interleaver_int32 (new aff3ct::wrapper::Wrapper_Interleaver<int32_t, uint32_t>(mod_ilv, "int32"));
-	std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_interleaver_int64 (new aff3ct::wrapper::Wrapper_Interleaver<int64_t, uint32_t>(mod_ilv, "int64"));
-	std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_interleaver_float (new aff3ct::wrapper::Wrapper_Interleaver<float,   uint32_t>(mod_ilv, "float"));
-	std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_interleaver_double(new aff3ct::wrapper::Wrapper_Interleaver<double,  uint32_t>(mod_ilv, "double"));
-	wrappers.push_back(wrapper_interleaver_int8  .get());
-	wrappers.push_back(wrapper_interleaver_int16 .get());
-	wrappers.push_back(wrapper_interleaver_int32 .get());
-	wrappers.push_back(wrapper_interleaver_int64 .get());
-	wrappers.push_back(wrapper_interleaver_float .get());
-	wrappers.push_back(wrapper_interleaver_double.get());
+	wrapper::Lazy_submodule::define(mod_ilv, {{tool_submodules}}, [](py::module_ mod_ilv)
+	{
+		std::vector<wrapper::Wrapper_py*> wrappers;
+		std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_interleaver_int8  (new aff3ct::wrapper::Wrapper_Interleaver<int8_t,  uint32_t>(mod_ilv, "int8"));
+		std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_interleaver_int16 (new aff3ct::wrapper::Wrapper_Interleaver<int16_t, uint32_t>(mod_ilv, "int16"));
+		std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_interleaver_int32 (new aff3ct::wrapper::Wrapper_Interleaver<int32_t, uint32_t>(mod_ilv, "int32"));
+		std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_interleaver_int64 (new aff3ct::wrapper::Wrapper_Interleaver<int64_t, uint32_t>(mod_ilv, "int64"));
+		std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_interleaver_float (new aff3ct::wrapper::Wrapper_Interleaver<float,   uint32_t>(mod_ilv, "float"));
+		std::unique_ptr<aff3ct::wrapper::Wrapper_py> wrapper_interleaver_double(new aff3ct::wrapper::Wrapper_Interleaver<double,  uint32_t>(mod_ilv, "double"));
+		wrappers.push_back(wrapper_interleaver_int8  .get());
+		wrappers.push_back(wrapper_interleaver_int16 .get());
+		wrappers.push_back(wrapper_interleaver_int32 .get());
+		wrappers.push_back(wrapper_interleaver_int64 .get());
+		wrappers.push_back(wrapper_interleaver_float .get());
+		wrappers.push_back(wrapper_interleaver_double.get());
+
+		for (size_t i = 0; i < wrappers.size(); i++)
+			wrappers[i]->definitions();
+	});
 
 {other_module_wrappers}
 	m1.doc() = doc_m1.c_str();
 	for (size_t i = 0; i < wrappers.size(); i++)
 		wrappers[i]->definitions();
+
+	// the generated submodules register their classes on the first access
+	m.def("load_submodules", &wrapper::Lazy_submodule::load_all,
+	      R"pbdoc(Registers now the classes of all the submodules (by default a submodule is loaded on its first access).)pbdoc");
 }
\ No newline at end of file
@@ -7,6 +7,7 @@
 #include <aff3ct.hpp>
 
 #include "Wrapper_py/Wrapper_py.hpp"
+#include "Wrapper_py/Lazy_submodule.hpp"
 #include "Wrapper_py/Module/Module.hpp"
 #include "Wrapper_py/Module/Socket.hpp"
 #include "Wrapper_py/Module/Task.hpp"
@@ -14,8 +15,12 @@
 #include "Wrapper_py/Tools/Gaussian_noise_generator_implem/Gaussian_noise_generator_implem.hpp"
 #include "Wrapper_py/Tools/Sequence/Sequence.hpp"
 #include "Wrapper_py/Tools/Pipeline/Pipeline.hpp"
+#include "Wrapper_py/Tools/Tracer/Tracer.hpp"
+#include "Wrapper_py/Tools/Sweep/Sweep_BFER.hpp"
 #include "Wrapper_py/Tools/Monitor_reduction/Monitor_reduction_BFER.hpp"
+#include "Wrapper_py/Tools/Progress/Progress_BFER.hpp"
 #include "Wrapper_py/Tools/Frozenbits_generator/Frozenbits_generator.hpp"
+#include "Wrapper_py/Tools/Frozenbits_generator/Frozenbits_cache/Frozenbits_cache.hpp"
 #include "Wrapper_py/Tools/Frozenbits_generator/Frozenbits_generator_BEC/Frozenbits_generator_BEC.hpp"
 #include "Wrapper_py/Tools/Frozenbits_generator/Frozenbits_generator_GA/Frozenbits_generator_GA.hpp"
 #include "Wrapper_py/Tools/Frozenbits_generator/Frozenbits_generator_GA_Arikan/Frozenbits_generator_GA_Arikan.hpp"
@@ -9,9 +9,9 @@ using namespace aff3ct::wrapper;
 
 template <typename B,typename R>
 Wrapper_{short_name}_{type}<B,R>
-::Wrapper_{short_name}_{type}(py::handle scope)
+::Wrapper_{short_name}_{type}(py::handle scope, const std::string& suffix)
 : Wrapper_py(),
-  py::class_<aff3ct::module::{short_name}<B,R,tools::Update_rule_{type}{simd}<R>>,aff3ct::module::Decoder_SISO<B,R>>(scope, "{short_name}_{type}")
+  py::class_<aff3ct::module::{short_name}<B,R,tools::Update_rule_{type}{simd}<R>>,aff3ct::module::Decoder_SISO<B,R>>(scope, (std::string("{short_name}_{type}") + (suffix.empty() ? "" : "_" + suffix)).c_str())
 {
 }
 
@@ -26,4 +26,4 @@ void Wrapper_{short_name}_{type}<B,R>
 };
 
 #include "Tools/types.h"
-template class aff3ct::wrapper::Wrapper_{short_name}_{type}<int,float>;
\ No newline at end of file
+template class aff3ct::wrapper::Wrapper_{short_name}_{type}<int,float>;{instances}
\ No newline at end of file
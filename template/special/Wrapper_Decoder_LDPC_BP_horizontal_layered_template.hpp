@@ -4,6 +4,7 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/iostream.h>
+#include <string>
 
 #include <aff3ct.hpp>
 
@@ -23,7 +24,7 @@ class Wrapper_{short_name}_{type} : public Wrapper_py,
                              public py::class_<aff3ct::module::{short_name}<B,R,tools::Update_rule_{type}{simd}<R>>, aff3ct::module::Decoder_SISO<B,R>>
 {
 	public:
-	Wrapper_{short_name}_{type}(py::handle scope);
+	Wrapper_{short_name}_{type}(py::handle scope, const std::string& suffix = "");
 	virtual void definitions();
 	virtual ~Wrapper_{short_name}_{type}() = default;
 };
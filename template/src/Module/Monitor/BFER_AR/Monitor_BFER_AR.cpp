@@ -1,8 +1,13 @@
+#include <algorithm>
 #include <string>
 #include <vector>
 #include <sstream>
+#include <cmath>
+#include <limits>
+#include <cstdint>
 
  #include "Tools/Perf/distance/hamming_distance.h"
+#include "Tools/Aligned/make_shared_aligned.hpp"
 #include "Module/Monitor/BFER_AR/Monitor_BFER_AR.hpp"
 
 using namespace aff3ct;
@@ -13,8 +18,11 @@ Monitor_BFER_AR<B>
 ::Monitor_BFER_AR(const int K, const unsigned max_fe, const unsigned max_n_frames,
                const bool count_unknown_values)
 : Monitor(), K(K), max_fe(max_fe), max_n_frames(max_n_frames),
-  count_unknown_values(count_unknown_values), vals(new Attributes()), err_hist(0), err_hist_activated(false)
+  count_unknown_values(count_unknown_values), ci_rel_target(0.f), ci_z(0.f), ci_on_ber(false), ci_min_fe(10),
+  shards(new Shards()), vals(Attributes::make()), err_hist(0), err_hist_activated(false)
 {
+	this->shards->list = std::make_shared<Blocks>(1, this->vals);
+
 	const std::string name = "Monitor_BFER_AR";
 	this->set_name(name);
 	this->set_single_wave(true);
@@ -75,6 +83,17 @@ Monitor_BFER_AR<B>* Monitor_BFER_AR<B>
 ::clone() const
 {
 	auto m = new Monitor_BFER_AR(*this);
+	{
+		std::lock_guard<std::mutex> lock(this->shards->mtx);
+		this->shards->n_clones++;
+		if (this->shards->sharded)
+		{
+			m->vals = Attributes::make();
+			auto list = std::make_shared<Blocks>(*this->shards->list);
+			list->push_back(m->vals);
+			std::atomic_store(&this->shards->list, std::shared_ptr<const Blocks>(list));
+		}
+	}
 	m->deep_copy(*this);
 	return m;
 }
@@ -221,14 +240,23 @@ int Monitor_BFER_AR<B>
 
 	if (bit_errors_count)
 	{
-		vals->n_be += bit_errors_count;
-		vals->n_fe ++;
+		vals->n_be.fetch_add(bit_errors_count, std::memory_order_relaxed);
+		vals->n_fe.fetch_add(1,                std::memory_order_relaxed);
 
 		if (err_hist_activated)
+		{
 			err_hist.add_value(bit_errors_count);
+			shards->err_bins[bit_errors_count].fetch_add(1, std::memory_order_relaxed);
+		}
 	}
 
-	vals->n_fra++;
+	if (shards->fe_ring_size)
+	{
+		const auto i = shards->fe_ring_head.fetch_add(1, std::memory_order_relaxed);
+		shards->fe_ring[i % shards->fe_ring_size].store((int32_t)bit_errors_count, std::memory_order_relaxed);
+	}
+
+	vals->n_fra.fetch_add(1, std::memory_order_relaxed);
 
 	return bit_errors_count;
 }
@@ -247,18 +275,104 @@ bool Monitor_BFER_AR<B>
 	return get_max_n_frames() != 0 && get_n_analyzed_fra() >= get_max_n_frames();
 }
 
+template <typename B>
+bool Monitor_BFER_AR<B>
+::ci_limit_achieved() const
+{
+	if (this->ci_rel_target == 0.f)
+		return false;
+
+	// with a few errors the interval is not reliable (e.g. 1 error in 1 frame gives a null half-width)
+	if (this->get_n_fe() < (unsigned long long)this->ci_min_fe ||
+	    (this->ci_on_ber && this->get_n_be() < (unsigned long long)this->ci_min_fe))
+		return false;
+
+	return this->get_fer_rel_ci() <= this->ci_rel_target &&
+	       (!this->ci_on_ber || this->get_ber_rel_ci() <= this->ci_rel_target);
+}
+
 template <typename B>
 bool Monitor_BFER_AR<B>
 ::is_done() const
 {
-	return fe_limit_achieved() || frame_limit_achieved();
+	return fe_limit_achieved() || frame_limit_achieved() || ci_limit_achieved();
+}
+
+template <typename B>
+float Monitor_BFER_AR<B>
+::get_fer_rel_ci() const
+{
+	// normal approximation: z * sqrt(p (1 - p) / n) / p = z * sqrt((1 - p) / n_fe)
+	const auto n_fe  = this->get_n_fe();
+	const auto n_fra = this->get_n_analyzed_fra();
+	if (n_fe == 0)
+		return std::numeric_limits<float>::infinity();
+
+	return this->ci_z * std::sqrt((1.f - (float)n_fe / (float)n_fra) / (float)n_fe);
+}
+
+template <typename B>
+float Monitor_BFER_AR<B>
+::get_ber_rel_ci() const
+{
+	const auto n_be  = this->get_n_be();
+	const auto n_bit = this->get_n_analyzed_fra() * (unsigned long long)this->get_K();
+	if (n_be == 0)
+		return std::numeric_limits<float>::infinity();
+
+	return this->ci_z * std::sqrt((1.f - (float)n_be / (float)n_bit) / (float)n_be);
+}
+
+template <typename B>
+void Monitor_BFER_AR<B>
+::set_ci_stop(const float rel_ci, const float confidence, const bool on_ber, const unsigned min_fe)
+{
+	if (rel_ci < 0.f)
+	{
+		std::stringstream message;
+		message << "'rel_ci' has to be positive ('rel_ci' = " << rel_ci << ").";
+		throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
+	}
+
+	if (confidence <= 0.f || confidence >= 1.f)
+	{
+		std::stringstream message;
+		message << "'confidence' has to be in ]0,1[ ('confidence' = " << confidence << ").";
+		throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
+	}
+
+	// z such as erf(z / sqrt(2)) = confidence (bisection, erf is increasing)
+	double z_min = 0., z_max = 40.;
+	for (auto i = 0; i < 100; i++)
+	{
+		const double z = (z_min + z_max) / 2.;
+		if (std::erf(z / std::sqrt(2.)) < confidence)
+			z_min = z;
+		else
+			z_max = z;
+	}
+
+	this->ci_rel_target = rel_ci;
+	this->ci_z          = (float)((z_min + z_max) / 2.);
+	this->ci_on_ber     = on_ber;
+	this->ci_min_fe     = min_fe;
 }
 
 template <typename B>
-const typename Monitor_BFER_AR<B>::Attributes& Monitor_BFER_AR<B>
+typename Monitor_BFER_AR<B>::Attributes Monitor_BFER_AR<B>
 ::get_attributes() const
 {
-	return *vals.get();
+	Attributes a;
+	for (auto& v : *this->get_blocks())
+		a += *v;
+	return a;
+}
+
+template <typename B>
+std::shared_ptr<const typename Monitor_BFER_AR<B>::Blocks> Monitor_BFER_AR<B>
+::get_blocks() const
+{
+	return std::atomic_load(&this->shards->list);
 }
 
 template <typename B>
@@ -286,21 +400,30 @@ template <typename B>
 unsigned long long Monitor_BFER_AR<B>
 ::get_n_analyzed_fra() const
 {
-	return vals->n_fra.load();
+	unsigned long long n_fra = 0;
+	for (auto& v : *this->get_blocks())
+		n_fra += v->n_fra.load(std::memory_order_relaxed);
+	return n_fra;
 }
 
 template <typename B>
 unsigned long long Monitor_BFER_AR<B>
 ::get_n_fe() const
 {
-	return vals->n_fe.load();
+	unsigned long long n_fe = 0;
+	for (auto& v : *this->get_blocks())
+		n_fe += v->n_fe.load(std::memory_order_relaxed);
+	return n_fe;
 }
 
 template <typename B>
 unsigned long long Monitor_BFER_AR<B>
 ::get_n_be() const
 {
-	return vals->n_be.load();
+	unsigned long long n_be = 0;
+	for (auto& v : *this->get_blocks())
+		n_be += v->n_be.load(std::memory_order_relaxed);
+	return n_be;
 }
 
 template <typename B>
@@ -347,6 +470,63 @@ void Monitor_BFER_AR<B>
 ::activate_err_histogram(bool val)
 {
 	err_hist_activated = val;
+
+	std::lock_guard<std::mutex> lock(this->shards->mtx);
+	if (val && !this->shards->err_bins)
+	{
+		this->shards->err_bins.reset(new std::atomic<unsigned long long>[this->get_K() + 1]);
+		for (auto n = 0; n <= this->get_K(); n++)
+			this->shards->err_bins[n] = 0;
+	}
+}
+
+template<typename B>
+const std::atomic<unsigned long long>* Monitor_BFER_AR<B>
+::get_err_hist_bins() const
+{
+	return this->shards->err_bins.get();
+}
+
+template<typename B>
+void Monitor_BFER_AR<B>
+::activate_frame_errors(const size_t size)
+{
+	std::lock_guard<std::mutex> lock(this->shards->mtx);
+	this->shards->fe_ring.reset(size ? new std::atomic<int32_t>[size] : nullptr);
+	for (size_t i = 0; i < size; i++)
+		this->shards->fe_ring[i].store(0, std::memory_order_relaxed);
+	this->shards->fe_ring_size = size;
+	this->shards->fe_ring_head = 0;
+}
+
+template<typename B>
+std::vector<int32_t> Monitor_BFER_AR<B>
+::get_frame_errors(const bool ordered) const
+{
+	std::lock_guard<std::mutex> lock(this->shards->mtx);
+	const auto size = this->shards->fe_ring_size;
+	const auto n_rec = this->shards->fe_ring_head.load(std::memory_order_relaxed);
+	const auto n = ordered ? (size_t)std::min(n_rec, (unsigned long long)size) : size;
+	const auto first = ordered && size ? (size_t)((n_rec - n) % size) : (size_t)0;
+
+	std::vector<int32_t> errors(n);
+	for (size_t i = 0; i < n; i++)
+		errors[i] = this->shards->fe_ring[(first + i) % size].load(std::memory_order_relaxed);
+	return errors;
+}
+
+template<typename B>
+size_t Monitor_BFER_AR<B>
+::get_frame_errors_size() const
+{
+	return this->shards->fe_ring_size;
+}
+
+template<typename B>
+unsigned long long Monitor_BFER_AR<B>
+::get_n_recorded_frames() const
+{
+	return this->shards->fe_ring_head.load(std::memory_order_relaxed);
 }
 
 template <typename B>
@@ -354,9 +534,14 @@ void Monitor_BFER_AR<B>
 ::reset()
 {
 	Monitor::reset();
-	vals->reset();
+	for (auto& v : *this->get_blocks())
+		v->reset();
 
 	this->err_hist.reset();
+	if (this->shards->err_bins)
+		for (auto n = 0; n <= this->get_K(); n++)
+			this->shards->err_bins[n] = 0;
+	this->shards->fe_ring_head = 0;
 }
 
 template <typename B>
@@ -382,6 +567,17 @@ void Monitor_BFER_AR<B>
 	*vals.get() += v;
 }
 
+template <typename B>
+void Monitor_BFER_AR<B>
+::collect(const unsigned long long n_fra, const unsigned long long n_fe, const unsigned long long n_be)
+{
+	Attributes v;
+	v.n_fra = n_fra;
+	v.n_fe  = n_fe;
+	v.n_be  = n_be;
+	collect(v);
+}
+
 template <typename B>
 Monitor_BFER_AR<B>& Monitor_BFER_AR<B>
 ::operator+=(const Monitor_BFER_AR<B>& m)
@@ -410,9 +606,9 @@ template <typename B>
 void Monitor_BFER_AR<B>
 ::copy(const Attributes& v)
 {
-	vals->n_be = v.n_be.load();
-	vals->n_fe = v.n_fe.load();
-	vals->n_fra = v.n_fra.load();
+	for (auto& s : *this->get_blocks())
+		s->reset();
+	*vals.get() = v;
 }
 
 template <typename B>
@@ -451,6 +647,60 @@ Monitor_BFER_AR<B>::Attributes
 	reset();
 }
 
+template <typename B>
+Monitor_BFER_AR<B>::Attributes
+::Attributes(const Attributes& a)
+{
+	*this = a;
+}
+
+template <typename B>
+std::shared_ptr<typename Monitor_BFER_AR<B>::Attributes> Monitor_BFER_AR<B>::Attributes
+::make()
+{
+	return tools::make_shared_aligned<Attributes>();
+}
+
+template <typename B>
+typename Monitor_BFER_AR<B>::Attributes& Monitor_BFER_AR<B>::Attributes
+::operator=(const Attributes& a)
+{
+	n_be  = a.n_be .load();
+	n_fe  = a.n_fe .load();
+	n_fra = a.n_fra.load();
+
+	return *this;
+}
+
+template <typename B>
+Monitor_BFER_AR<B>::Shards
+::Shards()
+: n_clones(0), sharded(false), fe_ring_size(0), fe_ring_head(0)
+{
+}
+
+template <typename B>
+void Monitor_BFER_AR<B>
+::set_sharded(const bool sharded)
+{
+	std::lock_guard<std::mutex> lock(this->shards->mtx);
+	if (this->shards->n_clones > 0)
+	{
+		std::stringstream message;
+		message << "The sharded mode can't be changed once the monitor has been cloned.";
+		throw tools::runtime_error(__FILE__, __LINE__, __func__, message.str());
+	}
+	this->shards->sharded = sharded;
+}
+
+template <typename B>
+bool Monitor_BFER_AR<B>
+::is_sharded() const
+{
+	std::lock_guard<std::mutex> lock(this->shards->mtx);
+	return this->shards->sharded;
+}
+
 // ==================================================================================== explicit template instantiation
 #include "Tools/types.h"
 #ifdef AFF3CT_MULTI_PREC
@@ -9,6 +9,7 @@
 #include <memory>
 #include <cstdint>
 #include <atomic>
+#include <mutex>
 #include <functional>
 
 #include "Tools/Algo/Histogram.hpp"
@@ -30,24 +31,54 @@ public:
 	inline Socket& operator[](const mnt::sck::check_errors2 s);
 
 protected:
-	struct Attributes
+	// one counter block per cache line to avoid false sharing between the shards
+	struct alignas(64) Attributes
 	{
 		std::atomic<unsigned long long> n_fra; // the number of checked frames
 		std::atomic<unsigned long long> n_be;  // the number of wrong bits
 		std::atomic<unsigned long long> n_fe;  // the number of wrong frames
 
 		Attributes();
+		Attributes(const Attributes& a);
+		static std::shared_ptr<Attributes> make(); // allocates a block aligned on a cache line
 		void reset();
+		Attributes& operator= (const Attributes& a);
 		Attributes& operator+=(const Attributes& a);
 	};
 
+	typedef std::vector<std::shared_ptr<Attributes>> Blocks;
+
+	// The counter blocks of a monitor and of its clones. In the default mode, the clones share a single block. In the
+	// sharded mode, each clone owns a block and the getters sum the blocks. The list of the blocks is copied on write:
+	// the getters read a snapshot (std::atomic_load) while the clones are registered.
+	struct Shards
+	{
+		std::mutex                    mtx;      // protects the registration of the clones
+		std::shared_ptr<const Blocks> list;
+		size_t                        n_clones; // number of clones, in the sharded mode or not
+		bool                          sharded;
+
+		std::unique_ptr<std::atomic<unsigned long long>[]> err_bins;    // err_bins[n] = number of frames with n wrong bits
+		std::unique_ptr<std::atomic<int32_t>[]>            fe_ring;     // number of wrong bits of the last checked frames
+		size_t                                             fe_ring_size;
+		std::atomic<unsigned long long>                    fe_ring_head; // number of frames recorded in the ring
+
+		Shards();
+	};
+
 private:
 	const int      K;                    // Number of source bits
 	const unsigned max_fe;               // max number of wrong frames to get then fe_limit_achieved() returns true else if 0
 	const unsigned max_n_frames;         // max number of frames to check then frame_limit_achieved() returns true else if 0
 	const bool     count_unknown_values; // take into account or not the unknown values as wrong values in the checked frames
 
-	std::shared_ptr<Attributes> vals;
+	float    ci_rel_target;              // target of the relative confidence interval half-width, disabled if 0
+	float    ci_z;                       // quantile of the normal distribution for the confidence level
+	bool     ci_on_ber;                  // also require the target on the BER
+	unsigned ci_min_fe;                  // min number of wrong frames (and bits) before the criterion can stop
+
+	std::shared_ptr<Shards> shards;   // shared by the clones
+	std::shared_ptr<Attributes> vals; // the counter block written by this monitor
 	tools::Histogram<int> err_hist; // the error histogram record
 	bool err_hist_activated;
 
@@ -102,6 +133,7 @@ public:
 
 	bool    fe_limit_achieved() const;
 	bool frame_limit_achieved() const;
+	bool    ci_limit_achieved() const;
 	virtual bool is_done() const;
 
 	int                   get_K                   () const;
@@ -114,14 +146,58 @@ public:
 	float                 get_fer                 () const;
 	float                 get_ber                 () const;
 
+	float                 get_fer_rel_ci          () const;
+	float                 get_ber_rel_ci          () const;
+
+	/*!
+	 * \brief Stops the simulation when the relative half-width of the FER confidence interval is below 'rel_ci'.
+	 *
+	 * \param rel_ci:     the target relative half-width (0 disables the criterion).
+	 * \param confidence: the confidence level of the interval.
+	 * \param on_ber:     also require the target on the BER.
+	 * \param min_fe:     the min number of wrong frames (and wrong bits with 'on_ber') before stopping, the normal
+	 *                    approximation does not hold with a few errors.
+	 */
+	void set_ci_stop(const float rel_ci, const float confidence = 0.95f, const bool on_ber = false,
+	                 const unsigned min_fe = 10);
+
+	/*!
+	 * \brief Gives its own counter block to each clone (to call before cloning the monitor, e.g. before building the
+	 * sequence). The writes of the threads do not contend anymore, the getters sum the blocks.
+	 */
+	void set_sharded(const bool sharded);
+	bool is_sharded() const;
+
 	const tools::Histogram<int>& get_err_hist     () const;
 	void activate_err_histogram(bool val);
 
+	/*!
+	 * \brief Gives the error histogram of the monitor and of its clones as K+1 bins: the bin 'n' counts the wrong frames
+	 * with 'n' wrong bits (the bin 0 is not counted). Returns nullptr if the histogram has never been activated.
+	 */
+	const std::atomic<unsigned long long>* get_err_hist_bins() const;
+
+	/*!
+	 * \brief Records the number of wrong bits of each checked frame in a ring buffer of 'size' elements shared by the
+	 * clones (to call before running the chain, the buffer is reallocated, 0 disables the recording).
+	 */
+	void activate_frame_errors(const size_t size);
+
+	/*!
+	 * \brief Copies the ring buffer of the frame errors: the whole ring (the frame 'i' is at the index i % size) or,
+	 * with 'ordered', the last min(n_recorded_frames, size) frames, oldest first. The threads checking the frames
+	 * can write the ring during the copy.
+	 */
+	std::vector<int32_t>  get_frame_errors        (const bool ordered = false) const;
+	size_t                get_frame_errors_size   () const;
+	unsigned long long    get_n_recorded_frames   () const;
+
 	virtual void reset();
 
 	virtual void collect(const Monitor& m,         bool fully = false);
 	virtual void collect(const Monitor_BFER_AR<B>& m, bool fully = false);
 	virtual void collect(const Attributes& v);
+	void collect(const unsigned long long n_fra, const unsigned long long n_fe, const unsigned long long n_be);
 
 	Monitor_BFER_AR<B>& operator+=(const Monitor_BFER_AR<B>& m); // not full "collect" call
 
@@ -132,7 +208,8 @@ public:
 	Monitor_BFER_AR<B>& operator=(const Monitor_BFER_AR<B>& m); // not full "copy" call
 
 protected:
-	const Attributes& get_attributes() const;
+	Attributes get_attributes() const;
+	std::shared_ptr<const Blocks> get_blocks() const;
 
 	virtual int _check_errors(const B *U, const B *V, const size_t frame_id);
 
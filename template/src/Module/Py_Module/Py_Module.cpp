@@ -2,15 +2,19 @@
 #include <algorithm>
 #include <exception>
 #include <memory>
+#include <vector>
+#include <cstdint>
 
 #include <pybind11/stl.h>
 #include <pybind11/numpy.h>
 #include <pybind11/functional.h>
 
 #include "Py_Module.hpp"
+#include "Wrapper_py/Module/Socket.hpp"
 
 using namespace aff3ct;
 using namespace aff3ct::module;
+using namespace aff3ct::wrapper;
 namespace py = pybind11;
 
 Py_Module
@@ -39,18 +43,48 @@ Py_Module
 void Py_Module
 ::create_codelet(Task& task, const py::function& codelet)
 {
+	// The module is single wave: the codelet is called once per wave with the 2D arrays of all the frames.
+	// A new list is given at each call (the user can modify it), the socket views are cached by Wrapper_Socket.
 	Module::create_codelet(task,[codelet](Module &m, Task &t, const size_t f)->int
 	{
 		py::gil_scoped_acquire acquire{};
 		auto py_m = py::cast(static_cast<Py_Module&>(m));
-		py::list l;
-		for (size_t i = 0; i < t.sockets.size()-1; i++) // I don't pass the STATUS here
-			l.append(py::array(py::cast(t.sockets[i])));
+		const size_t n_args = t.sockets.size()-1; // I don't pass the STATUS here
+		py::list l(n_args);
+		for (size_t i = 0; i < n_args; i++)
+			l[i] = Wrapper_Socket::get_view(*t.sockets[i]);
 
 		return codelet(py_m,l,f).cast<int>();
 	});
 }
 
+void Py_Module
+::create_codelet(Task& task, const uintptr_t codelet_address)
+{
+	if (codelet_address == 0)
+	{
+		std::stringstream message;
+		message << "'codelet_address' should not be a null pointer.";
+		throw std::runtime_error(message.str());
+	}
+
+	// The native codelet does not touch the Python interpreter: the GIL is not taken.
+	auto codelet = reinterpret_cast<native_codelet_t>(codelet_address);
+	Module::create_codelet(task,[codelet](Module &m, Task &t, const size_t f)->int
+	{
+		const size_t n_sockets = t.sockets.size()-1; // I don't pass the STATUS here
+		std::vector<void*>  dataptrs(n_sockets);
+		std::vector<size_t> n_elmts (n_sockets);
+		for (size_t i = 0; i < n_sockets; i++)
+		{
+			dataptrs[i] = t.sockets[i]->get_dataptr();
+			n_elmts [i] = t.sockets[i]->get_n_elmts();
+		}
+
+		return codelet(dataptrs.data(), n_elmts.data(), n_sockets, m.get_n_frames(), f);
+	});
+}
+
 void Py_Module
 ::create_fake_codelet(Task& task)
 {
@@ -20,6 +20,11 @@ protected:
 	bool done_flag;
 
 public:
+	// Signature of the native codelets: the data pointers and the number of elements (all frames included) of the
+	// task sockets (status excepted), the number of sockets, the number of frames and the frame id.
+	typedef int (*native_codelet_t)(void** dataptrs, const size_t* n_elmts, const size_t n_sockets,
+	                                const size_t n_frames, const size_t frame_id);
+
 	Py_Module();
 	Py_Module(const Py_Module& );
 
@@ -36,6 +41,7 @@ public:
 	virtual void set_n_frames         (const size_t n_frames         );
 
 	void create_codelet(Task& task, const py::function& codelet);
+	void create_codelet(Task& task, const uintptr_t codelet_address);
 	void create_fake_codelet(Task& task);
 	std::string to_string() const;
 	bool has_child() const;
@@ -0,0 +1,21 @@
+#ifndef TASK_PUBLICIST_HPP_
+#define TASK_PUBLICIST_HPP_
+
+#include <aff3ct.hpp>
+
+namespace aff3ct
+{
+namespace module
+{
+class Task_Publicist : public Task
+{
+	public:
+	using Task::Task;
+	using Task::codelet;
+
+	virtual ~Task_Publicist() = default;
+};
+}
+}
+
+#endif /* TASK_PUBLICIST_HPP_ */
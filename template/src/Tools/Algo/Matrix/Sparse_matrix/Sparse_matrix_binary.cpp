@@ -0,0 +1,269 @@
+#include <iostream>
+#include <sstream>
+#include <fstream>
+#include <cstdio>
+#include <cstring>
+#include <vector>
+#include <iterator>
+#include <limits>
+#if defined(__unix__) || defined(__APPLE__)
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <fcntl.h>
+#include <unistd.h>
+#define SPARSE_MATRIX_BINARY_MMAP
+#endif
+
+#include "Tools/Result_cache/Result_cache.hpp"
+#include "Tools/Algo/Matrix/Sparse_matrix/Sparse_matrix_binary.hpp"
+
+using namespace aff3ct;
+using namespace aff3ct::tools;
+
+namespace
+{
+struct Header
+{
+	char     magic[8];
+	uint32_t version;
+	uint32_t padding;
+	uint64_t source_hash;
+	uint64_t n_rows;
+	uint64_t n_cols;
+	uint64_t n_connections;
+};
+
+// Read-only view of a whole file: a memory mapping when available, else a copy in memory.
+class File_view
+{
+	std::vector<char> copy;
+	const char* data;
+	size_t size;
+	void* map;
+
+public:
+	explicit File_view(const std::string& path)
+	: data(nullptr), size(0), map(nullptr)
+	{
+#ifdef SPARSE_MATRIX_BINARY_MMAP
+		const int fd = ::open(path.c_str(), O_RDONLY);
+		if (fd < 0)
+			return;
+		struct stat st;
+		if (::fstat(fd, &st) == 0 && st.st_size > 0)
+		{
+			auto map = ::mmap(nullptr, (size_t)st.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+			if (map != MAP_FAILED)
+			{
+				this->map  = map;
+				this->data = static_cast<const char*>(map);
+				this->size = (size_t)st.st_size;
+			}
+		}
+		::close(fd);
+#else
+		std::ifstream f(path, std::ios::in | std::ios::binary);
+		if (!f.is_open())
+			return;
+		this->copy.assign(std::istreambuf_iterator<char>(f), std::istreambuf_iterator<char>());
+		this->data = this->copy.data();
+		this->size = this->copy.size();
+#endif
+	}
+
+	~File_view()
+	{
+#ifdef SPARSE_MATRIX_BINARY_MMAP
+		if (this->map != nullptr)
+			::munmap(this->map, this->size);
+#endif
+	}
+
+	File_view(const File_view&) = delete;
+	File_view& operator=(const File_view&) = delete;
+
+	const char* get_data() const { return this->data; }
+	size_t      get_size() const { return this->size; }
+};
+}
+
+uint64_t Sparse_matrix_binary
+::hash_file(const std::string& path)
+{
+	File_view file(path);
+	if (file.get_data() == nullptr)
+	{
+		std::ifstream f(path);
+		if (!f.is_open()) // an empty file can't be mapped but is a valid file
+		{
+			std::stringstream message;
+			message << "Can't open '" + path + "' file.";
+			throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
+		}
+	}
+
+	uint64_t h = 14695981039346656037ull;
+	for (size_t i = 0; i < file.get_size(); i++)
+	{
+		h ^= (uint64_t)(unsigned char)file.get_data()[i];
+		h *= 1099511628211ull;
+	}
+	return h;
+}
+
+void Sparse_matrix_binary
+::write(const Sparse_matrix& matrix, const std::string& path, const uint64_t source_hash)
+{
+	const std::string tmp_path = Result_cache::get_tmp_path(path);
+	{
+		std::ofstream f(tmp_path, std::ios::out | std::ios::binary | std::ios::trunc);
+		if (!f.is_open())
+		{
+			std::stringstream message;
+			message << "Can't open '" + tmp_path + "' file.";
+			throw tools::runtime_error(__FILE__, __LINE__, __func__, message.str());
+		}
+
+		Header h;
+		std::memcpy(h.magic, "AFF3CTSM", 8);
+		h.version       = 1;
+		h.padding       = 0;
+		h.source_hash   = source_hash;
+		h.n_rows        = (uint64_t)matrix.get_n_rows();
+		h.n_cols        = (uint64_t)matrix.get_n_cols();
+		h.n_connections = (uint64_t)matrix.get_n_connections();
+		f.write((const char*)&h, sizeof(h));
+
+		uint64_t ptr = 0;
+		f.write((const char*)&ptr, sizeof(ptr));
+		for (size_t i = 0; i < matrix.get_n_rows(); i++)
+		{
+			ptr += (uint64_t)matrix.get_cols_from_row(i).size();
+			f.write((const char*)&ptr, sizeof(ptr));
+		}
+		for (size_t i = 0; i < matrix.get_n_rows(); i++)
+		{
+			const auto& cols = matrix.get_cols_from_row(i);
+			f.write((const char*)cols.data(), cols.size() * sizeof(uint32_t));
+		}
+
+		if (!f)
+		{
+			f.close();
+			std::remove(tmp_path.c_str());
+			std::stringstream message;
+			message << "Can't write '" + tmp_path + "' file.";
+			throw tools::runtime_error(__FILE__, __LINE__, __func__, message.str());
+		}
+	}
+
+	if (std::rename(tmp_path.c_str(), path.c_str()) != 0)
+	{
+		std::remove(tmp_path.c_str());
+		std::stringstream message;
+		message << "Can't rename '" + tmp_path + "' into '" + path + "'.";
+		throw tools::runtime_error(__FILE__, __LINE__, __func__, message.str());
+	}
+}
+
+bool Sparse_matrix_binary
+::read(const std::string& path, Sparse_matrix& matrix, const uint64_t source_hash)
+{
+	File_view file(path);
+	if (file.get_size() < sizeof(Header))
+		return false;
+
+	Header h;
+	std::memcpy(&h, file.get_data(), sizeof(h));
+	if (std::strncmp(h.magic, "AFF3CTSM", 8) != 0 || h.version != 1 || h.source_hash != source_hash)
+		return false;
+
+	// the dimensions come from the file: bound each of them by the size of the file before computing the expected
+	// size, else a corrupt header can overflow the computation and pass the check
+	const uint64_t payload = (uint64_t)(file.get_size() - sizeof(Header));
+	if (h.n_rows >= payload / sizeof(uint64_t) || h.n_connections > payload / sizeof(uint32_t) ||
+	    h.n_cols > (uint64_t)std::numeric_limits<uint32_t>::max() +1)
+		return false;
+
+	const uint64_t expected = (h.n_rows +1) * sizeof(uint64_t) + h.n_connections * sizeof(uint32_t);
+	if (payload != expected)
+		return false;
+
+	// the header is 48 bytes long, the row pointers and the column indexes are aligned in the mapping
+	const uint64_t* ptr  = reinterpret_cast<const uint64_t*>(file.get_data() + sizeof(Header));
+	const uint32_t* cols = reinterpret_cast<const uint32_t*>(ptr + h.n_rows +1);
+	if (ptr[0] != 0 || ptr[h.n_rows] != h.n_connections)
+		return false;
+
+	Sparse_matrix m((size_t)h.n_rows, (size_t)h.n_cols);
+	for (uint64_t i = 0; i < h.n_rows; i++)
+	{
+		if (ptr[i +1] < ptr[i])
+			return false;
+		for (auto k = ptr[i]; k < ptr[i +1]; k++)
+		{
+			if (cols[k] >= h.n_cols)
+				return false;
+			m.add_connection((size_t)i, (size_t)cols[k]);
+		}
+	}
+
+	matrix = m;
+	return true;
+}
+
+Sparse_matrix Sparse_matrix_binary
+::read(const std::string& path)
+{
+	File_view file(path);
+	if (file.get_size() < sizeof(Header))
+	{
+		std::stringstream message;
+		message << "Can't read '" + path + "' file.";
+		throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
+	}
+
+	Header h;
+	std::memcpy(&h, file.get_data(), sizeof(h));
+
+	Sparse_matrix matrix;
+	if (!Sparse_matrix_binary::read(path, matrix, h.source_hash))
+	{
+		std::stringstream message;
+		message << "'" + path + "' is not a valid binary sparse matrix file.";
+		throw tools::runtime_error(__FILE__, __LINE__, __func__, message.str());
+	}
+	return matrix;
+}
+
+Sparse_matrix Sparse_matrix_binary
+::read_cached(const std::string& path, std::function<Sparse_matrix(std::istream&)> parser)
+{
+	const auto source_hash = Sparse_matrix_binary::hash_file(path);
+	const std::string cache_path = path + ".spm";
+
+	Sparse_matrix matrix;
+	if (Sparse_matrix_binary::read(cache_path, matrix, source_hash))
+		return matrix;
+
+	std::ifstream f(path, std::ios::in);
+	if (!f.is_open())
+	{
+		std::stringstream message;
+		message << "Can't open '" + path + "' file.";
+		throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
+	}
+	matrix = parser(f);
+
+	try
+	{
+		Sparse_matrix_binary::write(matrix, cache_path, source_hash);
+	}
+	catch (const std::exception&)
+	{
+		// the cache is optional
+		std::clog << rang::tag::warning << "Can't write '" + cache_path + "' file, the matrix is not cached."
+		          << std::endl;
+	}
+	return matrix;
+}
@@ -0,0 +1,37 @@
+#ifndef SPARSE_MATRIX_BINARY_HPP_
+#define SPARSE_MATRIX_BINARY_HPP_
+
+#include <string>
+#include <cstdint>
+#include <functional>
+#include <aff3ct.hpp>
+
+namespace aff3ct
+{
+namespace tools
+{
+// Compact binary format of the sparse matrices, to avoid parsing the text formats (AList, QC) at each loading.
+// Layout: "AFF3CTSM", uint32 version, uint64 source hash, uint64 n_rows, uint64 n_cols, uint64 n_connections,
+// (n_rows +1) x uint64 row pointers, n_connections x uint32 column indexes.
+struct Sparse_matrix_binary
+{
+	static void write(const Sparse_matrix& matrix, const std::string& path, const uint64_t source_hash = 0);
+
+	// Returns false if 'path' can't be read or if it was not built from a source of hash 'source_hash'.
+	static bool read(const std::string& path, Sparse_matrix& matrix, const uint64_t source_hash);
+
+	static Sparse_matrix read(const std::string& path);
+
+	/*!
+	 * \brief Reads a text file with 'parser' through a binary sidecar cache ('path' + ".spm"). The cache is used if it
+	 * has been built from a file with the same content (64-bit FNV-1a hash), else it is (re)built. A cache that can't
+	 * be written (e.g. read-only directory) is skipped with a warning.
+	 */
+	static Sparse_matrix read_cached(const std::string& path, std::function<Sparse_matrix(std::istream&)> parser);
+
+	static uint64_t hash_file(const std::string& path);
+};
+}
+}
+
+#endif /* SPARSE_MATRIX_BINARY_HPP_ */
@@ -0,0 +1,40 @@
+#ifndef MAKE_SHARED_ALIGNED_HPP_
+#define MAKE_SHARED_ALIGNED_HPP_
+
+#include <memory>
+#include <new>
+#include <cstdint>
+#include <utility>
+
+namespace aff3ct
+{
+namespace tools
+{
+// Allocates a 'T' aligned on 'alignof(T)'. Before C++17, 'new' (and 'make_shared') ignores the alignment of the
+// over-aligned types: the object is aligned by hand in a larger block, released by the deleter.
+template <typename T, typename... Args>
+std::shared_ptr<T> make_shared_aligned(Args&&... args)
+{
+	const auto align = alignof(T);
+	void* raw = ::operator new(sizeof(T) + align);
+	void* ptr = (void*)(((uintptr_t)raw + align) & ~(uintptr_t)(align - 1));
+	T* obj;
+	try
+	{
+		obj = new (ptr) T(std::forward<Args>(args)...);
+	}
+	catch (...)
+	{
+		::operator delete(raw);
+		throw;
+	}
+	return std::shared_ptr<T>(obj, [raw](T* obj)
+	{
+		obj->~T();
+		::operator delete(raw);
+	});
+}
+}
+}
+
+#endif /* MAKE_SHARED_ALIGNED_HPP_ */
@@ -0,0 +1,91 @@
+#include <cmath>
+#include <memory>
+#include <thread>
+#include <atomic>
+#include <sstream>
+#include <exception>
+#include <algorithm>
+
+#include "Tools/Code/Polar/Frozenbits_cache/Frozenbits_batch.hpp"
+
+using namespace aff3ct;
+using namespace aff3ct::tools;
+
+std::vector<std::vector<bool>> Frozenbits_batch
+::generate(const Frozenbits_generator& generator, const std::vector<float>& noises, size_t n_threads,
+           Frozenbits_cache* cache, const std::string& tag)
+{
+	// a NaN breaks the sort, the deduplication and the lookup of the values below
+	for (size_t i = 0; i < noises.size(); i++)
+		if (std::isnan(noises[i]))
+		{
+			std::stringstream message;
+			message << "'noises' should not contain NaN values ('noises[" << i << "]' = " << noises[i] << ").";
+			throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
+		}
+
+	auto noise_type = tools::Noise_type::SIGMA;
+	try
+	{
+		noise_type = generator.get_noise().get_type();
+	}
+	catch (const std::exception&)
+	{
+		// no noise set yet: the values are sigmas
+	}
+
+	// the repeated noise values are generated once
+	std::vector<float> values(noises);
+	std::sort(values.begin(), values.end());
+	values.erase(std::unique(values.begin(), values.end()), values.end());
+
+	if (n_threads == 0)
+		n_threads = std::max(std::thread::hardware_concurrency(), 1u);
+	n_threads = std::min(n_threads, values.size());
+
+	std::vector<std::vector<bool>> fbs(values.size());
+	std::vector<std::exception_ptr> errors(n_threads);
+	std::atomic<size_t> next(0);
+	std::vector<std::thread> threads;
+	for (size_t t = 0; t < n_threads; t++)
+		threads.push_back(std::thread([&, t]()
+		{
+			try
+			{
+				std::unique_ptr<Frozenbits_generator> g(generator.clone());
+				for (auto v = next++; v < values.size(); v = next++)
+				{
+					std::unique_ptr<tools::Noise<>> noise;
+					switch (noise_type)
+					{
+						case tools::Noise_type::SIGMA: noise.reset(new tools::Sigma<>                 (values[v])); break;
+						case tools::Noise_type::EP:    noise.reset(new tools::Event_probability<>     (values[v])); break;
+						case tools::Noise_type::ROP:   noise.reset(new tools::Received_optical_power<>(values[v])); break;
+					}
+					g->set_noise(*noise);
+					fbs[v].assign(g->get_N(), true);
+					if (cache)
+						cache->generate(*g, fbs[v], tag);
+					else
+						g->generate(fbs[v]);
+				}
+			}
+			catch (...)
+			{
+				errors[t] = std::current_exception();
+				next = values.size();
+			}
+		}));
+
+	for (auto& th : threads)
+		th.join();
+
+	for (auto& e : errors)
+		if (e)
+			std::rethrow_exception(e);
+
+	std::vector<std::vector<bool>> frozen_bits;
+	for (auto n : noises)
+		frozen_bits.push_back(fbs[std::lower_bound(values.begin(), values.end(), n) - values.begin()]);
+	return frozen_bits;
+}
@@ -0,0 +1,30 @@
+#ifndef FROZENBITS_BATCH_HPP_
+#define FROZENBITS_BATCH_HPP_
+
+#include <string>
+#include <vector>
+#include <aff3ct.hpp>
+
+#include "Tools/Code/Polar/Frozenbits_cache/Frozenbits_cache.hpp"
+
+namespace aff3ct
+{
+namespace tools
+{
+// Generation of the frozen bits for a batch of noise values.
+struct Frozenbits_batch
+{
+	/*!
+	 * \brief Returns the frozen bits of 'generator' for each value of 'noises'. The values have the type of the current
+	 * noise of the generator (a Sigma if none is set). The distinct values are generated in parallel on 'n_threads'
+	 * clones of the generator (0 for one per core), the repeated values are generated once. 'generator' itself is not
+	 * modified. With a 'cache', the frozen bits are also memoized.
+	 */
+	static std::vector<std::vector<bool>> generate(const Frozenbits_generator& generator,
+	                                               const std::vector<float>& noises, size_t n_threads = 0,
+	                                               Frozenbits_cache* cache = nullptr, const std::string& tag = "");
+};
+}
+}
+
+#endif /* FROZENBITS_BATCH_HPP_ */
@@ -0,0 +1,238 @@
+#include <iostream>
+#include <sstream>
+#include <fstream>
+#include <iomanip>
+#include <typeinfo>
+#include <cstdio>
+#include <cstring>
+
+#include "Tools/Result_cache/Result_cache.hpp"
+#include "Tools/Code/Polar/Frozenbits_cache/Frozenbits_cache.hpp"
+
+using namespace aff3ct;
+using namespace aff3ct::tools;
+
+Frozenbits_cache
+::Frozenbits_cache(const size_t capacity, const std::string& directory)
+: capacity(capacity), directory(directory), n_hits(0), n_misses(0)
+{
+}
+
+std::string Frozenbits_cache
+::get_key(const Frozenbits_generator& generator, const std::string& tag)
+{
+	const auto& noise = generator.get_noise();
+	std::stringstream key;
+	key << typeid(generator).name() << " K=" << generator.get_K() << " N=" << generator.get_N()
+	    << " noise=" << (int)noise.get_type() << ":" << std::hexfloat << noise.get_value() << " tag=" << tag;
+	return key.str();
+}
+
+void Frozenbits_cache
+::generate(Frozenbits_generator& generator, std::vector<bool>& frozen_bits, const std::string& tag)
+{
+	const auto key = Frozenbits_cache::get_key(generator, tag);
+	if (this->lookup(key, frozen_bits))
+		return;
+
+	if (this->load(key, frozen_bits) && frozen_bits.size() == (size_t)generator.get_N())
+	{
+		this->insert(key, frozen_bits);
+		return;
+	}
+
+	// the generation is done without the lock, two threads may compute the same entry
+	frozen_bits.assign(generator.get_N(), true);
+	generator.generate(frozen_bits);
+	this->insert(key, frozen_bits);
+	this->save(key, frozen_bits);
+}
+
+bool Frozenbits_cache
+::lookup(const std::string& key, std::vector<bool>& frozen_bits)
+{
+	std::lock_guard<std::mutex> lock(this->mtx);
+	auto it = this->index.find(key);
+	if (it == this->index.end())
+	{
+		this->n_misses++;
+		return false;
+	}
+
+	this->lru.splice(this->lru.begin(), this->lru, it->second);
+	frozen_bits = it->second->second;
+	this->n_hits++;
+	return true;
+}
+
+void Frozenbits_cache
+::insert(const std::string& key, const std::vector<bool>& frozen_bits)
+{
+	std::lock_guard<std::mutex> lock(this->mtx);
+	if (this->capacity == 0)
+		return;
+
+	auto it = this->index.find(key);
+	if (it != this->index.end())
+	{
+		it->second->second = frozen_bits;
+		this->lru.splice(this->lru.begin(), this->lru, it->second);
+		return;
+	}
+
+	this->lru.push_front(std::make_pair(key, frozen_bits));
+	this->index[key] = this->lru.begin();
+	while (this->lru.size() > this->capacity)
+	{
+		this->index.erase(this->lru.back().first);
+		this->lru.pop_back();
+	}
+}
+
+std::string Frozenbits_cache
+::get_path(const std::string& key) const
+{
+	std::stringstream path;
+	path << this->directory << "/" << std::hex << std::setw(16) << std::setfill('0') << Result_cache::hash(key)
+	     << ".fb";
+	return path.str();
+}
+
+bool Frozenbits_cache
+::load(const std::string& key, std::vector<bool>& frozen_bits) const
+{
+	if (this->directory.empty())
+		return false;
+
+	std::ifstream f(this->get_path(key), std::ios::in | std::ios::binary);
+	if (!f.is_open())
+		return false;
+
+	char magic[8];
+	uint32_t version = 0;
+	uint64_t key_size = 0, N = 0;
+	f.read(magic, sizeof(magic));
+	f.read((char*)&version,  sizeof(version ));
+	f.read((char*)&key_size, sizeof(key_size));
+	if (!f || std::strncmp(magic, "AFF3CTFB", 8) != 0 || version != 1 || key_size != key.size())
+		return false;
+
+	std::string stored_key(key_size, '\0');
+	f.read(&stored_key[0], key_size);
+	f.read((char*)&N, sizeof(N));
+	if (!f || stored_key != key)
+		return false;
+
+	std::vector<char> bits(N);
+	f.read(bits.data(), N);
+	if (!f)
+		return false;
+
+	frozen_bits.assign(bits.begin(), bits.end());
+	return true;
+}
+
+bool Frozenbits_cache
+::save(const std::string& key, const std::vector<bool>& frozen_bits) const
+{
+	// Layout: "AFF3CTFB", uint32 version, uint64 key size, key, uint64 N, N x uint8 frozen bits
+	if (this->directory.empty())
+		return false;
+
+	const std::string path = this->get_path(key);
+	const std::string tmp_path = Result_cache::get_tmp_path(path);
+	bool written;
+	{
+		std::ofstream f(tmp_path, std::ios::out | std::ios::binary | std::ios::trunc);
+		if (!f.is_open())
+		{
+			std::clog << rang::tag::warning << "Can't open '" + tmp_path + "' file, the frozen bits are not cached."
+			          << std::endl;
+			return false;
+		}
+
+		const uint32_t version = 1;
+		const uint64_t key_size = (uint64_t)key.size(), N = (uint64_t)frozen_bits.size();
+		const std::vector<char> bits(frozen_bits.begin(), frozen_bits.end());
+		f.write("AFF3CTFB", 8);
+		f.write((const char*)&version,  sizeof(version ));
+		f.write((const char*)&key_size, sizeof(key_size));
+		f.write(key.data(), key.size());
+		f.write((const char*)&N, sizeof(N));
+		f.write(bits.data(), bits.size());
+		f.close();
+		written = !f.fail();
+	}
+
+	if (!written || std::rename(tmp_path.c_str(), path.c_str()) != 0)
+	{
+		std::remove(tmp_path.c_str());
+		std::clog << rang::tag::warning << "Can't write '" + path + "' file, the frozen bits are not cached."
+		          << std::endl;
+		return false;
+	}
+	return true;
+}
+
+void Frozenbits_cache
+::clear()
+{
+	std::lock_guard<std::mutex> lock(this->mtx);
+	this->lru.clear();
+	this->index.clear();
+	this->n_hits   = 0;
+	this->n_misses = 0;
+}
+
+size_t Frozenbits_cache
+::size()
+{
+	std::lock_guard<std::mutex> lock(this->mtx);
+	return this->lru.size();
+}
+
+size_t Frozenbits_cache
+::get_n_hits()
+{
+	std::lock_guard<std::mutex> lock(this->mtx);
+	return this->n_hits;
+}
+
+size_t Frozenbits_cache
+::get_n_misses()
+{
+	std::lock_guard<std::mutex> lock(this->mtx);
+	return this->n_misses;
+}
+
+void Frozenbits_cache
+::set_capacity(const size_t capacity)
+{
+	std::lock_guard<std::mutex> lock(this->mtx);
+	this->capacity = capacity;
+	while (this->lru.size() > this->capacity)
+	{
+		this->index.erase(this->lru.back().first);
+		this->lru.pop_back();
+	}
+}
+
+size_t Frozenbits_cache
+::get_capacity()
+{
+	std::lock_guard<std::mutex> lock(this->mtx);
+	return this->capacity;
+}
+
+void Frozenbits_cache
+::set_directory(const std::string& directory)
+{
+	std::lock_guard<std::mutex> lock(this->mtx);
+	this->directory = directory;
+}
+
+const std::string& Frozenbits_cache
+::get_directory() const
+{
+	return this->directory;
+}
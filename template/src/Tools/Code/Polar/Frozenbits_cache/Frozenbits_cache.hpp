@@ -0,0 +1,60 @@
+#ifndef FROZENBITS_CACHE_HPP_
+#define FROZENBITS_CACHE_HPP_
+
+#include <list>
+#include <mutex>
+#include <string>
+#include <vector>
+#include <utility>
+#include <unordered_map>
+#include <aff3ct.hpp>
+
+namespace aff3ct
+{
+namespace tools
+{
+// Memoizes the frozen bits of the generators: a LRU in memory and, optionally, one file per entry in a directory.
+// The key is made of the generator type, K, N, the noise (type and value) and an optional user tag (for the
+// generators that depend on something else, e.g. the files of Frozenbits_generator_TV).
+class Frozenbits_cache
+{
+protected:
+	typedef std::pair<std::string, std::vector<bool>> entry_t;
+
+	std::mutex mtx;
+	size_t capacity;
+	std::string directory;
+	std::list<entry_t> lru; // the most recently used first
+	std::unordered_map<std::string, std::list<entry_t>::iterator> index;
+	size_t n_hits;
+	size_t n_misses;
+
+public:
+	explicit Frozenbits_cache(const size_t capacity = 256, const std::string& directory = "");
+	virtual ~Frozenbits_cache() = default;
+
+	// Fills 'frozen_bits' from the cache or with 'generator.generate' (then the result is cached).
+	void generate(Frozenbits_generator& generator, std::vector<bool>& frozen_bits, const std::string& tag = "");
+
+	static std::string get_key(const Frozenbits_generator& generator, const std::string& tag = "");
+
+	void   clear();
+	size_t size();
+	size_t get_n_hits();
+	size_t get_n_misses();
+	void   set_capacity(const size_t capacity);
+	size_t get_capacity();
+	void   set_directory(const std::string& directory);
+	const std::string& get_directory() const;
+
+protected:
+	bool lookup(const std::string& key, std::vector<bool>& frozen_bits);
+	void insert(const std::string& key, const std::vector<bool>& frozen_bits);
+	bool load(const std::string& key, std::vector<bool>& frozen_bits) const;
+	bool save(const std::string& key, const std::vector<bool>& frozen_bits) const; // best-effort, warns on failure
+	std::string get_path(const std::string& key) const;
+};
+}
+}
+
+#endif /* FROZENBITS_CACHE_HPP_ */
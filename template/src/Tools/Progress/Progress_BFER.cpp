@@ -0,0 +1,111 @@
+#include <sstream>
+
+#include "Tools/Progress/Progress_BFER.hpp"
+
+using namespace aff3ct;
+using namespace aff3ct::tools;
+
+Progress_BFER
+::Progress_BFER(tools::Monitor_reduction<module::Monitor_BFER<>>& reduction, const callback_t& callback,
+                const std::chrono::nanoseconds period)
+: reduction(reduction), callback(callback), period(period), running(false), t_start(std::chrono::steady_clock::now())
+{
+	if (period.count() <= 0)
+	{
+		std::stringstream message;
+		message << "'period' has to be greater than 0 ('period' = " << period.count() << " ns).";
+		throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
+	}
+}
+
+Progress_BFER
+::~Progress_BFER()
+{
+	if (this->reporter.joinable())
+	{
+		{
+			std::lock_guard<std::mutex> lock(this->mtx);
+			this->running = false;
+		}
+		this->cv.notify_all();
+		this->reporter.join();
+	}
+}
+
+void Progress_BFER
+::start()
+{
+	if (this->reporter.joinable())
+	{
+		std::stringstream message;
+		message << "The progress reporter is already running.";
+		throw tools::runtime_error(__FILE__, __LINE__, __func__, message.str());
+	}
+
+	this->error   = nullptr;
+	this->running = true;
+	this->t_start = std::chrono::steady_clock::now();
+	this->reporter = std::thread(&Progress_BFER::report_loop, this);
+}
+
+void Progress_BFER
+::stop()
+{
+	if (!this->reporter.joinable())
+		return;
+
+	{
+		std::lock_guard<std::mutex> lock(this->mtx);
+		this->running = false;
+	}
+	this->cv.notify_all();
+	this->reporter.join();
+
+	if (this->error)
+	{
+		auto e = this->error;
+		this->error = nullptr;
+		std::rethrow_exception(e);
+	}
+}
+
+bool Progress_BFER
+::is_running() const
+{
+	return this->reporter.joinable();
+}
+
+Progress_BFER::Snapshot Progress_BFER
+::get_snapshot() const
+{
+	Snapshot s;
+	s.n_fra      = this->reduction.get_n_analyzed_fra();
+	s.n_fe       = this->reduction.get_n_fe();
+	s.n_be       = this->reduction.get_n_be();
+	s.elapsed    = std::chrono::duration<double>(std::chrono::steady_clock::now() - this->t_start).count();
+	s.throughput = s.elapsed > 0. ? (double)s.n_fra * (double)this->reduction.get_K() / s.elapsed * 1e-6 : 0.;
+	return s;
+}
+
+void Progress_BFER
+::report_loop()
+{
+	try
+	{
+		std::unique_lock<std::mutex> lock(this->mtx);
+		auto last = false;
+		while (!last)
+		{
+			last = this->cv.wait_for(lock, this->period, [this]() { return !this->running; });
+
+			lock.unlock();
+			this->reduction.reduce(false, true);
+			this->callback(this->get_snapshot());
+			lock.lock();
+		}
+	}
+	catch (...)
+	{
+		this->error = std::current_exception();
+	}
+}
@@ -0,0 +1,61 @@
+#ifndef PROGRESS_BFER_HPP_
+#define PROGRESS_BFER_HPP_
+
+#include <mutex>
+#include <chrono>
+#include <thread>
+#include <exception>
+#include <functional>
+#include <condition_variable>
+#include <aff3ct.hpp>
+
+namespace aff3ct
+{
+namespace tools
+{
+class Progress_BFER
+{
+public:
+	struct Snapshot
+	{
+		unsigned long long n_fra;
+		unsigned long long n_fe;
+		unsigned long long n_be;
+		double             elapsed;    // in seconds from the start of the reporter
+		double             throughput; // in information Mbps
+	};
+
+	typedef std::function<void(const Snapshot&)> callback_t;
+
+protected:
+	tools::Monitor_reduction<module::Monitor_BFER<>>& reduction;
+	callback_t callback;
+	const std::chrono::nanoseconds period;
+
+	std::thread             reporter;
+	std::mutex              mtx;
+	std::condition_variable cv;
+	bool                    running;
+	std::exception_ptr      error;
+	std::chrono::steady_clock::time_point t_start;
+
+public:
+	Progress_BFER(tools::Monitor_reduction<module::Monitor_BFER<>>& reduction, const callback_t& callback,
+	              const std::chrono::nanoseconds period = std::chrono::milliseconds(100));
+	virtual ~Progress_BFER();
+
+	// Starts the background thread that reduces the monitors and calls the callback every 'period'.
+	void start();
+	// Stops the background thread (a last snapshot is reported) and rethrows the exception of the callback, if any.
+	void stop();
+	bool is_running() const;
+
+	Snapshot get_snapshot() const;
+
+protected:
+	void report_loop();
+};
+}
+}
+
+#endif /* PROGRESS_BFER_HPP_ */
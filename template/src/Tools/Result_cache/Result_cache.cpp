@@ -0,0 +1,147 @@
+#include <algorithm>
+#include <iostream>
+#include <sstream>
+#include <fstream>
+#include <iomanip>
+#include <random>
+#include <atomic>
+#include <cstdio>
+#include <cstring>
+#include <vector>
+#ifdef _WIN32
+#include <process.h>
+#define getpid _getpid
+#else
+#include <unistd.h>
+#endif
+#include <aff3ct.hpp>
+
+#include "Tools/Result_cache/Result_cache.hpp"
+
+using namespace aff3ct;
+using namespace aff3ct::tools;
+
+Result_cache
+::Result_cache(const std::string& directory)
+: directory(directory)
+{
+	if (directory.empty())
+	{
+		std::stringstream message;
+		message << "'directory' should not be empty.";
+		throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
+	}
+}
+
+uint64_t Result_cache
+::hash(const std::string& key)
+{
+	uint64_t h = 14695981039346656037ull;
+	for (auto c : key)
+	{
+		h ^= (uint64_t)(unsigned char)c;
+		h *= 1099511628211ull;
+	}
+	return h;
+}
+
+std::string Result_cache
+::get_tmp_path(const std::string& path)
+{
+	// the pid separates the processes sharing the directory, the random part and the counter the threads of a process
+	static std::atomic<unsigned> counter(0);
+	std::random_device rd;
+	std::stringstream tmp_path;
+	tmp_path << path << "." << getpid() << "." << std::hex << rd() << "." << counter++ << ".tmp";
+	return tmp_path.str();
+}
+
+std::string Result_cache
+::get_path(const std::string& key) const
+{
+	std::stringstream path;
+	path << this->directory << "/" << std::hex << std::setw(16) << std::setfill('0') << Result_cache::hash(key)
+	     << ".res";
+	return path.str();
+}
+
+const std::string& Result_cache
+::get_directory() const
+{
+	return this->directory;
+}
+
+bool Result_cache
+::load(const std::string& key, Entry& entry) const
+{
+	std::ifstream f(this->get_path(key), std::ios::in | std::ios::binary);
+	if (!f.is_open())
+		return false;
+
+	char magic[8];
+	uint32_t version = 0;
+	uint64_t key_size = 0;
+	f.read(magic, sizeof(magic));
+	f.read((char*)&version,  sizeof(version ));
+	f.read((char*)&key_size, sizeof(key_size));
+	if (!f || std::strncmp(magic, "AFF3CTRC", 8) != 0 || version != 1 || key_size != key.size())
+		return false;
+
+	std::vector<char> stored_key(key_size);
+	f.read(stored_key.data(), key_size);
+	if (!f || !std::equal(stored_key.begin(), stored_key.end(), key.begin()))
+		return false; // hash collision
+
+	Entry e;
+	f.read((char*)&e.n_fra,   sizeof(e.n_fra  ));
+	f.read((char*)&e.n_be,    sizeof(e.n_be   ));
+	f.read((char*)&e.n_fe,    sizeof(e.n_fe   ));
+	f.read((char*)&e.elapsed, sizeof(e.elapsed));
+	f.read((char*)&e.n_runs,  sizeof(e.n_runs ));
+	if (!f)
+		return false;
+
+	entry = e;
+	return true;
+}
+
+bool Result_cache
+::save(const std::string& key, const Entry& entry) const
+{
+	// Layout: "AFF3CTRC", uint32 version, uint64 key size, key, uint64 n_fra, uint64 n_be, uint64 n_fe,
+	// double elapsed, uint32 n_runs
+	const std::string path = this->get_path(key);
+	const std::string tmp_path = Result_cache::get_tmp_path(path);
+	bool written;
+	{
+		std::ofstream f(tmp_path, std::ios::out | std::ios::binary | std::ios::trunc);
+		if (!f.is_open())
+		{
+			std::clog << rang::tag::warning << "Can't open '" + tmp_path + "' file, the result is not cached."
+			          << std::endl;
+			return false;
+		}
+
+		const uint32_t version = 1;
+		const uint64_t key_size = (uint64_t)key.size();
+		f.write("AFF3CTRC", 8);
+		f.write((const char*)&version,       sizeof(version      ));
+		f.write((const char*)&key_size,      sizeof(key_size     ));
+		f.write(key.data(), key.size());
+		f.write((const char*)&entry.n_fra,   sizeof(entry.n_fra  ));
+		f.write((const char*)&entry.n_be,    sizeof(entry.n_be   ));
+		f.write((const char*)&entry.n_fe,    sizeof(entry.n_fe   ));
+		f.write((const char*)&entry.elapsed, sizeof(entry.elapsed));
+		f.write((const char*)&entry.n_runs,  sizeof(entry.n_runs ));
+		f.close();
+		written = !f.fail();
+	}
+
+	if (!written || std::rename(tmp_path.c_str(), path.c_str()) != 0)
+	{
+		std::remove(tmp_path.c_str());
+		std::clog << rang::tag::warning << "Can't write '" + path + "' file, the result is not cached." << std::endl;
+		return false;
+	}
+	return true;
+}
@@ -0,0 +1,44 @@
+#ifndef RESULT_CACHE_HPP_
+#define RESULT_CACHE_HPP_
+
+#include <string>
+#include <cstdint>
+
+namespace aff3ct
+{
+namespace tools
+{
+// Store of simulation results on disk: one file per key in 'directory', named after the hash of the key. The key is
+// also saved in the file to detect the collisions.
+class Result_cache
+{
+public:
+	struct Entry
+	{
+		unsigned long long n_fra;
+		unsigned long long n_be;
+		unsigned long long n_fe;
+		double             elapsed; // in seconds
+		uint32_t           n_runs;  // number of simulations that contributed to the counters
+	};
+
+protected:
+	const std::string directory;
+
+public:
+	explicit Result_cache(const std::string& directory);
+	virtual ~Result_cache() = default;
+
+	bool load(const std::string& key, Entry& entry) const;
+	bool save(const std::string& key, const Entry& entry) const; // best-effort: warns and returns false on failure
+
+	std::string get_path(const std::string& key) const;
+	const std::string& get_directory() const;
+
+	static uint64_t hash(const std::string& key); // 64-bit FNV-1a
+	static std::string get_tmp_path(const std::string& path); // unique among the processes and the threads
+};
+}
+}
+
+#endif /* RESULT_CACHE_HPP_ */
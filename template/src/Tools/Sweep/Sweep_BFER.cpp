@@ -0,0 +1,467 @@
+#include <algorithm>
+#include <atomic>
+#include <thread>
+#include <exception>
+#include <sstream>
+#include <fstream>
+#include <cstdio>
+#include <cstring>
+#include <limits>
+
+#include "Tools/Sweep/Sweep_BFER.hpp"
+
+using namespace aff3ct;
+using namespace aff3ct::tools;
+
+Sweep_BFER
+::Sweep_BFER(tools::Sequence& sequence, module::Monitor_BFER_AR<>& monitor,
+             const std::vector<std::pair<float*, size_t>>& noise_buffers, const unsigned long long max_fe,
+             const unsigned long long max_n_frames, const double max_time)
+: exec([&sequence](std::function<bool()> stop_condition) { sequence.exec(stop_condition); }),
+  monitor(monitor), noise_buffers(noise_buffers), max_fe(max_fe), max_n_frames(max_n_frames),
+  max_time(std::chrono::nanoseconds((long long)(max_time * 1e9))), ckpt_period(0), ckpt_seed(0), ckpt_epoch(0),
+  ckpt_resume(), ckpt_resuming(false), ckpt_in_point(false), ckpt_noise(0.f), ckpt_next(0)
+{
+	this->add_chain(sequence);
+}
+
+Sweep_BFER
+::Sweep_BFER(tools::Pipeline& pipeline, module::Monitor_BFER_AR<>& monitor,
+             const std::vector<std::pair<float*, size_t>>& noise_buffers, const unsigned long long max_fe,
+             const unsigned long long max_n_frames, const double max_time)
+: exec([&pipeline](std::function<bool()> stop_condition) { pipeline.exec(stop_condition); }),
+  monitor(monitor), noise_buffers(noise_buffers), max_fe(max_fe), max_n_frames(max_n_frames),
+  max_time(std::chrono::nanoseconds((long long)(max_time * 1e9))), ckpt_period(0), ckpt_seed(0), ckpt_epoch(0),
+  ckpt_resume(), ckpt_resuming(false), ckpt_in_point(false), ckpt_noise(0.f), ckpt_next(0)
+{
+	for (auto& stage : pipeline.get_stages())
+		this->add_chain(*stage);
+}
+
+std::vector<Sweep_BFER::Point> Sweep_BFER
+::run(const std::vector<float>& noise)
+{
+	this->ckpt_points.clear();
+	this->ckpt_resuming = false;
+	if (!this->ckpt_file.empty())
+	{
+		this->load_checkpoint(noise);
+		for (size_t i = 0; i < this->seeders.size(); i++)
+			this->seeders[i]->set_seed(this->ckpt_seed + (int)(i + this->seeders.size() * this->ckpt_epoch));
+		this->ckpt_epoch++;
+	}
+
+	for (auto p = this->ckpt_points.size(); p < noise.size(); p++)
+	{
+		const auto point = this->run_point(noise[p]);
+		std::lock_guard<std::mutex> lock(this->ckpt_mtx);
+		this->ckpt_points.push_back(point);
+		if (!this->ckpt_file.empty())
+			this->write_checkpoint();
+	}
+
+	return this->ckpt_points;
+}
+
+std::vector<Sweep_BFER::Point> Sweep_BFER
+::run_concurrent(const std::vector<Sweep_BFER*>& sweeps, const std::vector<float>& noise)
+{
+	if (sweeps.size() == 0)
+	{
+		std::stringstream message;
+		message << "'sweeps' should not be empty.";
+		throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
+	}
+
+	for (size_t i = 0; i < sweeps.size(); i++)
+		for (size_t j = i +1; j < sweeps.size(); j++)
+			if (&sweeps[i]->monitor == &sweeps[j]->monitor)
+			{
+				std::stringstream message;
+				message << "The sweeps " << i << " and " << j << " share the same monitor.";
+				throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
+			}
+
+	std::vector<Point> points(noise.size());
+	std::vector<std::exception_ptr> errors(sweeps.size());
+	std::atomic<size_t> next(0);
+
+	std::vector<std::thread> threads;
+	for (size_t s = 0; s < sweeps.size(); s++)
+		threads.push_back(std::thread([&, s]()
+		{
+			try
+			{
+				for (size_t p = next++; p < noise.size(); p = next++)
+					points[p] = sweeps[s]->run_point(noise[p]);
+			}
+			catch (...)
+			{
+				errors[s] = std::current_exception();
+				next = noise.size(); // stop the other sweeps after their current point
+			}
+		}));
+
+	for (auto& t : threads)
+		t.join();
+
+	for (auto& e : errors)
+		if (e)
+			std::rethrow_exception(e);
+
+	return points;
+}
+
+Sweep_BFER::Point Sweep_BFER
+::run_point(const float noise)
+{
+	this->monitor.reset();
+	this->set_noise(noise);
+
+	auto t_start = std::chrono::steady_clock::now();
+	const bool resumed = this->ckpt_resuming && this->ckpt_resume.noise == noise;
+	if (resumed)
+	{
+		// continue the point of the checkpoint: its counters and its duration are accounted for
+		this->monitor.collect(this->ckpt_resume.n_fra, this->ckpt_resume.n_fe, this->ckpt_resume.n_be);
+		t_start -= std::chrono::duration_cast<std::chrono::steady_clock::duration>(
+			std::chrono::duration<double>(this->ckpt_resume.elapsed));
+	}
+	this->ckpt_resuming = false;
+
+	std::string key;
+	tools::Result_cache::Entry entry = {0, 0, 0, 0., 0};
+	if (this->cache)
+	{
+		key = this->get_point_key(noise);
+		if (!this->cache->load(key, entry))
+			entry = {0, 0, 0, 0., 0};
+		else if (!resumed)
+		{
+			this->monitor.collect(entry.n_fra, entry.n_fe, entry.n_be);
+			t_start -= std::chrono::duration_cast<std::chrono::steady_clock::duration>(
+				std::chrono::duration<double>(entry.elapsed));
+		}
+		// else the counters of the checkpoint already include the ones of the entry (collected by the interrupted
+		// run), only its number of runs is kept
+
+		// each run on a point uses its own seeds, a continued point does not replay the frames already counted: with a
+		// checkpoint, the seed and the run number of the checkpoint are mixed in (the interrupted run and the resumed
+		// one see the same entry)
+		std::string seed_key = key;
+		if (!this->ckpt_file.empty())
+			seed_key += "ckpt_seed=" + std::to_string(this->ckpt_seed) + " epoch=" + std::to_string(this->ckpt_epoch);
+		const auto seed = (int)(tools::Result_cache::hash(seed_key) & 0x7FFFFFFF);
+		for (size_t i = 0; i < this->seeders.size(); i++)
+			this->seeders[i]->set_seed(seed + (int)(i + this->seeders.size() * entry.n_runs));
+	}
+
+	{
+		std::lock_guard<std::mutex> lock(this->ckpt_mtx);
+		this->ckpt_noise    = noise;
+		this->ckpt_t_point  = t_start;
+		this->ckpt_in_point = true;
+		this->ckpt_next     = (std::chrono::steady_clock::now() + this->ckpt_period).time_since_epoch().count();
+	}
+
+	const auto cached = this->cache && !resumed && entry.n_runs && this->is_point_done(t_start);
+	if (!cached)
+		this->exec([this, t_start]() { this->tick_checkpoint(); return this->is_point_done(t_start); });
+	const std::chrono::duration<double> elapsed = cached ? std::chrono::duration<double>(entry.elapsed) :
+	                                                       std::chrono::steady_clock::now() - t_start;
+
+	{
+		std::lock_guard<std::mutex> lock(this->ckpt_mtx);
+		this->ckpt_in_point = false;
+	}
+
+	if (this->ckpt_error)
+	{
+		auto e = this->ckpt_error;
+		this->ckpt_error = nullptr;
+		std::rethrow_exception(e);
+	}
+
+	if (this->cache && !cached)
+		this->cache->save(key, {this->monitor.get_n_analyzed_fra(),
+		                        this->monitor.get_n_be(),
+		                        this->monitor.get_n_fe(),
+		                        elapsed.count(),
+		                        entry.n_runs + 1});
+
+	return {noise,
+	        this->monitor.get_n_analyzed_fra(),
+	        this->monitor.get_n_be(),
+	        this->monitor.get_n_fe(),
+	        this->monitor.get_ber(),
+	        this->monitor.get_fer(),
+	        elapsed.count()};
+}
+
+const module::Monitor_BFER_AR<>& Sweep_BFER
+::get_monitor() const
+{
+	return this->monitor;
+}
+
+void Sweep_BFER
+::set_noise(const float noise)
+{
+	for (auto& b : this->noise_buffers)
+		std::fill(b.first, b.first + b.second, noise);
+}
+
+bool Sweep_BFER
+::is_point_done(const std::chrono::steady_clock::time_point& t_start) const
+{
+	// called concurrently by the threads of the sequence: only reads the atomic counters of the monitor
+	return this->monitor.is_done() ||
+	       (this->max_fe       != 0 && this->monitor.get_n_fe()           >= this->max_fe      ) ||
+	       (this->max_n_frames != 0 && this->monitor.get_n_analyzed_fra() >= this->max_n_frames) ||
+	       (this->max_time.count() != 0 && std::chrono::steady_clock::now() - t_start >= this->max_time);
+}
+
+void Sweep_BFER
+::add_chain(tools::Sequence& sequence)
+{
+	for (auto m : sequence.get_modules<tools::Interface_set_seed>())
+		this->seeders.push_back(m);
+
+	// the tasks of the first thread are enough, the other threads run clones
+	std::stringstream signature;
+	signature << "stage" << "\n";
+	const auto tasks_per_threads = sequence.get_tasks_per_threads();
+	if (tasks_per_threads.size())
+		for (auto t : tasks_per_threads[0])
+		{
+			const auto n_frames = t->get_module().get_n_frames();
+			signature << t->get_module().get_name() << "::" << t->get_name();
+			for (auto& s : t->sockets)
+				signature << " " << s->get_name() << ":" << s->get_datatype_string()
+				          << "[" << s->get_n_elmts() / n_frames << "]";
+			signature << "\n";
+		}
+	this->chain_signature += signature.str();
+}
+
+void Sweep_BFER
+::set_cache(const std::string& directory, const std::string& config)
+{
+	this->cache.reset(directory.empty() ? nullptr : new tools::Result_cache(directory));
+	this->cache_config = config;
+}
+
+std::string Sweep_BFER
+::get_point_key(const float noise) const
+{
+	std::stringstream key;
+	key << this->chain_signature
+	    << "monitor K=" << this->monitor.get_K() << " unk=" << this->monitor.get_count_unknown_values() << "\n"
+	    << "config=" << this->cache_config << "\n"
+	    << "noise=" << std::hexfloat << noise << "\n";
+	return key.str();
+}
+
+bool Sweep_BFER
+::get_cache_entry(const float noise, tools::Result_cache::Entry& entry) const
+{
+	return this->cache && this->cache->load(this->get_point_key(noise), entry);
+}
+
+void Sweep_BFER
+::set_checkpoint(const std::string& file_name, const double period, const int seed)
+{
+	if (period <= 0.)
+	{
+		std::stringstream message;
+		message << "'period' has to be greater than 0 ('period' = " << period << ").";
+		throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
+	}
+
+	std::lock_guard<std::mutex> lock(this->ckpt_mtx);
+	this->ckpt_file   = file_name;
+	this->ckpt_period = std::chrono::nanoseconds((long long)(period * 1e9));
+	this->ckpt_seed   = seed;
+	this->ckpt_epoch  = 0;
+}
+
+void Sweep_BFER
+::save_checkpoint()
+{
+	std::lock_guard<std::mutex> lock(this->ckpt_mtx);
+	if (!this->ckpt_file.empty())
+		this->write_checkpoint();
+}
+
+void Sweep_BFER
+::tick_checkpoint()
+{
+	// called concurrently by the threads of the chain: the first thread after the deadline saves the checkpoint
+	if (this->ckpt_file.empty())
+		return;
+
+	const auto now = std::chrono::steady_clock::now();
+	if (now.time_since_epoch().count() < this->ckpt_next.load(std::memory_order_relaxed))
+		return;
+
+	std::unique_lock<std::mutex> lock(this->ckpt_mtx, std::try_to_lock);
+	if (!lock.owns_lock() || now.time_since_epoch().count() < this->ckpt_next.load(std::memory_order_relaxed))
+		return;
+
+	this->ckpt_next = (now + this->ckpt_period).time_since_epoch().count();
+	try
+	{
+		this->write_checkpoint();
+	}
+	catch (...)
+	{
+		// rethrown by 'run_point' when the chain has stopped
+		this->ckpt_error = std::current_exception();
+		this->ckpt_next = std::numeric_limits<long long>::max();
+	}
+}
+
+static void write_point(std::ofstream& f, const Sweep_BFER::Point& p)
+{
+	f.write((const char*)&p.noise,   sizeof(p.noise  ));
+	f.write((const char*)&p.n_fra,   sizeof(p.n_fra  ));
+	f.write((const char*)&p.n_be,    sizeof(p.n_be   ));
+	f.write((const char*)&p.n_fe,    sizeof(p.n_fe   ));
+	f.write((const char*)&p.ber,     sizeof(p.ber    ));
+	f.write((const char*)&p.fer,     sizeof(p.fer    ));
+	f.write((const char*)&p.elapsed, sizeof(p.elapsed));
+}
+
+static void read_point(std::ifstream& f, Sweep_BFER::Point& p)
+{
+	f.read((char*)&p.noise,   sizeof(p.noise  ));
+	f.read((char*)&p.n_fra,   sizeof(p.n_fra  ));
+	f.read((char*)&p.n_be,    sizeof(p.n_be   ));
+	f.read((char*)&p.n_fe,    sizeof(p.n_fe   ));
+	f.read((char*)&p.ber,     sizeof(p.ber    ));
+	f.read((char*)&p.fer,     sizeof(p.fer    ));
+	f.read((char*)&p.elapsed, sizeof(p.elapsed));
+}
+
+void Sweep_BFER
+::write_checkpoint() const
+{
+	// Layout: "AFF3CTCK", uint32 version, int32 seed, uint32 n_runs, uint64 n_points, n_points x point,
+	// uint8 in_point, [point in progress]
+	// with point = (float noise, uint64 n_fra, uint64 n_be, uint64 n_fe, float ber, float fer, double elapsed)
+	const std::string tmp_name = Result_cache::get_tmp_path(this->ckpt_file);
+	bool written;
+	{
+		std::ofstream f(tmp_name, std::ios::out | std::ios::binary | std::ios::trunc);
+		if (!f.is_open())
+		{
+			std::stringstream message;
+			message << "Can't open '" + tmp_name + "' file.";
+			throw tools::runtime_error(__FILE__, __LINE__, __func__, message.str());
+		}
+
+		const uint32_t version = 1;
+		const int32_t  seed = (int32_t)this->ckpt_seed;
+		const uint64_t n_points = (uint64_t)this->ckpt_points.size();
+		const uint8_t  in_point = this->ckpt_in_point ? 1 : 0;
+		f.write("AFF3CTCK", 8);
+		f.write((const char*)&version,          sizeof(version         ));
+		f.write((const char*)&seed,             sizeof(seed            ));
+		f.write((const char*)&this->ckpt_epoch, sizeof(this->ckpt_epoch));
+		f.write((const char*)&n_points,         sizeof(n_points        ));
+		for (auto& p : this->ckpt_points)
+			write_point(f, p);
+		f.write((const char*)&in_point, sizeof(in_point));
+		if (in_point)
+		{
+			const std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - this->ckpt_t_point;
+			write_point(f, {this->ckpt_noise,
+			                this->monitor.get_n_analyzed_fra(),
+			                this->monitor.get_n_be(),
+			                this->monitor.get_n_fe(),
+			                this->monitor.get_ber(),
+			                this->monitor.get_fer(),
+			                elapsed.count()});
+		}
+		f.close();
+		written = !f.fail();
+	}
+
+	// the previous checkpoint is only replaced by a complete file
+	if (!written || std::rename(tmp_name.c_str(), this->ckpt_file.c_str()) != 0)
+	{
+		std::remove(tmp_name.c_str());
+		std::stringstream message;
+		message << "Can't write '" + this->ckpt_file + "' file.";
+		throw tools::runtime_error(__FILE__, __LINE__, __func__, message.str());
+	}
+}
+
+void Sweep_BFER
+::load_checkpoint(const std::vector<float>& noise)
+{
+	std::ifstream f(this->ckpt_file, std::ios::in | std::ios::binary);
+	if (!f.is_open())
+		return; // nothing to resume
+
+	char magic[8];
+	uint32_t version = 0;
+	int32_t seed = 0;
+	uint32_t epoch = 0;
+	uint64_t n_points = 0;
+	f.read(magic, sizeof(magic));
+	f.read((char*)&version,  sizeof(version ));
+	f.read((char*)&seed,     sizeof(seed    ));
+	f.read((char*)&epoch,    sizeof(epoch   ));
+	f.read((char*)&n_points, sizeof(n_points));
+	if (!f || std::strncmp(magic, "AFF3CTCK", 8) != 0 || version != 1)
+	{
+		std::stringstream message;
+		message << "'" << this->ckpt_file << "' is not a valid checkpoint file.";
+		throw tools::runtime_error(__FILE__, __LINE__, __func__, message.str());
+	}
+
+	// the number of points comes from the file: check it against the remaining bytes before allocating
+	const uint64_t point_size = sizeof(Point::noise) + 3 * sizeof(Point::n_fra) + 2 * sizeof(Point::ber)
+	                          + sizeof(Point::elapsed);
+	const std::streamoff pos = f.tellg();
+	f.seekg(0, std::ios::end);
+	const uint64_t remaining = (uint64_t)(f.tellg() - pos);
+	f.seekg(pos);
+	if (n_points > remaining / point_size)
+	{
+		std::stringstream message;
+		message << "'" << this->ckpt_file << "' is truncated.";
+		throw tools::runtime_error(__FILE__, __LINE__, __func__, message.str());
+	}
+
+	std::vector<Point> points((size_t)n_points);
+	for (auto& p : points)
+		read_point(f, p);
+	uint8_t in_point = 0;
+	f.read((char*)&in_point, sizeof(in_point));
+	Point resume = {};
+	if (in_point)
+		read_point(f, resume);
+
+	if (!f)
+	{
+		std::stringstream message;
+		message << "'" << this->ckpt_file << "' is truncated.";
+		throw tools::runtime_error(__FILE__, __LINE__, __func__, message.str());
+	}
+
+	if (points.size() > noise.size() || !std::equal(points.begin(), points.end(), noise.begin(),
+	                                                 [](const Point& p, const float n) { return p.noise == n; }))
+	{
+		std::stringstream message;
+		message << "The points of '" << this->ckpt_file << "' do not match the 'noise' values.";
+		throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
+	}
+
+	this->ckpt_seed     = (int)seed;
+	this->ckpt_epoch    = epoch;
+	this->ckpt_points   = points;
+	this->ckpt_resume   = resume;
+	this->ckpt_resuming = in_point != 0;
+}
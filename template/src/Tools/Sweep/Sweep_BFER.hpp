@@ -0,0 +1,118 @@
+#ifndef SWEEP_BFER_HPP_
+#define SWEEP_BFER_HPP_
+
+#include <string>
+#include <memory>
+#include <vector>
+#include <chrono>
+#include <mutex>
+#include <atomic>
+#include <cstdint>
+#include <exception>
+#include <functional>
+#include <aff3ct.hpp>
+
+#include "Module/Monitor/BFER_AR/Monitor_BFER_AR.hpp"
+#include "Tools/Result_cache/Result_cache.hpp"
+
+namespace aff3ct
+{
+namespace tools
+{
+class Sweep_BFER
+{
+public:
+	struct Point
+	{
+		float              noise;
+		unsigned long long n_fra;
+		unsigned long long n_be;
+		unsigned long long n_fe;
+		float              ber;
+		float              fer;
+		double             elapsed; // in seconds
+	};
+
+protected:
+	std::function<void(std::function<bool()>)> exec;
+	module::Monitor_BFER_AR<>& monitor;
+	std::vector<std::pair<float*, size_t>> noise_buffers; // the arrays bound to the noise ('CP') sockets
+	const unsigned long long max_fe;
+	const unsigned long long max_n_frames;
+	const std::chrono::nanoseconds max_time;
+
+	std::vector<tools::Interface_set_seed*> seeders; // the modules of the chain with a PRNG
+	std::string chain_signature; // the modules, tasks and sockets of the chain
+
+	std::shared_ptr<tools::Result_cache> cache;
+	std::string cache_config; // the description of the chain given by the user (parameters, frozen bits, ...)
+
+	// checkpointing, see 'set_checkpoint'
+	std::string              ckpt_file;
+	std::chrono::nanoseconds ckpt_period;
+	int                      ckpt_seed;
+	uint32_t                 ckpt_epoch;    // number of runs (first run and resumes) on the checkpoint
+	std::vector<Point>       ckpt_points;   // the points already done in the current 'run'
+	Point                    ckpt_resume;   // the partial point to continue (if 'ckpt_resuming')
+	bool                     ckpt_resuming;
+	bool                     ckpt_in_point; // a point is in progress
+	float                    ckpt_noise;    // the noise of the point in progress
+	std::chrono::steady_clock::time_point ckpt_t_point; // the start of the point in progress (previous runs included)
+	std::atomic<long long>   ckpt_next;     // the date of the next save, in steady clock nanoseconds
+	std::mutex               ckpt_mtx;
+	std::exception_ptr       ckpt_error;    // the error of a save made by a thread of the chain
+
+public:
+	Sweep_BFER(tools::Sequence& sequence, module::Monitor_BFER_AR<>& monitor,
+	           const std::vector<std::pair<float*, size_t>>& noise_buffers, const unsigned long long max_fe = 0,
+	           const unsigned long long max_n_frames = 0, const double max_time = 0.);
+	Sweep_BFER(tools::Pipeline& pipeline, module::Monitor_BFER_AR<>& monitor,
+	           const std::vector<std::pair<float*, size_t>>& noise_buffers, const unsigned long long max_fe = 0,
+	           const unsigned long long max_n_frames = 0, const double max_time = 0.);
+	virtual ~Sweep_BFER() = default;
+
+	std::vector<Point> run(const std::vector<float>& noise);
+	virtual Point run_point(const float noise);
+
+	// Simulates the 'noise' points concurrently: each sweep (with its own chain, monitor and noise buffers) runs in
+	// its own thread and takes the next point to simulate as soon as its current point is done. A point is never split
+	// between the sweeps: at the end of the sweep, the threads without a point left are idle.
+	static std::vector<Point> run_concurrent(const std::vector<Sweep_BFER*>& sweeps, const std::vector<float>& noise);
+
+	const module::Monitor_BFER_AR<>& get_monitor() const;
+
+	/*!
+	 * \brief Saves the state of 'run' in 'file_name' every 'period' seconds (the points done, the counters of the point
+	 * in progress and the number of runs on the file). When 'file_name' already exists, the next 'run' resumes from it:
+	 * the points done are not simulated again and the saved counters are collected by the monitor. The PRNGs of the
+	 * chain are seeded from 'seed' (the one of the file when resuming) and the number of runs: a resumed run does not
+	 * replay the frames already simulated.
+	 * An empty 'file_name' disables the checkpointing.
+	 */
+	void set_checkpoint(const std::string& file_name, const double period = 60., const int seed = 0);
+	void save_checkpoint();
+
+	/*!
+	 * \brief Looks up the points in a result cache before simulating them. The key of a point is made of the signature
+	 * of the chain (modules, tasks, sockets), of 'config' (the parameters that the signature can't see: constructor
+	 * arguments, frozen bits or H matrix digests...) and of the noise value. The stop criteria are not part of the key:
+	 * a cached point that does not meet them is continued from its counters (with new seeds) instead of restarted.
+	 * An empty 'directory' disables the cache.
+	 */
+	void set_cache(const std::string& directory, const std::string& config = "");
+	std::string get_point_key(const float noise) const;
+	// Returns false if there is no cache or no entry for the 'noise' point.
+	bool get_cache_entry(const float noise, tools::Result_cache::Entry& entry) const;
+
+protected:
+	void set_noise(const float noise);
+	bool is_point_done(const std::chrono::steady_clock::time_point& t_start) const;
+	void tick_checkpoint();
+	void write_checkpoint() const;
+	void load_checkpoint(const std::vector<float>& noise);
+	void add_chain(tools::Sequence& sequence);
+};
+}
+}
+
+#endif /* SWEEP_BFER_HPP_ */
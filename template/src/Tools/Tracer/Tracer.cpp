@@ -0,0 +1,268 @@
+#include <sstream>
+#include <fstream>
+#include <map>
+#include <cstdint>
+
+#include "Tools/Aligned/make_shared_aligned.hpp"
+#include "Module/Task_Publicist/Task_Publicist.hpp"
+#include "Tools/Tracer/Tracer.hpp"
+
+using namespace aff3ct;
+using namespace aff3ct::tools;
+
+namespace
+{
+// the names of the tasks and the custom names of the modules are free strings
+std::string json_escape(const std::string& str)
+{
+	std::stringstream ss;
+	for (const char c : str)
+		switch (c)
+		{
+			case '"':  ss << "\\\""; break;
+			case '\\': ss << "\\\\"; break;
+			case '\n': ss << "\\n";  break;
+			case '\r': ss << "\\r";  break;
+			case '\t': ss << "\\t";  break;
+			default:
+				if ((unsigned char)c < 0x20)
+				{
+					const char* hex = "0123456789abcdef";
+					ss << "\\u00" << hex[(c >> 4) & 0xf] << hex[c & 0xf];
+				}
+				else
+					ss << c;
+		}
+	return ss.str();
+}
+}
+
+Tracer::Buffer
+::Buffer(const size_t capacity, const size_t pid, const size_t tid)
+: events(capacity), head(0), count(0), pid(pid), tid(tid)
+{
+}
+
+std::shared_ptr<Tracer::Buffer> Tracer::Buffer
+::make(const size_t capacity, const size_t pid, const size_t tid)
+{
+	return tools::make_shared_aligned<Buffer>(capacity, pid, tid);
+}
+
+void Tracer::Buffer
+::push(const Event& e)
+{
+	events[head] = e;
+	head = (head + 1) % events.size();
+	if (count < events.size())
+		count++;
+}
+
+Tracer
+::Tracer(tools::Sequence& sequence, const size_t capacity)
+: capacity(capacity), active(false)
+{
+	if (capacity == 0)
+	{
+		std::stringstream message;
+		message << "'capacity' has to be greater than 0.";
+		throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
+	}
+
+	this->add_stage(sequence, 0);
+}
+
+Tracer
+::Tracer(tools::Pipeline& pipeline, const size_t capacity)
+: capacity(capacity), active(false)
+{
+	if (capacity == 0)
+	{
+		std::stringstream message;
+		message << "'capacity' has to be greater than 0.";
+		throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
+	}
+
+	auto stages = pipeline.get_stages();
+	for (size_t s = 0; s < stages.size(); s++)
+		this->add_stage(*stages[s], s);
+}
+
+Tracer
+::~Tracer()
+{
+	this->stop();
+}
+
+void Tracer
+::add_stage(tools::Sequence& sequence, const size_t pid)
+{
+	auto tasks_per_threads = sequence.get_tasks_per_threads();
+	for (size_t tid = 0; tid < tasks_per_threads.size(); tid++)
+	{
+		this->tasks_per_threads.push_back(tasks_per_threads[tid]);
+		this->buffers.push_back(Buffer::make(this->capacity, pid, tid));
+	}
+}
+
+void Tracer
+::start()
+{
+	if (this->active)
+		return;
+
+	this->reset();
+	this->t_start = std::chrono::steady_clock::now();
+	this->codelets.resize(this->tasks_per_threads.size());
+	for (size_t th = 0; th < this->tasks_per_threads.size(); th++)
+	{
+		this->codelets[th].clear();
+		auto buffer = this->buffers[th];
+		auto t_start = this->t_start;
+		for (auto t : this->tasks_per_threads[th])
+		{
+			auto& task = static_cast<module::Task_Publicist&>(*t);
+			codelet_t codelet = task.codelet;
+			this->codelets[th].push_back(codelet);
+			task.codelet = [codelet, buffer, t_start](module::Module &m, module::Task &t, const size_t f) -> int
+			{
+				auto t_begin = std::chrono::steady_clock::now();
+				const int status = codelet(m, t, f);
+				auto t_end = std::chrono::steady_clock::now();
+				buffer->push({&t,
+				              std::chrono::duration_cast<std::chrono::nanoseconds>(t_begin - t_start).count(),
+				              std::chrono::duration_cast<std::chrono::nanoseconds>(t_end   - t_start).count()});
+				return status;
+			};
+		}
+	}
+	this->active = true;
+}
+
+void Tracer
+::stop()
+{
+	if (!this->active)
+		return;
+
+	for (size_t th = 0; th < this->tasks_per_threads.size(); th++)
+		for (size_t i = 0; i < this->tasks_per_threads[th].size(); i++)
+			static_cast<module::Task_Publicist&>(*this->tasks_per_threads[th][i]).codelet = this->codelets[th][i];
+	this->active = false;
+}
+
+void Tracer
+::reset()
+{
+	for (auto& b : this->buffers)
+	{
+		b->head  = 0;
+		b->count = 0;
+	}
+}
+
+bool Tracer
+::is_active() const
+{
+	return this->active;
+}
+
+std::vector<std::vector<Tracer::Event>> Tracer
+::get_events() const
+{
+	std::vector<std::vector<Event>> events(this->buffers.size());
+	for (size_t th = 0; th < this->buffers.size(); th++)
+	{
+		const auto& b = *this->buffers[th];
+		const size_t first = (b.head + b.events.size() - b.count) % b.events.size();
+		for (size_t e = 0; e < b.count; e++)
+			events[th].push_back(b.events[(first + e) % b.events.size()]);
+	}
+	return events;
+}
+
+void Tracer
+::export_chrome_trace(const std::string& file_name) const
+{
+	std::ofstream f(file_name);
+	if (!f.is_open())
+	{
+		std::stringstream message;
+		message << "Can't open '" + file_name + "' file.";
+		throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
+	}
+
+	auto events = this->get_events();
+	f << "{\"displayTimeUnit\":\"ns\",\"traceEvents\":[";
+	bool first = true;
+	for (size_t th = 0; th < events.size(); th++)
+	{
+		const auto pid = this->buffers[th]->pid;
+		const auto tid = this->buffers[th]->tid;
+		f << (first ? "" : ",") << "\n{\"name\":\"thread_name\",\"ph\":\"M\",\"pid\":" << pid << ",\"tid\":" << tid
+		  << ",\"args\":{\"name\":\"stage " << pid << " - thread " << tid << "\"}}";
+		first = false;
+		for (auto& e : events[th])
+			f << ",\n{\"name\":\"" << json_escape(e.task->get_name())
+			  << "\",\"cat\":\"" << json_escape(e.task->get_module().get_custom_name())
+			  << "\",\"ph\":\"X\",\"pid\":" << pid << ",\"tid\":" << tid << std::fixed
+			  << ",\"ts\":" << e.begin * 1e-3 << ",\"dur\":" << (e.end - e.begin) * 1e-3 << "}";
+	}
+	f << "\n]}\n";
+}
+
+void Tracer
+::export_binary(const std::string& file_name) const
+{
+	std::ofstream f(file_name, std::ios::binary);
+	if (!f.is_open())
+	{
+		std::stringstream message;
+		message << "Can't open '" + file_name + "' file.";
+		throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
+	}
+
+	// Layout (little endian on the usual platforms):
+	// "AFF3CTTR", uint32 version, uint32 n_names, n_names x (uint32 length, chars "module::task"),
+	// uint64 n_events, n_events x (uint32 name id, uint32 pid, uint32 tid, int64 begin ns, int64 end ns)
+	auto events = this->get_events();
+	std::map<const module::Task*, uint32_t> ids;
+	std::vector<std::string> names;
+	uint64_t n_events = 0;
+	for (auto& th : events)
+		for (auto& e : th)
+		{
+			if (ids.find(e.task) == ids.end())
+			{
+				ids[e.task] = (uint32_t)names.size();
+				names.push_back(e.task->get_module().get_custom_name() + "::" + e.task->get_name());
+			}
+			n_events++;
+		}
+
+	const uint32_t version = 1, n_names = (uint32_t)names.size();
+	f.write("AFF3CTTR", 8);
+	f.write((const char*)&version, sizeof(version));
+	f.write((const char*)&n_names, sizeof(n_names));
+	for (auto& n : names)
+	{
+		const uint32_t length = (uint32_t)n.size();
+		f.write((const char*)&length, sizeof(length));
+		f.write(n.data(), length);
+	}
+	f.write((const char*)&n_events, sizeof(n_events));
+	for (size_t th = 0; th < events.size(); th++)
+	{
+		const uint32_t pid = (uint32_t)this->buffers[th]->pid;
+		const uint32_t tid = (uint32_t)this->buffers[th]->tid;
+		for (auto& e : events[th])
+		{
+			const uint32_t id = ids[e.task];
+			f.write((const char*)&id,      sizeof(id     ));
+			f.write((const char*)&pid,     sizeof(pid    ));
+			f.write((const char*)&tid,     sizeof(tid    ));
+			f.write((const char*)&e.begin, sizeof(e.begin));
+			f.write((const char*)&e.end,   sizeof(e.end  ));
+		}
+	}
+}
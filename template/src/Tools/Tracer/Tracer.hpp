@@ -0,0 +1,70 @@
+#ifndef TRACER_HPP_
+#define TRACER_HPP_
+
+#include <string>
+#include <vector>
+#include <memory>
+#include <chrono>
+#include <functional>
+#include <aff3ct.hpp>
+
+namespace aff3ct
+{
+namespace tools
+{
+class Tracer
+{
+public:
+	struct Event
+	{
+		const module::Task* task;
+		int64_t             begin; // in nanoseconds from the tracer start
+		int64_t             end;   // in nanoseconds from the tracer start
+	};
+
+protected:
+	// Ring buffer of the events of one thread. Each buffer has a single writer (its thread), the events are read when
+	// the execution is over.
+	struct alignas(64) Buffer
+	{
+		std::vector<Event> events;
+		size_t             head;
+		size_t             count;
+		size_t             pid;
+		size_t             tid;
+
+		Buffer(const size_t capacity, const size_t pid, const size_t tid);
+		static std::shared_ptr<Buffer> make(const size_t capacity, const size_t pid, const size_t tid); // aligned
+		void push(const Event& e);
+	};
+
+	typedef std::function<int(module::Module&, module::Task&, const size_t)> codelet_t;
+
+	const size_t capacity;
+	std::vector<std::vector<module::Task*>> tasks_per_threads;
+	std::vector<std::shared_ptr<Buffer>> buffers;
+	std::vector<std::vector<codelet_t>> codelets;
+	std::chrono::steady_clock::time_point t_start;
+	bool active;
+
+public:
+	Tracer(tools::Sequence& sequence, const size_t capacity = 1 << 16);
+	Tracer(tools::Pipeline& pipeline, const size_t capacity = 1 << 16);
+	virtual ~Tracer();
+
+	void start();
+	void stop();
+	void reset();
+	bool is_active() const;
+
+	std::vector<std::vector<Event>> get_events() const;
+	void export_chrome_trace(const std::string& file_name) const;
+	void export_binary      (const std::string& file_name) const;
+
+protected:
+	void add_stage(tools::Sequence& sequence, const size_t pid);
+};
+}
+}
+
+#endif /* TRACER_HPP_ */
@@ -0,0 +1,104 @@
+#include "Wrapper_py/Lazy_submodule.hpp"
+
+namespace py = pybind11;
+using namespace aff3ct::wrapper;
+
+std::vector<std::shared_ptr<Lazy_submodule::State>>& Lazy_submodule
+::registry()
+{
+	static std::vector<std::shared_ptr<State>> states;
+	return states;
+}
+
+std::shared_ptr<Lazy_submodule::State> Lazy_submodule
+::find(py::handle scope)
+{
+	for (auto& s : registry())
+		if (s->scope == scope.ptr())
+			return s;
+	return nullptr;
+}
+
+void Lazy_submodule
+::load(State& state)
+{
+	if (state.loaded)
+	{
+		if (!state.error.empty())
+			throw py::import_error(state.error);
+		return;
+	}
+	// marked first: a failing loader is not called twice (the classes cannot be registered two times)
+	state.loaded = true;
+	const auto name = py::str(py::handle(state.scope).attr("__name__")).cast<std::string>();
+	try
+	{
+		for (auto d : state.deps)
+			Lazy_submodule::load(py::handle(d));
+		state.loader(py::reinterpret_borrow<py::module_>(state.scope));
+	}
+	catch (const std::exception& e)
+	{
+		state.error = "the classes of the module '" + name + "' could not be registered: " + e.what();
+		throw;
+	}
+}
+
+void Lazy_submodule
+::define(py::module_ scope, const std::vector<py::module_>& deps, const Loader& loader)
+{
+	auto state = std::make_shared<State>();
+	state->scope  = scope.ptr();
+	state->loader = loader;
+	state->loaded = false;
+	for (auto& d : deps)
+		state->deps.push_back(d.ptr());
+	registry().push_back(state);
+
+	py::handle s = scope;
+	scope.def("__getattr__", [state, s](const std::string& name) -> py::object
+	{
+		if (name == "__all__")
+		{
+			Lazy_submodule::load(*state);
+			py::list names;
+			for (auto item : py::dict(s.attr("__dict__")))
+				if (item.first.cast<std::string>().compare(0, 1, "_") != 0)
+					names.append(item.first);
+			names.attr("sort")();
+			return names;
+		}
+		// the other special names are looked up by the import system and by the introspection tools
+		if (name.size() < 2 || name.compare(0, 2, "__") != 0)
+		{
+			Lazy_submodule::load(*state);
+			py::dict attrs = s.attr("__dict__");
+			if (attrs.contains(name))
+				return attrs[name.c_str()];
+		}
+		throw py::attribute_error("module '" + py::str(s.attr("__name__")).cast<std::string>() +
+		                          "' has no attribute '" + name + "'");
+	});
+	scope.def("__dir__", [state, s]()
+	{
+		Lazy_submodule::load(*state);
+		py::list names(s.attr("__dict__"));
+		names.attr("sort")();
+		return names;
+	});
+}
+
+void Lazy_submodule
+::load(py::handle scope)
+{
+	auto state = Lazy_submodule::find(scope);
+	if (state)
+		Lazy_submodule::load(*state);
+}
+
+void Lazy_submodule
+::load_all()
+{
+	for (auto& s : registry())
+		Lazy_submodule::load(*s);
+}
@@ -0,0 +1,53 @@
+#ifndef LAZY_SUBMODULE_HPP_
+#define LAZY_SUBMODULE_HPP_
+
+#include <memory>
+#include <string>
+#include <vector>
+#include <functional>
+#include <pybind11/pybind11.h>
+
+namespace py = pybind11;
+
+namespace aff3ct
+{
+namespace wrapper
+{
+// Defers the registration of the classes of a submodule until one of its attributes is accessed for the first time
+// (PEP 562 module '__getattr__' and '__dir__'). The '__all__' attribute gives the public names for the star imports.
+class Lazy_submodule
+{
+public:
+	using Loader = std::function<void(py::module_)>;
+
+	/*!
+	 * \brief Calls 'loader' on the first access to a missing attribute of 'scope'.
+	 *
+	 * \param scope:  the submodule.
+	 * \param deps:   the lazy submodules to load before 'scope' (e.g. the ones that register the types of the
+	 *                constructor arguments).
+	 * \param loader: the function that registers the classes of 'scope'.
+	 */
+	static void define(py::module_ scope, const std::vector<py::module_>& deps, const Loader& loader);
+
+	static void load    (py::handle scope); // loads 'scope' now (does nothing if already loaded or not lazy)
+	static void load_all();
+
+private:
+	struct State
+	{
+		PyObject*              scope; // borrowed: the submodules live as long as the interpreter
+		std::vector<PyObject*> deps;
+		Loader                 loader;
+		bool                   loaded;
+		std::string            error; // the error of the loader, raised again on the next accesses
+	};
+
+	static std::vector<std::shared_ptr<State>>& registry();
+	static std::shared_ptr<State> find(py::handle scope);
+	static void load(State& state);
+};
+}
+}
+
+#endif //LAZY_SUBMODULE_HPP_
@@ -1,3 +1,5 @@
+#include <algorithm>
+
 #include "Wrapper_py/Module/Monitor/Monitor_BFER_AR/Monitor_BFER_AR.hpp"
 
 namespace py = pybind11;
@@ -26,6 +28,48 @@ void Wrapper_Monitor_BFER_AR<B>
 	this->def("get_n_be"          , &aff3ct::module::Monitor_BFER_AR<B>::get_n_be          );
 	this->def("get_fer"           , &aff3ct::module::Monitor_BFER_AR<B>::get_fer           );
 	this->def("get_ber"           , &aff3ct::module::Monitor_BFER_AR<B>::get_ber           );
+	this->def("get_fer_rel_ci"    , &aff3ct::module::Monitor_BFER_AR<B>::get_fer_rel_ci    );
+	this->def("get_ber_rel_ci"    , &aff3ct::module::Monitor_BFER_AR<B>::get_ber_rel_ci    );
+	this->def("ci_limit_achieved" , &aff3ct::module::Monitor_BFER_AR<B>::ci_limit_achieved );
+	this->def_property("sharded", &aff3ct::module::Monitor_BFER_AR<B>::is_sharded, &aff3ct::module::Monitor_BFER_AR<B>::set_sharded, R"pbdoc(Gives its own counter block to each clone of the monitor (set it before building the sequence).)pbdoc");
+	this->def("set_ci_stop"       , &aff3ct::module::Monitor_BFER_AR<B>::set_ci_stop, R"pbdoc(Stops the simulation when the relative half-width of the FER confidence interval is below 'rel_ci'.
+
+The interval uses the normal approximation at the 'confidence' level. With 'on_ber', the target is also required on
+the BER. 'rel_ci' = 0 disables the criterion. The simulation is not stopped before 'min_fe' wrong frames (and wrong
+bits with 'on_ber').)pbdoc", "rel_ci"_a, "confidence"_a = 0.95f, "on_ber"_a = false, "min_fe"_a = 10);
+
+	this->def("activate_err_histogram", &aff3ct::module::Monitor_BFER_AR<B>::activate_err_histogram, "val"_a = true, R"pbdoc(Activates the error histogram (call it before building the sequence).)pbdoc");
+	this->def("get_err_hist", [](py::object self) -> py::object
+	{
+		static_assert(sizeof(std::atomic<unsigned long long>) == sizeof(uint64_t), "The histogram bins can't be viewed as uint64.");
+		auto& m = self.cast<aff3ct::module::Monitor_BFER_AR<B>&>();
+		if (m.get_err_hist_bins() == nullptr)
+			return py::none();
+
+		py::array_t<uint64_t> hist((size_t)m.get_K() + 1, reinterpret_cast<const uint64_t*>(m.get_err_hist_bins()), self);
+		hist.attr("setflags")("write"_a = false);
+		return hist;
+	}, R"pbdoc(Returns a read-only view of the error histogram of the monitor and of its clones.
+
+The bin 'n' of the K+1 bins counts the wrong frames with 'n' wrong bits, the bin 0 is not counted (it is
+n_analyzed_fra - n_fe). The view is not a copy: it follows the simulation and is valid as long as the monitor lives.
+Returns None if the histogram has not been activated.)pbdoc");
+
+	this->def("activate_frame_errors", &aff3ct::module::Monitor_BFER_AR<B>::activate_frame_errors, "size"_a, R"pbdoc(Records the number of wrong bits of each checked frame in a ring buffer of 'size' elements (0 disables the recording).)pbdoc");
+	this->def("get_n_recorded_frames", &aff3ct::module::Monitor_BFER_AR<B>::get_n_recorded_frames);
+	this->def("get_frame_errors", [](const aff3ct::module::Monitor_BFER_AR<B>& m, const bool ordered) -> py::object
+	{
+		if (m.get_frame_errors_size() == 0)
+			return py::none();
+
+		// a copy: the ring can be reallocated by 'activate_frame_errors'
+		const auto errors = m.get_frame_errors(ordered);
+		return py::array_t<int32_t>(errors.size(), errors.data());
+	}, R"pbdoc(Returns the number of wrong bits of the last recorded frames.
+
+By default, returns a copy of the whole ring buffer (the frame 'i' is at the index i % size). With 'ordered', returns
+the last min(n_recorded_frames, size) frames, oldest first. Returns None if the recording is not activated.)pbdoc",
+	"ordered"_a = false);
 
 };
 
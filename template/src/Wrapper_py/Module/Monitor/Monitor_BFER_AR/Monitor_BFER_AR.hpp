@@ -4,6 +4,7 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/iostream.h>
+#include <pybind11/numpy.h>
 
 #include "Module/Monitor/BFER_AR/Monitor_BFER_AR.hpp"
 
@@ -28,7 +28,16 @@ void Wrapper_Py_Module
 	this->def("__deepcopy__",   &Py_Module::__deepcopy__);
 	this->def("__str__",        &Py_Module::to_string);
 	this->def_property("n_frames", &Py_Module::get_n_frames, &Py_Module::set_n_frames);
-	this->def("create_codelet", &Py_Module::create_codelet, "task"_a, "codelet"_a);
+	this->def("create_codelet", (void (Py_Module::*)(Task&, const py::function&))&Py_Module::create_codelet, R"pbdoc(Create the codelet of 'task'.
+
+The 'codelet' is called as 'codelet(module, sockets, frame_id)' once per wave, 'sockets' being the list of the 2D
+arrays (n_frames x n_elmts) of the task sockets. The whole frame block should be processed at once.)pbdoc", "task"_a, "codelet"_a);
+	this->def("create_codelet", (void (Py_Module::*)(Task&, const uintptr_t))&Py_Module::create_codelet, R"pbdoc(Create the codelet of 'task' from the address of a native function.
+
+The function has the C signature 'int codelet(void** dataptrs, const size_t* n_elmts, size_t n_sockets, size_t n_frames,
+size_t frame_id)', 'dataptrs' and 'n_elmts' giving the data and the number of elements (all frames) of the task sockets.
+It is called without the GIL (e.g. the 'address' of a Numba 'cfunc', or a ctypes/cffi function pointer casted to an
+integer).)pbdoc", "task"_a, "codelet_address"_a);
 	this->def("create_fake_codelet", &Py_Module::create_fake_codelet, "task"_a);
 
 	this->def("create_task", [](Py_Module& self, const std::string &name)->Task&
@@ -2,6 +2,9 @@
 #include <string>
 #include <memory>
 #include <map>
+#include <unordered_map>
+#include <typeindex>
+#include <algorithm>
 #include <pybind11/numpy.h>
 #include "Wrapper_py/Module/Socket.hpp"
 
@@ -17,11 +20,55 @@ std::map<std::type_index, std::string> type_map = {{typeid(int8_t ), py::format_
                                                    {typeid(float  ), py::format_descriptor<float  >::format()},
                                                    {typeid(double ), py::format_descriptor<double >::format()}};
 
+// The base of the NumPy views of a socket: keeps the task (that owns the output buffers) and the socket alive as long
+// as a view exists.
+struct Socket_view_owner
+{
+	std::shared_ptr<Task>   task;
+	std::shared_ptr<Socket> socket;
+};
+
+// NumPy views of the sockets, rebuilt only when the data pointer or the shape of the socket changes. Each access
+// returns a new view of the cached array, so the changes of its shape or flags are not seen by the next accesses.
+// The cache is only accessed with the GIL held. An entry whose task is only owned by the views (e.g. the module has
+// been destroyed) is pruned when the cache grows. The map is never destroyed (the arrays can't be released after the
+// finalization of the interpreter), it is cleared at exit instead.
+struct Socket_view
+{
+	std::weak_ptr<Task> task;
+	const void*         dataptr;
+	size_t              n_elmts;
+	size_t              n_rows;
+	std::type_index     datatype;
+	py::array           array;
+};
+auto view_cache = new std::unordered_map<const Socket*, Socket_view>();
+size_t view_cache_limit = 64;
+
+void prune_view_cache()
+{
+	for (auto it = view_cache->begin(); it != view_cache->end();)
+		if (it->second.task.use_count() <= 1) // only owned by the base of the cached array
+			it = view_cache->erase(it);
+		else
+			++it;
+	view_cache_limit = std::max((size_t)64, 2 * view_cache->size());
+}
+
+std::shared_ptr<Task> get_shared_task(const Socket& s)
+{
+	for (auto& t : s.get_task().get_module().tasks)
+		if (t.get() == &s.get_task())
+			return t;
+	return nullptr;
+}
+
 Wrapper_Socket
 ::Wrapper_Socket(py::handle scope)
 : Wrapper_py(),
   py::class_<Socket, std::shared_ptr<Socket>>(scope, "Socket", py::buffer_protocol())
 {
+	py::module_::import("atexit").attr("register")(py::cpp_function([]() { view_cache->clear(); }));
 }
 
 void Wrapper_Socket
@@ -57,12 +104,12 @@ void Wrapper_Socket
 	});
 	this->def("get_task", &aff3ct::module::Socket::get_task, py::return_value_policy::reference);
 	this->def("__getitem__", [](aff3ct::module::Socket& sckt, py::handle& index) {
-		py::array array = py::cast(sckt);
+		py::array array = Wrapper_Socket::get_view(sckt);
 		return array.attr("__getitem__")(index);
 		},py::return_value_policy::reference);
 
 	this->def("__setitem__", [](aff3ct::module::Socket& sckt, py::handle& index, py::handle& value) {
-		py::array arr = py::cast(sckt);
+		py::array arr = Wrapper_Socket::get_view(sckt);
 		arr.attr("__setitem__")(index, value);
 		},py::return_value_policy::reference);
 
@@ -86,7 +133,7 @@ void Wrapper_Socket
 			throw std::runtime_error(message.str());
 		}
 
-		py::array py_self = py::cast(self);
+		py::array py_self = Wrapper_Socket::get_view(self);
 		if (!arr.dtype().is(py_self.dtype()))
 		{
 			std::stringstream message;
@@ -117,6 +164,60 @@ void Wrapper_Socket
 	});
 };
 
+py::array Wrapper_Socket
+::get_view(const aff3ct::module::Socket& s)
+{
+	const bool is_status = s.get_name() == "status";
+	const size_t n_rows  = is_status ? (size_t)s.get_task().get_module().get_n_waves()
+	                                 : (size_t)s.get_task().get_module().get_n_frames();
+
+	auto it = view_cache->find(&s);
+	if (it != view_cache->end() &&
+	    it->second.dataptr  == s.get_dataptr() &&
+	    it->second.n_elmts  == s.get_n_elmts() &&
+	    it->second.n_rows   == n_rows          &&
+	    it->second.datatype == std::type_index(s.get_datatype()))
+		return py::array(it->second.array.attr("view")());
+
+	const size_t dsize = (size_t)s.get_datatype_size();
+	std::vector<size_t> shape, strides;
+	if (is_status)
+	{
+		shape   = {n_rows};
+		strides = {dsize };
+	}
+	else
+	{
+		const size_t n_cols = s.get_n_elmts()/n_rows;
+		shape   = {n_rows, n_cols};
+		strides = {dsize*n_cols, dsize};
+	}
+
+	// the memory is owned by the task: the base keeps it alive, NumPy does not copy the data
+	auto owner = new Socket_view_owner{get_shared_task(s), Wrapper_Socket::get_weak(s).lock()};
+	py::capsule base(owner, [](void* o) { delete (Socket_view_owner*)o; });
+	py::array view(py::dtype(type_map[s.get_datatype()]), shape, strides, s.get_dataptr(), base);
+
+	if (it != view_cache->end())
+		view_cache->erase(it);
+	else if (view_cache->size() >= view_cache_limit)
+		prune_view_cache();
+	if (owner->task && owner->socket)
+		view_cache->emplace(&s, Socket_view{owner->task, s.get_dataptr(), s.get_n_elmts(), n_rows,
+		                                    std::type_index(s.get_datatype()), view});
+
+	return py::array(view.attr("view")());
+}
+
+std::weak_ptr<aff3ct::module::Socket> Wrapper_Socket
+::get_weak(const aff3ct::module::Socket& s)
+{
+	for (auto& sckt : s.get_task().sockets)
+		if (sckt.get() == &s)
+			return sckt;
+	return std::weak_ptr<aff3ct::module::Socket>();
+}
+
 std::string Wrapper_Socket
 ::to_string(const aff3ct::module::Socket& s, int idx, bool full, const std::string prefix)
 {
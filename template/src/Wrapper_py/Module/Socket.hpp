@@ -2,6 +2,7 @@
 #define BIND_SOCKET_HPP_
 
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <aff3ct.hpp>
 
 #include "Wrapper_py/Wrapper_py.hpp"
@@ -21,6 +22,8 @@ class Wrapper_Socket : public Wrapper_py,
 	virtual ~Wrapper_Socket() = default;
 
 	static std::string to_string    (const aff3ct::module::Socket& s, int idx=-1, bool full = false, const std::string prefix = "");
+	static py::array   get_view     (const aff3ct::module::Socket& s);
+	static std::weak_ptr<aff3ct::module::Socket> get_weak(const aff3ct::module::Socket& s);
 };
 }
 }
@@ -1,4 +1,9 @@
 #include <pybind11/stl.h>
+#include <pybind11/numpy.h>
+#include <algorithm>
+#include <chrono>
+#include <cstring>
+#include <unordered_map>
 #include "Wrapper_py/Module/Task.hpp"
 #include "Wrapper_py/Module/Socket.hpp"
 #include <pybind11/iostream.h>
@@ -9,11 +14,57 @@ using namespace py::literals;
 using namespace aff3ct::module;
 using namespace aff3ct::wrapper;
 
+// Buffers used by 'Task.__call__' for the incomplete blocks of frames. The map is only accessed with the GIL held. A
+// buffer is tied to the lifetime of its socket by a weak pointer and the map is cleared at exit (it is never
+// destroyed).
+struct Staging_buffer
+{
+	std::weak_ptr<Socket> socket;
+	py::array             array;
+};
+auto staging_buffers = new std::unordered_map<const Socket*, Staging_buffer>();
+size_t staging_buffers_limit = 64;
+
+void prune_staging_buffers()
+{
+	for (auto it = staging_buffers->begin(); it != staging_buffers->end();)
+		if (it->second.socket.expired())
+			it = staging_buffers->erase(it);
+		else
+			++it;
+	staging_buffers_limit = std::max((size_t)64, 2 * staging_buffers->size());
+}
+
+py::array& get_staging_buffer(const Socket& s)
+{
+	auto it = staging_buffers->find(&s);
+	if (it != staging_buffers->end() && it->second.socket.expired())
+	{
+		staging_buffers->erase(it); // a destroyed socket was at the same address
+		it = staging_buffers->end();
+	}
+	if (it == staging_buffers->end())
+	{
+		if (staging_buffers->size() >= staging_buffers_limit)
+			prune_staging_buffers();
+		it = staging_buffers->emplace(&s, Staging_buffer{Wrapper_Socket::get_weak(s), py::array()}).first;
+	}
+
+	py::array& buffer = it->second.array;
+	if ((size_t)buffer.nbytes() != s.get_databytes())
+	{
+		py::array view = Wrapper_Socket::get_view(s);
+		buffer = py::array(view.dtype(), std::vector<ssize_t>(view.shape(), view.shape() + view.ndim()));
+	}
+	return buffer;
+}
+
 Wrapper_Task
 ::Wrapper_Task(py::handle scope)
 : Wrapper_py(),
   py::class_<Task, std::shared_ptr<Task>, Task_Publicist>(scope, "Task")
 {
+	py::module_::import("atexit").attr("register")(py::cpp_function([]() { staging_buffers->clear(); }));
 }
 
 void Wrapper_Task
@@ -28,14 +79,49 @@ void Wrapper_Task
 	this->def("exec",
 		[](Task &self, const int frame_id, const bool managed_memory)
 		{
-			py::scoped_ostream_redirect stream(
-			std::cout,                                // std::ostream&
-			py::module_::import("sys").attr("stdout") // Python output
-			);
-			//setControlMode(rang::control::Force);
-			self.exec(frame_id, managed_memory);
+			if (self.is_debug())
+			{
+				// the debug output is redirected to Python, the GIL is kept
+				py::scoped_ostream_redirect stream(
+				std::cout,                                // std::ostream&
+				py::module_::import("sys").attr("stdout") // Python output
+				);
+				//setControlMode(rang::control::Force);
+				self.exec(frame_id, managed_memory);
+			}
+			else
+			{
+				py::gil_scoped_release release{};
+				self.exec(frame_id, managed_memory);
+			}
 		},
 		"frame_id"_a = -1, "managed_memory"_a = true);
+	this->def("exec_n",
+		[](Task &self, const size_t count, const int frame_id, const bool managed_memory)
+		{
+			if (self.is_debug())
+			{
+				py::scoped_ostream_redirect stream(
+				std::cout,                                // std::ostream&
+				py::module_::import("sys").attr("stdout") // Python output
+				);
+				for (size_t i = 0; i < count; i++)
+					self.exec(frame_id, managed_memory);
+			}
+			else
+			{
+				py::gil_scoped_release release{};
+				for (size_t i = 0; i < count; i++)
+					self.exec(frame_id, managed_memory);
+			}
+		},
+		"Executes the task 'count' times.", "count"_a, "frame_id"_a = -1, "managed_memory"_a = true);
+	this->def("__call__", &Wrapper_Task::call, R"pbdoc(Executes the task on NumPy arrays: 'task(*inputs, out=None)'.
+
+The input arrays are given in the order of the input sockets, with any number of frames and the dtype of the sockets
+(the other sequences are converted if the kind of their values is kept). The task is executed as many times as needed
+by blocks of 'n_frames' frames, the sockets are bound back to their previous data afterwards. The output arrays can be provided with 'out' (an array or a tuple of
+arrays), otherwise they are allocated. Returns the output array(s).)pbdoc");
 	this->def("__getitem__",  [](Task& t, const std::string& s)
 	{
 		auto& m = t.get_module();
@@ -49,6 +135,9 @@ void Wrapper_Task
 		self.bind(s_out, priority);
 	}, "Binds the Task to socket 's_out' with priority 'priority'.", "s_out"_a, "priority"_a=1);
 
+	this->def("get_stats", [](Task& self) { return Wrapper_Task::get_stats({&self}); },
+	          "Returns the statistics of the task (the durations are in seconds, the throughput in frames per second).");
+
 	this->def("set_debug_hex"      , &Task::set_debug_hex      , "debug_hex"_a);
 	this->def("set_debug_limit"    , &Task::set_debug_limit    , "limit"_a    );
 	this->def("set_debug_precision", &Task::set_debug_precision, "prec"_a     );
@@ -58,6 +147,230 @@ void Wrapper_Task
 	this->def("get_module", &aff3ct::module::Task::get_module, py::return_value_policy::reference);
 };
 
+py::object Wrapper_Task
+::call(aff3ct::module::Task& t, const py::args& args, const py::kwargs& kwargs)
+{
+	const size_t n_frames = t.get_module().get_n_frames();
+
+	std::vector<Socket*> s_in, s_out;
+	for (auto& s : t.sockets)
+		if (t.get_socket_type(*s) == socket_t::SIN)
+			s_in.push_back(s.get());
+		else if (s->get_name() != "status")
+			s_out.push_back(s.get());
+
+	if (args.size() != s_in.size())
+	{
+		std::stringstream message;
+		message << "Task '" << t.get_name() << "' expects " << s_in.size() << " input array(s), but "
+		        << args.size() << " were given.";
+		throw std::runtime_error(message.str());
+	}
+
+	for (auto& kw : kwargs)
+		if (kw.first.cast<std::string>() != "out")
+		{
+			std::stringstream message;
+			message << "Unexpected keyword argument '" << kw.first.cast<std::string>() << "'.";
+			throw std::runtime_error(message.str());
+		}
+
+	py::list out_list;
+	if (kwargs.contains("out") && !kwargs["out"].is_none())
+	{
+		if (py::isinstance<py::tuple>(kwargs["out"]) || py::isinstance<py::list>(kwargs["out"]))
+			out_list = py::list(kwargs["out"]);
+		else
+			out_list.append(kwargs["out"]);
+
+		if (out_list.size() != s_out.size())
+		{
+			std::stringstream message;
+			message << "Task '" << t.get_name() << "' has " << s_out.size() << " output socket(s), but "
+			        << out_list.size() << " output array(s) were given.";
+			throw std::runtime_error(message.str());
+		}
+	}
+
+	// the number of frames to process is given by the inputs, or by the outputs if there is no input
+	size_t n_total = s_in.size() || out_list.size() ? 0 : n_frames;
+	auto check_n_rows = [&t, &n_total](const Socket& s, const py::array& arr, const bool first)
+	{
+		const size_t n_cols = s.get_n_elmts() / t.get_module().get_n_frames();
+		if ((size_t)arr.size() % n_cols != 0 || (!first && (size_t)arr.size() / n_cols != n_total))
+		{
+			std::stringstream message;
+			message << "The array of the '" << s.get_name() << "' socket must contain " << n_cols
+			        << " elements per frame";
+			if (!first)
+				message << " for " << n_total << " frames";
+			message << " (array size: " << arr.size() << ").";
+			throw std::runtime_error(message.str());
+		}
+		if (first)
+			n_total = (size_t)arr.size() / n_cols;
+	};
+
+	// as 'Socket.bind', the arrays must have the dtype of the socket (the other sequences, e.g. lists, are converted
+	// if the conversion keeps the kind of the values)
+	py::module_ np = py::module_::import("numpy");
+	std::vector<py::array> in;
+	for (size_t i = 0; i < s_in.size(); i++)
+	{
+		py::dtype dtype = Wrapper_Socket::get_view(*s_in[i]).dtype();
+		py::array arr = np.attr("asarray")(args[i]);
+		if (!arr.dtype().equal(dtype) &&
+		    (py::isinstance<py::array>(args[i]) || !np.attr("can_cast")(arr.dtype(), dtype, "same_kind").cast<bool>()))
+		{
+			std::stringstream message;
+			message << "The dtype of the array of the '" << s_in[i]->get_name() << "' socket must be '"
+			        << dtype.attr("name").cast<std::string>() << "' (array dtype: '"
+			        << arr.dtype().attr("name").cast<std::string>() << "').";
+			throw std::runtime_error(message.str());
+		}
+		arr = np.attr("ascontiguousarray")(arr, dtype);
+		check_n_rows(*s_in[i], arr, i == 0);
+		in.push_back(arr);
+	}
+
+	std::vector<py::array> out;
+	for (size_t i = 0; i < out_list.size(); i++)
+	{
+		py::array arr = out_list[i].cast<py::array>();
+		if (!arr.dtype().equal(Wrapper_Socket::get_view(*s_out[i]).dtype()) ||
+		    !(arr.flags() & py::array::c_style) || !arr.writeable())
+		{
+			std::stringstream message;
+			message << "The output array of the '" << s_out[i]->get_name() << "' socket must be a writeable "
+			        << "C-contiguous array of dtype '"
+			        << Wrapper_Socket::get_view(*s_out[i]).dtype().attr("name").cast<std::string>() << "'.";
+			throw std::runtime_error(message.str());
+		}
+		check_n_rows(*s_out[i], arr, i == 0 && s_in.size() == 0);
+		out.push_back(arr);
+	}
+	for (size_t i = out.size(); i < s_out.size(); i++)
+	{
+		py::array view = Wrapper_Socket::get_view(*s_out[i]);
+		out.push_back(py::array(view.dtype(), std::vector<ssize_t>{(ssize_t)n_total, view.shape(1)}));
+	}
+
+	// the staging buffers are used for the last incomplete block
+	std::vector<Socket*> sockets(s_in);
+	sockets.insert(sockets.end(), s_out.begin(), s_out.end());
+	std::vector<void*> dataptrs, staging;
+	std::vector<const int8_t*> data;
+	for (size_t i = 0; i < sockets.size(); i++)
+	{
+		dataptrs.push_back(sockets[i]->get_dataptr());
+		staging .push_back(n_total % n_frames ? get_staging_buffer(*sockets[i]).mutable_data() : nullptr);
+		data    .push_back(i < s_in.size() ? (const int8_t*)in[i].data() : (const int8_t*)out[i - s_in.size()].data());
+	}
+
+	// the sockets get back their data, the unbound sockets are unbound again (the staging buffers can be reallocated)
+	auto restore = [&]()
+	{
+		for (size_t i = 0; i < sockets.size(); i++)
+			if (dataptrs[i] != nullptr)
+				sockets[i]->bind(dataptrs[i]);
+			else
+				sockets[i]->reset();
+	};
+
+	auto run = [&]()
+	{
+		try
+		{
+			for (size_t f = 0; f < n_total; f += n_frames)
+			{
+				const size_t n = std::min(n_frames, n_total - f);
+				for (size_t i = 0; i < sockets.size(); i++)
+				{
+					const size_t n_bytes = sockets[i]->get_databytes() / n_frames;
+					int8_t* ptr = const_cast<int8_t*>(data[i]) + f * n_bytes;
+					if (n == n_frames)
+						sockets[i]->bind((void*)ptr);
+					else
+					{
+						if (i < s_in.size())
+						{
+							std::memcpy(staging[i], ptr, n * n_bytes);
+							std::memset((int8_t*)staging[i] + n * n_bytes, 0, (n_frames - n) * n_bytes);
+						}
+						sockets[i]->bind(staging[i]);
+					}
+				}
+
+				t.exec();
+
+				if (n != n_frames)
+					for (size_t i = s_in.size(); i < sockets.size(); i++)
+					{
+						const size_t n_bytes = sockets[i]->get_databytes() / n_frames;
+						std::memcpy(const_cast<int8_t*>(data[i]) + f * n_bytes, staging[i], n * n_bytes);
+					}
+			}
+		}
+		catch (...)
+		{
+			restore();
+			throw;
+		}
+		restore();
+	};
+
+	if (t.is_debug())
+	{
+		py::scoped_ostream_redirect stream(
+		std::cout,                                // std::ostream&
+		py::module_::import("sys").attr("stdout") // Python output
+		);
+		run();
+	}
+	else
+	{
+		py::gil_scoped_release release{};
+		run();
+	}
+
+	if (s_out.size() == 0)
+		return py::none();
+	else if (s_out.size() == 1)
+		return out[0];
+	else
+		return py::tuple(py::cast(out));
+}
+
+py::dict Wrapper_Task
+::get_stats(const std::vector<aff3ct::module::Task*>& tasks)
+{
+	// the statistics of the tasks (typically the clones of a same task) are merged
+	size_t n_calls = 0, n_frames = 0;
+	std::chrono::nanoseconds total(0), min(0), max(0);
+	for (auto t : tasks)
+	{
+		if (t->get_n_calls() == 0)
+			continue;
+		min = n_calls == 0 ? t->get_duration_min() : std::min(min, t->get_duration_min());
+		max = n_calls == 0 ? t->get_duration_max() : std::max(max, t->get_duration_max());
+		n_calls  += t->get_n_calls();
+		n_frames += t->get_n_calls() * t->get_module().get_n_frames();
+		total    += t->get_duration_total();
+	}
+
+	const double total_s = total.count() * 1e-9;
+	py::dict stats;
+	stats["name"      ] = tasks.size() ? tasks[0]->get_name() : std::string("");
+	stats["module"    ] = tasks.size() ? tasks[0]->get_module().get_custom_name() : std::string("");
+	stats["n_calls"   ] = n_calls;
+	stats["total"     ] = total_s;
+	stats["min"       ] = min.count() * 1e-9;
+	stats["max"       ] = max.count() * 1e-9;
+	stats["avg"       ] = n_calls ? total_s / n_calls : 0.;
+	stats["throughput"] = total_s > 0. ? n_frames / total_s : 0.;
+	return stats;
+}
+
 std::string Wrapper_Task
 ::to_string(const aff3ct::module::Task& t, int idx, bool full, const std::string prefix)
 {
@@ -3,26 +3,13 @@
 
 #include <pybind11/pybind11.h>
 #include <memory>
+#include <vector>
 #include <aff3ct.hpp>
+#include "Module/Task_Publicist/Task_Publicist.hpp"
 #include "Wrapper_py/Wrapper_py.hpp"
 
 namespace py = pybind11;
 
-namespace aff3ct
-{
-namespace module
-{
-class Task_Publicist : public Task
-{
-	public:
-	using Task::Task;
-	using Task::codelet;
-
-	virtual ~Task_Publicist() = default;
-};
-}
-}
-
 namespace aff3ct
 {
 namespace wrapper
@@ -38,6 +25,8 @@ class Wrapper_Task : public Wrapper_py,
 	virtual ~Wrapper_Task() = default;
 
 	static std::string to_string    (const aff3ct::module::Task& s, int idx=-1, bool full = false, const std::string prefix = "");
+	static py::object  call         (aff3ct::module::Task& t, const py::args& args, const py::kwargs& kwargs);
+	static py::dict    get_stats    (const std::vector<aff3ct::module::Task*>& tasks);
 };
 }
 }
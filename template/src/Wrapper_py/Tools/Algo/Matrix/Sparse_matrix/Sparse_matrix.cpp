@@ -1,4 +1,5 @@
 #include <sstream>
+#include <algorithm>
 #include "Wrapper_py/Tools/Algo/Matrix/Sparse_matrix/Sparse_matrix.hpp"
 
 namespace py = pybind11;
@@ -15,7 +16,13 @@ Wrapper_Sparse_matrix
 py::class_<aff3ct::tools::Sparse_matrix>(scope, "array")
 {
 	py::module_ alist = scope.def_submodule("alist");
-	alist.def("read", [](const std::string& path){
+	alist.def("read", [](const std::string& path, const bool cache){
+		if (cache)
+			return aff3ct::tools::Sparse_matrix_binary::read_cached(path, [](std::istream& stream)
+			{
+				return aff3ct::tools::AList::read(stream);
+			});
+
 		std::filebuf fb;
 		if (fb.open (path,std::ios::in))
 		{
@@ -29,9 +36,17 @@ py::class_<aff3ct::tools::Sparse_matrix>(scope, "array")
 			message << "Can't open '" + path + "' file.";
 			throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
 		}
-	}, py::return_value_policy::copy);
+	}, R"pbdoc(Reads an AList file. With 'cache', the matrix is loaded from (or saved to) the binary sidecar file
+'path'.spm, which is rebuilt when the content of 'path' changes. Off by default: the
+sidecar file is written next to 'path'.)pbdoc", "path"_a, "cache"_a = false, py::return_value_policy::copy);
 	py::module_ qc = scope.def_submodule("qc");
-	qc.def("read", [](const std::string& path){
+	qc.def("read", [](const std::string& path, const bool cache){
+		if (cache)
+			return aff3ct::tools::Sparse_matrix_binary::read_cached(path, [](std::istream& stream)
+			{
+				return aff3ct::tools::QC::read(stream);
+			});
+
 		std::filebuf fb;
 		if (fb.open (path,std::ios::in))
 		{
@@ -45,7 +60,53 @@ py::class_<aff3ct::tools::Sparse_matrix>(scope, "array")
 			message << "Can't open '" + path + "' file.";
 			throw tools::invalid_argument(__FILE__, __LINE__, __func__, message.str());
 		}
-	}, py::return_value_policy::copy);
+	}, R"pbdoc(Reads a QC file. With 'cache', the matrix is loaded from (or saved to) the binary sidecar file 'path'.spm,
+which is rebuilt when the content of 'path' changes. Off by default: the
+sidecar file is written next to 'path'.)pbdoc", "path"_a, "cache"_a = false, py::return_value_policy::copy);
+
+	qc.def("from_base", [](const py::array_t<int64_t, py::array::c_style | py::array::forcecast>& base, const size_t Z){
+		if (base.ndim() != 2)
+			throw py::value_error("'base' should be a 2-dimensional array of shift values.");
+		if (Z == 0)
+			throw py::value_error("'Z' has to be greater than 0.");
+
+		const size_t n_block_rows = (size_t)base.shape(0);
+		const size_t n_block_cols = (size_t)base.shape(1);
+		auto b = base.unchecked<2>();
+
+		// block (i,j) with shift s >= 0 is the identity of size Z cyclically shifted to the right by s
+		std::vector<std::vector<uint32_t>> rows(n_block_rows * Z);
+		for (size_t i = 0; i < n_block_rows; i++)
+			for (size_t j = 0; j < n_block_cols; j++)
+			{
+				const auto shift = b(i, j);
+				if (shift < -1)
+				{
+					std::stringstream message;
+					message << "the shift values should be -1 (zero block) or positive, but base[" << i << "," << j
+					        << "] = " << shift << ".";
+					throw py::value_error(message.str());
+				}
+				if (shift == -1)
+					continue;
+				for (size_t k = 0; k < Z; k++)
+					rows[i * Z + k].push_back((uint32_t)(j * Z + (k + (size_t)shift) % Z));
+			}
+
+		return Wrapper_Sparse_matrix::from_rows(n_block_rows * Z, n_block_cols * Z, rows);
+	}, R"pbdoc(Lifts a QC base matrix of shift values into the full parity-check matrix.
+
+Each entry of 'base' gives a Z x Z block: -1 is the zero block and s >= 0 is the identity cyclically shifted by s
+(modulo Z), i.e. the row k of the block is connected to the column (k + s) % Z.)pbdoc",
+	"base"_a, "Z"_a, py::return_value_policy::take_ownership);
+
+	scope.def("save", [](const aff3ct::tools::Sparse_matrix& matrix, const std::string& path){
+		aff3ct::tools::Sparse_matrix_binary::write(matrix, path);
+	}, R"pbdoc(Saves the matrix in the compact binary format.)pbdoc", "matrix"_a, "path"_a);
+	scope.def("load", [](const std::string& path){
+		return aff3ct::tools::Sparse_matrix_binary::read(path);
+	}, R"pbdoc(Loads a matrix saved in the compact binary format (the file is memory-mapped).)pbdoc", "path"_a,
+	py::return_value_policy::move);
 
 
 	scope.def("eye", [](const size_t &size, const int64_t &d){
@@ -212,6 +273,106 @@ py::class_<aff3ct::tools::Sparse_matrix>(scope, "array")
 		}
 		return H;
 	}, "arrays"_a, "axis"_a=0, py::return_value_policy::take_ownership);
+
+	scope.def("from_csr", [](const py::array_t<int64_t, py::array::c_style | py::array::forcecast>& indptr,
+	                         const py::array_t<int64_t, py::array::c_style | py::array::forcecast>& indices,
+	                         const py::object& shape){
+		if (indptr.ndim() != 1 || indices.ndim() != 1 || indptr.size() < 1)
+			throw py::value_error("'indptr' and 'indices' should be non-empty 1-dimensional arrays.");
+
+		const size_t n_rows = (size_t)indptr.size() - 1;
+		auto ptr = indptr.unchecked<1>();
+		auto idx = indices.unchecked<1>();
+
+		auto n_cols = (size_t)0;
+		for (py::ssize_t k = 0; k < idx.shape(0); k++)
+			if (idx(k) >= 0)
+				n_cols = std::max(n_cols, (size_t)(idx(k) + 1));
+		if (!shape.is_none())
+		{
+			auto s = Wrapper_Sparse_matrix::get_shape(shape);
+			if (s.first != n_rows)
+			{
+				std::stringstream message;
+				message << "'indptr' describes " << n_rows << " rows but 'shape' has " << s.first << " rows.";
+				throw py::value_error(message.str());
+			}
+			n_cols = s.second;
+		}
+		Wrapper_Sparse_matrix::check_csr(indptr, indices, n_cols);
+
+		std::vector<std::vector<uint32_t>> rows(n_rows);
+		for (size_t i = 0; i < n_rows; i++)
+			for (auto k = ptr(i); k < ptr(i +1); k++)
+				rows[i].push_back((uint32_t)idx(k));
+		return Wrapper_Sparse_matrix::from_rows(n_rows, n_cols, rows);
+	}, R"pbdoc(Builds a sparse matrix from CSR index arrays (the 'indptr' and 'indices' of scipy.sparse.csr_matrix).
+
+When 'shape' is None, the number of columns is the largest column index + 1. The duplicated entries are merged.)pbdoc",
+	"indptr"_a, "indices"_a, "shape"_a = py::none(), py::return_value_policy::take_ownership);
+
+	scope.def("from_coo", [](const py::array_t<int64_t, py::array::c_style | py::array::forcecast>& row,
+	                         const py::array_t<int64_t, py::array::c_style | py::array::forcecast>& col,
+	                         const py::object& shape){
+		if (row.ndim() != 1 || col.ndim() != 1 || row.size() != col.size())
+			throw py::value_error("'row' and 'col' should be 1-dimensional arrays of the same size.");
+
+		auto r = row.unchecked<1>();
+		auto c = col.unchecked<1>();
+		size_t n_rows = 0, n_cols = 0;
+		for (py::ssize_t k = 0; k < r.shape(0); k++)
+		{
+			if (r(k) < 0 || c(k) < 0)
+				throw py::index_error("'row' and 'col' should not contain negative indexes.");
+			n_rows = std::max(n_rows, (size_t)(r(k) + 1));
+			n_cols = std::max(n_cols, (size_t)(c(k) + 1));
+		}
+		if (!shape.is_none())
+		{
+			auto s = Wrapper_Sparse_matrix::get_shape(shape);
+			if (s.first < n_rows || s.second < n_cols)
+			{
+				std::stringstream message;
+				message << "the indexes do not fit in an array of shape (" << s.first << "," << s.second << ").";
+				throw py::index_error(message.str());
+			}
+			n_rows = s.first;
+			n_cols = s.second;
+		}
+
+		std::vector<std::vector<uint32_t>> rows(n_rows);
+		for (py::ssize_t k = 0; k < r.shape(0); k++)
+			rows[r(k)].push_back((uint32_t)c(k));
+		return Wrapper_Sparse_matrix::from_rows(n_rows, n_cols, rows);
+	}, R"pbdoc(Builds a sparse matrix from COO index arrays (the 'row' and 'col' of scipy.sparse.coo_matrix).
+
+When 'shape' is None, it is inferred from the largest indexes. The duplicated entries are merged.)pbdoc",
+	"row"_a, "col"_a, "shape"_a = py::none(), py::return_value_policy::take_ownership);
+
+	scope.def("from_sparse", [](const py::object& matrix){
+		if (!py::hasattr(matrix, "tocsr"))
+			throw py::type_error("'matrix' should have a 'tocsr' method (e.g. a scipy.sparse matrix).");
+
+		py::object csr = matrix.attr("tocsr")();
+		auto shape = Wrapper_Sparse_matrix::get_shape(csr.attr("shape"));
+		auto indptr  = py::array_t<int64_t, py::array::c_style | py::array::forcecast>::ensure(csr.attr("indptr"));
+		auto indices = py::array_t<int64_t, py::array::c_style | py::array::forcecast>::ensure(csr.attr("indices"));
+		auto data    = py::array_t<bool,    py::array::c_style | py::array::forcecast>::ensure(csr.attr("data"));
+		if (!indptr || !indices || !data || (size_t)indptr.size() != shape.first +1 || data.size() != indices.size())
+			throw py::value_error("'matrix.tocsr()' should return a CSR matrix with 'indptr', 'indices' and 'data' arrays.");
+		Wrapper_Sparse_matrix::check_csr(indptr, indices, shape.second);
+
+		auto ptr = indptr.unchecked<1>();
+		auto idx = indices.unchecked<1>();
+		auto val = data.unchecked<1>();
+		std::vector<std::vector<uint32_t>> rows(shape.first);
+		for (size_t i = 0; i < shape.first; i++)
+			for (auto k = ptr(i); k < ptr(i +1); k++)
+				if (val(k)) // the explicit zeros are not connections
+					rows[i].push_back((uint32_t)idx(k));
+		return Wrapper_Sparse_matrix::from_rows(shape.first, shape.second, rows);
+	}, R"pbdoc(Builds a sparse matrix from any object with a 'tocsr' method (e.g. a scipy.sparse matrix).)pbdoc",
+	"matrix"_a, py::return_value_policy::take_ownership);
 }
 
 
@@ -503,6 +664,97 @@ void Wrapper_Sparse_matrix
 	this->def_property_readonly("shape", [](const aff3ct::tools::Sparse_matrix& self){
 		return py::make_tuple(self.get_n_rows(),self.get_n_cols());
 	});
+	this->def_property_readonly("nnz", [](const aff3ct::tools::Sparse_matrix& self){
+		return self.get_n_connections();
+	});
+
+	this->def("to_csr", [](const aff3ct::tools::Sparse_matrix& self){
+		py::array_t<int64_t > indptr(self.get_n_rows() +1);
+		py::array_t<uint32_t> indices(self.get_n_connections());
+		auto ptr = indptr.mutable_unchecked<1>();
+		auto idx = indices.mutable_unchecked<1>();
+		size_t k = 0;
+		ptr(0) = 0;
+		for (size_t i = 0; i < self.get_n_rows(); i++)
+		{
+			auto& cols = self.get_cols_from_row(i);
+			std::copy(cols.begin(), cols.end(), idx.mutable_data(k));
+			std::sort(idx.mutable_data(k), idx.mutable_data(k) + cols.size());
+			k += cols.size();
+			ptr(i +1) = (int64_t)k;
+		}
+		return py::make_tuple(indptr, indices);
+	}, R"pbdoc(Returns the (indptr, indices) CSR index arrays of the matrix, the columns of each row are sorted.
+
+The matrix stores the connections row by row in separate vectors: the arrays are built in a single O(nnz) pass. A
+scipy matrix is obtained with scipy.sparse.csr_matrix((np.ones(H.nnz, dtype=bool), indices, indptr), shape=H.shape).)pbdoc");
+}
+
+aff3ct::tools::Sparse_matrix* Wrapper_Sparse_matrix
+::from_rows(const size_t n_rows, const size_t n_cols, std::vector<std::vector<uint32_t>>& rows)
+{
+	auto H = new aff3ct::tools::Sparse_matrix(n_rows, n_cols);
+	for (size_t i = 0; i < n_rows; i++)
+	{
+		auto& cols = rows[i];
+		std::sort(cols.begin(), cols.end());
+		cols.erase(std::unique(cols.begin(), cols.end()), cols.end());
+		for (auto j : cols)
+			H->add_connection(i, j);
+	}
+	return H;
+}
+
+void Wrapper_Sparse_matrix
+::check_csr(const py::array_t<int64_t, py::array::c_style | py::array::forcecast>& indptr,
+            const py::array_t<int64_t, py::array::c_style | py::array::forcecast>& indices,
+            const size_t n_cols)
+{
+	// the whole 'indptr' is checked before reading 'indices' through it
+	auto ptr = indptr.unchecked<1>();
+	auto idx = indices.unchecked<1>();
+	const auto n_rows = ptr.shape(0) - 1;
+	if (n_rows < 0 || ptr(0) != 0 || ptr(n_rows) != (int64_t)idx.shape(0))
+		throw py::value_error("'indptr' should start with 0 and end with the size of 'indices'.");
+	for (py::ssize_t i = 0; i < n_rows; i++)
+		if (ptr(i +1) < ptr(i))
+			throw py::value_error("'indptr' should be non-decreasing.");
+
+	for (py::ssize_t k = 0; k < idx.shape(0); k++)
+		if (idx(k) < 0 || (size_t)idx(k) >= n_cols)
+		{
+			std::stringstream message;
+			message << "column index " << idx(k) << " is out of bounds for an array with " << n_cols << " columns.";
+			throw py::index_error(message.str());
+		}
+}
+
+std::pair<size_t, size_t> Wrapper_Sparse_matrix
+::get_shape(const py::object& shape)
+{
+	py::tuple t;
+	try
+	{
+		t = shape.cast<py::tuple>();
+	}
+	catch(...)
+	{
+		throw py::index_error("shape should be a positive integer vector.");
+	}
+	if (t.size() != 2)
+	{
+		std::stringstream message;
+		message << "the created array should be 2-dimensional, but " << t.size() << " indexes were given.";
+		throw py::index_error(message.str());
+	}
+	try
+	{
+		return std::make_pair(t[0].cast<size_t>(), t[1].cast<size_t>());
+	}
+	catch(...)
+	{
+		throw py::index_error("shape should be a positive integer vector.");
+	}
 }
 
 py::slice Wrapper_Sparse_matrix
@@ -9,6 +9,7 @@
 #include <fstream>      // std::filebuf
 #include <aff3ct.hpp>
 
+#include "Tools/Algo/Matrix/Sparse_matrix/Sparse_matrix_binary.hpp"
 #include "Wrapper_py/Wrapper_py.hpp"
 
 namespace py = pybind11;
@@ -30,6 +31,12 @@ class Wrapper_Sparse_matrix : public Wrapper_py,
 	virtual ~Wrapper_Sparse_matrix() = default;
 
 	static py::slice get_slice(const py::object& obj, const size_t len);
+	static std::pair<size_t, size_t> get_shape(const py::object& shape);
+	static aff3ct::tools::Sparse_matrix* from_rows(const size_t n_rows, const size_t n_cols,
+	                                               std::vector<std::vector<uint32_t>>& rows);
+	static void check_csr(const py::array_t<int64_t, py::array::c_style | py::array::forcecast>& indptr,
+	                      const py::array_t<int64_t, py::array::c_style | py::array::forcecast>& indices,
+	                      const size_t n_cols);
 };
 }
 }
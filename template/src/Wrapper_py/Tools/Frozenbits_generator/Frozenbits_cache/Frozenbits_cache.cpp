@@ -0,0 +1,53 @@
+#include "Wrapper_py/Tools/Frozenbits_generator/Frozenbits_cache/Frozenbits_cache.hpp"
+
+namespace py = pybind11;
+using namespace py::literals;
+using namespace aff3ct;
+using namespace aff3ct::module;
+using namespace aff3ct::tools;
+using namespace aff3ct::wrapper;
+
+
+Wrapper_Frozenbits_cache
+::Wrapper_Frozenbits_cache(py::handle scope)
+: Wrapper_py(),
+  py::class_<aff3ct::tools::Frozenbits_cache>(scope, "Frozenbits_cache")
+{
+}
+
+
+void Wrapper_Frozenbits_cache
+::definitions()
+{
+	this->doc() = R"pbdoc(Memoizes the frozen bits of the generators.
+
+The entries are keyed by the generator type, K, N, the noise and an optional 'tag' (to distinguish the generators
+that depend on other parameters, e.g. the files of Frozenbits_generator_TV). The last 'capacity' entries are kept in
+memory. With a 'directory', each entry is also stored on disk and shared with the other processes.)pbdoc";
+
+	this->def(py::init([](const size_t capacity, const std::string& directory)
+	{
+		if (!directory.empty())
+			py::module_::import("os").attr("makedirs")(directory, "exist_ok"_a = true);
+		return new Frozenbits_cache(capacity, directory);
+	}), "capacity"_a = 256, "directory"_a = "", py::return_value_policy::take_ownership);
+	this->def("generate", [](Frozenbits_cache& self, Frozenbits_generator& generator, const std::string& tag)
+	{
+		std::vector<bool> fb;
+		self.generate(generator, fb, tag);
+		return fb;
+	}, R"pbdoc(Returns the frozen bits of 'generator' for its current noise, from the cache if possible.)pbdoc",
+	"generator"_a, "tag"_a = "", py::return_value_policy::copy);
+	this->def_static("get_key", &Frozenbits_cache::get_key, "generator"_a, "tag"_a = "");
+	this->def("clear",        &Frozenbits_cache::clear, "Removes the entries in memory (not the ones on disk).");
+	this->def("__len__",      &Frozenbits_cache::size);
+	this->def("get_n_hits",   &Frozenbits_cache::get_n_hits);
+	this->def("get_n_misses", &Frozenbits_cache::get_n_misses);
+	this->def_property("capacity", &Frozenbits_cache::get_capacity, &Frozenbits_cache::set_capacity);
+	this->def_property("directory", &Frozenbits_cache::get_directory, [](Frozenbits_cache& self, const std::string& directory)
+	{
+		if (!directory.empty())
+			py::module_::import("os").attr("makedirs")(directory, "exist_ok"_a = true);
+		self.set_directory(directory);
+	});
+};
@@ -19,12 +19,40 @@ Wrapper_Frozenbits_generator
 void Wrapper_Frozenbits_generator
 ::definitions()
 {
-	this->def("generate", [](aff3ct::tools::Frozenbits_generator& self)
+	this->def("generate", [](aff3ct::tools::Frozenbits_generator& self, aff3ct::tools::Frozenbits_cache* cache,
+	                         const std::string& tag)
 	{
 		std::vector<bool> fb(self.get_N(), true);
-		self.generate(fb);
+		if (cache)
+			cache->generate(self, fb, tag);
+		else
+			self.generate(fb);
 		return fb;
-	}, py::return_value_policy::copy);
+	}, R"pbdoc(Returns the frozen bits for the current noise. With a 'cache' (a Frozenbits_cache), the frozen bits are
+memoized: get_best_channels is then only updated when they are really generated.)pbdoc",
+	"cache"_a = nullptr, "tag"_a = "", py::return_value_policy::copy);
+	this->def("generate_many", [](const aff3ct::tools::Frozenbits_generator& self, const std::vector<float>& noises,
+	                              const size_t n_threads, aff3ct::tools::Frozenbits_cache* cache, const std::string& tag)
+	{
+		std::vector<std::vector<bool>> fbs;
+		{
+			py::gil_scoped_release release{};
+			fbs = Frozenbits_batch::generate(self, noises, n_threads, cache, tag);
+		}
+
+		py::array_t<bool> frozen_bits({noises.size(), (size_t)self.get_N()});
+		auto fb = frozen_bits.mutable_unchecked<2>();
+		for (size_t i = 0; i < fbs.size(); i++)
+			for (size_t j = 0; j < fbs[i].size(); j++)
+				fb(i, j) = fbs[i][j];
+		return frozen_bits;
+	}, R"pbdoc(Returns the frozen bits for each value of 'noises' as a (len(noises), N) boolean array.
+
+The noise values have the type of the current noise of the generator (a Sigma if none is set). The distinct values
+are generated in parallel on 'n_threads' clones of the generator (0 for one per core), the repeated values are
+generated once. The generator itself (its noise and best channels) is not modified. With a 'cache' (a
+Frozenbits_cache), the frozen bits are also memoized. Raises a ValueError if 'noises' contains a NaN.)pbdoc",
+	"noises"_a, "n_threads"_a = 0, "cache"_a = nullptr, "tag"_a = "");
 	this->def("get_best_channels", &aff3ct::tools::Frozenbits_generator::get_best_channels);
 	this->def("get_K", &aff3ct::tools::Frozenbits_generator::get_K);
 	this->def("get_N", &aff3ct::tools::Frozenbits_generator::get_N);
@@ -32,4 +60,3 @@ void Wrapper_Frozenbits_generator
 	this->def("set_noise", &Frozenbits_generator::set_noise);
 	this->def("clone", &Frozenbits_generator::clone);
 };
-
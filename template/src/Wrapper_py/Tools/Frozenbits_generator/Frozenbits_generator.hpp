@@ -4,9 +4,12 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/iostream.h>
+#include <pybind11/numpy.h>
 
 #include <aff3ct.hpp>
 
+#include "Tools/Code/Polar/Frozenbits_cache/Frozenbits_cache.hpp"
+#include "Tools/Code/Polar/Frozenbits_cache/Frozenbits_batch.hpp"
 #include "Wrapper_py/Wrapper_py.hpp"
 
 namespace py = pybind11;
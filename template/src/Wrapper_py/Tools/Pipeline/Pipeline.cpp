@@ -1,4 +1,5 @@
 #include "Wrapper_py/Tools/Pipeline/Pipeline.hpp"
+#include "Wrapper_py/Module/Task.hpp"
 
 #include <pybind11/functional.h>
 #include <functional>
@@ -65,6 +66,17 @@ void Wrapper_Pipeline
 	});
 	this->def("set_n_frames",  &Pipeline::set_n_frames);
 	this->def("get_tasks_per_types", &Pipeline::get_tasks_per_types, py::return_value_policy::reference);
+	this->def("get_stats", [](aff3ct::tools::Pipeline& self)
+	{
+		std::vector<std::vector<py::dict>> stats;
+		for (auto& stage : self.get_stages())
+		{
+			stats.push_back(std::vector<py::dict>());
+			for (auto& tasks : stage->get_tasks_per_types())
+				stats.back().push_back(Wrapper_Task::get_stats(tasks));
+		}
+		return stats;
+	}, "Returns the statistics per stage and per task type (the durations are in seconds, the throughput in frames per second).");
 	this->def("show_stats", [](aff3ct::tools::Pipeline& self)
 	{
 		py::scoped_ostream_redirect stream(
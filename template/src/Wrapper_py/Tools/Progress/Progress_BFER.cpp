@@ -0,0 +1,109 @@
+#include <iostream>
+#include <string>
+#include "Wrapper_py/Tools/Progress/Progress_BFER.hpp"
+#include <pybind11/chrono.h>
+#include <rang.hpp>
+
+namespace py = pybind11;
+using namespace py::literals;
+using namespace aff3ct;
+using namespace aff3ct::module;
+using namespace aff3ct::tools;
+using namespace aff3ct::wrapper;
+
+void Progress_BFER_deleter
+::operator()(aff3ct::tools::Progress_BFER* p) const
+{
+	{
+		py::gil_scoped_release release{};
+		try
+		{
+			p->stop();
+		}
+		catch (const std::exception& e)
+		{
+			std::clog << rang::tag::warning << "The exception of the progress callback is dropped: " << e.what()
+			          << std::endl;
+		}
+		catch (...)
+		{
+			std::clog << rang::tag::warning << "The exception of the progress callback is dropped." << std::endl;
+		}
+	}
+	delete p; // the callback (a Python object) is released with the GIL
+}
+
+Wrapper_Progress_BFER
+::Wrapper_Progress_BFER(py::handle scope)
+: Wrapper_py(),
+  py::class_<aff3ct::tools::Progress_BFER,
+             std::unique_ptr<aff3ct::tools::Progress_BFER, Progress_BFER_deleter>>(scope, "Progress_BFER")
+{
+}
+
+py::dict Wrapper_Progress_BFER
+::to_dict(const aff3ct::tools::Progress_BFER::Snapshot& s)
+{
+	return py::dict("n_frames"_a   = s.n_fra,
+	                "n_fe"_a       = s.n_fe,
+	                "n_be"_a       = s.n_be,
+	                "elapsed"_a    = s.elapsed,
+	                "throughput"_a = s.throughput);
+}
+
+void Wrapper_Progress_BFER
+::definitions()
+{
+	this->doc() = R"pbdoc(Calls a Python function with the progress of a Monitor_reduction_BFER from a background thread.
+
+Every 'period', the thread reduces the monitors and calls 'callback' with a dict (n_frames, n_fe, n_be, elapsed in
+seconds and throughput in information Mbps). The GIL is only taken for the callback: the simulation threads are not
+slowed down by a polling loop in Python. A last snapshot is reported when the reporter is stopped.
+
+The reporter is the one reducing the monitors: while it runs, the stop condition of the chain should not reduce them.)pbdoc";
+
+	this->def(py::init([](Monitor_reduction<module::Monitor_BFER<>>& reduction, py::function callback,
+	                      const std::chrono::microseconds& period)
+	{
+		auto cb = [callback](const Progress_BFER::Snapshot& s)
+		{
+			py::gil_scoped_acquire acquire{};
+			try
+			{
+				callback(Wrapper_Progress_BFER::to_dict(s));
+			}
+			catch (py::error_already_set& e)
+			{
+				// the Python exception can only be handled with the GIL: it is turned into a message here, in the
+				// reporter thread, then 'stop' rethrows a C++ exception without the GIL
+				throw tools::runtime_error(__FILE__, __LINE__, __func__,
+				                           std::string("The progress callback raised: ") + e.what());
+			}
+		};
+		return std::unique_ptr<Progress_BFER, Progress_BFER_deleter>(
+			new Progress_BFER(reduction, cb, std::chrono::duration_cast<std::chrono::nanoseconds>(period)));
+	}), "reduction"_a, "callback"_a, "period"_a = std::chrono::microseconds(100000), py::keep_alive<1, 2>());
+
+	this->def("start", &Progress_BFER::start, "Starts the reporter thread.");
+	this->def("stop", [](Progress_BFER& self)
+	{
+		py::gil_scoped_release release{};
+		self.stop();
+	}, "Stops the reporter thread and raises a RuntimeError with the message of the exception of the callback, if "
+	   "any.");
+	this->def("is_running", &Progress_BFER::is_running);
+	this->def("get_snapshot", [](const Progress_BFER& self)
+	{
+		return Wrapper_Progress_BFER::to_dict(self.get_snapshot());
+	});
+	this->def("__enter__", [](Progress_BFER& self) -> Progress_BFER&
+	{
+		self.start();
+		return self;
+	}, py::return_value_policy::reference);
+	this->def("__exit__", [](Progress_BFER& self, py::args)
+	{
+		py::gil_scoped_release release{};
+		self.stop();
+	});
+};
@@ -0,0 +1,41 @@
+#ifndef WRAPPER_PROGRESS_BFER_HPP_
+#define WRAPPER_PROGRESS_BFER_HPP_
+
+#include <memory>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+#include <pybind11/iostream.h>
+#include <aff3ct.hpp>
+
+#include "Tools/Progress/Progress_BFER.hpp"
+#include "Wrapper_py/Wrapper_py.hpp"
+
+namespace py = pybind11;
+using namespace aff3ct;
+using namespace aff3ct::module;
+using namespace aff3ct::tools;
+
+namespace aff3ct
+{
+namespace wrapper
+{
+// The reporter thread needs the GIL to call the callback: it has to be joined with the GIL released.
+struct Progress_BFER_deleter
+{
+	void operator()(aff3ct::tools::Progress_BFER* p) const;
+};
+
+class Wrapper_Progress_BFER : public Wrapper_py,
+                              public py::class_<aff3ct::tools::Progress_BFER,
+                                                std::unique_ptr<aff3ct::tools::Progress_BFER, Progress_BFER_deleter>>
+{
+	public:
+	Wrapper_Progress_BFER(py::handle scope);
+	virtual void definitions();
+	virtual ~Wrapper_Progress_BFER() = default;
+
+	static py::dict to_dict(const aff3ct::tools::Progress_BFER::Snapshot& s);
+};
+}
+}
+#endif //WRAPPER_PROGRESS_BFER_HPP_
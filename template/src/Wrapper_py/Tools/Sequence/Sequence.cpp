@@ -1,4 +1,5 @@
 #include "Wrapper_py/Tools/Sequence/Sequence.hpp"
+#include "Wrapper_py/Module/Task.hpp"
 
 #include <pybind11/functional.h>
 #include <functional>
@@ -57,6 +58,14 @@ void Wrapper_Sequence
 		tools::Stats::show(self.get_modules_per_types(), true);
 	});
 
+	this->def("get_stats", [](aff3ct::tools::Sequence& self)
+	{
+		std::vector<py::dict> stats;
+		for (auto& tasks : self.get_tasks_per_types())
+			stats.push_back(Wrapper_Task::get_stats(tasks));
+		return stats;
+	}, "Returns the statistics per task type, merged over the threads (the durations are in seconds, the throughput in frames per second).");
+
 	this->def("get_tasks_per_types", &aff3ct::tools::Sequence::get_tasks_per_types, py::return_value_policy::reference);
 
 	this->def("get_modules_set_seed", [](const aff3ct::tools::Sequence& self){
@@ -0,0 +1,163 @@
+#include <sstream>
+#include "Wrapper_py/Tools/Sweep/Sweep_BFER.hpp"
+
+namespace py = pybind11;
+using namespace py::literals;
+using namespace aff3ct;
+using namespace aff3ct::module;
+using namespace aff3ct::tools;
+using namespace aff3ct::wrapper;
+
+
+Wrapper_Sweep_BFER
+::Wrapper_Sweep_BFER(py::handle scope)
+: Wrapper_py(),
+  py::class_<aff3ct::tools::Sweep_BFER>(scope, "Sweep_BFER")
+{
+}
+
+
+void Wrapper_Sweep_BFER
+::definitions()
+{
+	this->doc() = R"pbdoc(Runs a BER/FER simulation over a list of noise values.
+
+For each noise value, the monitor is reset, the 'noise_buffers' arrays (the float32 arrays bound to the 'CP' sockets)
+are filled with the value and the sequence (or the pipeline) is executed until the monitor is done or one of the
+'max_fe', 'max_n_frames' and 'max_time' (in seconds) criteria is reached (0 to disable a criterion).)pbdoc";
+
+	this->def(py::init([](tools::Sequence& sequence, module::Monitor_BFER_AR<>& monitor,
+	                      const std::vector<py::array>& noise_buffers, const unsigned long long max_fe,
+	                      const unsigned long long max_n_frames, const double max_time)
+	{
+		return new Sweep_BFER(sequence, monitor, Wrapper_Sweep_BFER::get_noise_buffers(noise_buffers), max_fe,
+		                      max_n_frames, max_time);
+	}), "sequence"_a, "monitor"_a, "noise_buffers"_a, "max_fe"_a = 0, "max_n_frames"_a = 0, "max_time"_a = 0.,
+	    py::keep_alive<1, 2>(), py::keep_alive<1, 3>(), py::keep_alive<1, 4>(), py::return_value_policy::take_ownership);
+	this->def(py::init([](tools::Pipeline& pipeline, module::Monitor_BFER_AR<>& monitor,
+	                      const std::vector<py::array>& noise_buffers, const unsigned long long max_fe,
+	                      const unsigned long long max_n_frames, const double max_time)
+	{
+		return new Sweep_BFER(pipeline, monitor, Wrapper_Sweep_BFER::get_noise_buffers(noise_buffers), max_fe,
+		                      max_n_frames, max_time);
+	}), "pipeline"_a, "monitor"_a, "noise_buffers"_a, "max_fe"_a = 0, "max_n_frames"_a = 0, "max_time"_a = 0.,
+	    py::keep_alive<1, 2>(), py::keep_alive<1, 3>(), py::keep_alive<1, 4>(), py::return_value_policy::take_ownership);
+
+	this->def("run", [](Sweep_BFER& self, const std::vector<float>& noise)
+	{
+		std::vector<Sweep_BFER::Point> points;
+		{
+			py::gil_scoped_release release{};
+			points = self.run(noise);
+		}
+		return Wrapper_Sweep_BFER::to_dict(points, self.get_monitor().get_K());
+	}, R"pbdoc(Simulates all the 'noise' values and returns a dict of arrays: 'noise', 'n_frames', 'n_be', 'n_fe', 'ber',
+'fer', 'elapsed' (in seconds) and 'throughput' (in Mbps).
+
+The PRNGs of the chain are only seeded by the sweep when a cache or a checkpoint is set (see 'set_cache' and
+'set_checkpoint'). Otherwise they keep the seeds of the modules: a plain 'run' repeated from the same seeds (e.g. in a
+new process) replays the same PRNG streams, so its points are not independent of the previous ones.)pbdoc", "noise"_a);
+
+	this->def_static("run_concurrent", [](const std::vector<Sweep_BFER*>& sweeps, const std::vector<float>& noise)
+	{
+		std::vector<Sweep_BFER::Point> points;
+		{
+			py::gil_scoped_release release{};
+			points = Sweep_BFER::run_concurrent(sweeps, noise);
+		}
+		return Wrapper_Sweep_BFER::to_dict(points, sweeps[0]->get_monitor().get_K());
+	}, R"pbdoc(Simulates the 'noise' values concurrently on several independent chains, one point per sweep at a time.
+
+Each sweep of 'sweeps' must have its own modules, monitor and noise buffers. A sweep takes the next point as soon as
+its current point is done. The parallelism is per chain, a point is never split between the sweeps: when less points
+than sweeps remain (typically the slow points at low error rates, at the end), the sweeps without a point stay idle.
+Give each chain several threads (a multi-threaded Sequence or a Pipeline) to use the cores during this tail. Returns
+the same dict as 'run'.)pbdoc",
+	"sweeps"_a, "noise"_a);
+
+	this->def("set_checkpoint", &Sweep_BFER::set_checkpoint, R"pbdoc(Saves the state of 'run' in 'file_name' every 'period' seconds and after each point.
+
+When 'file_name' already exists, the next 'run' resumes from it: the points already done are returned without being
+simulated again and the counters of the point in progress are collected by the monitor. The PRNGs of the chain are
+seeded from 'seed' and from the number of runs on the file, so a resumed run does not replay the same frames. An
+empty 'file_name' disables the checkpointing.)pbdoc", "file_name"_a, "period"_a = 60., "seed"_a = 0);
+	this->def("save_checkpoint", [](Sweep_BFER& self)
+	{
+		py::gil_scoped_release release{};
+		self.save_checkpoint();
+	}, "Saves the checkpoint now (e.g. from a signal handler before a preemption).");
+
+	this->def("set_cache", [](Sweep_BFER& self, const std::string& directory, const std::string& config)
+	{
+		if (!directory.empty())
+			py::module_::import("os").attr("makedirs")(directory, "exist_ok"_a = true);
+		self.set_cache(directory, config);
+	}, R"pbdoc(Looks up the simulated points in the result cache stored in 'directory'.
+
+The key of a point is made of the signature of the chain (modules, tasks and sockets), of 'config' and of the noise
+value. 'config' should describe what the signature can't see, e.g. the constructor arguments of the modules and a
+digest of the frozen bits or of the H matrix (hashlib.sha1(frozen_bits.tobytes()).hexdigest()). The stop criteria are
+not part of the key: a cached point that meets them is returned without simulation, otherwise it is continued from its
+counters with new seeds. An empty 'directory' disables the cache.)pbdoc", "directory"_a, "config"_a = "");
+	this->def("get_point_key", &Sweep_BFER::get_point_key, "Returns the cache key of the 'noise' point.", "noise"_a);
+	this->def("get_cache_entry", [](const Sweep_BFER& self, const float noise) -> py::object
+	{
+		tools::Result_cache::Entry entry;
+		if (!self.get_cache_entry(noise, entry))
+			return py::none();
+		return py::dict("n_frames"_a = entry.n_fra,
+		                "n_be"_a     = entry.n_be,
+		                "n_fe"_a     = entry.n_fe,
+		                "elapsed"_a  = entry.elapsed,
+		                "n_runs"_a   = entry.n_runs);
+	}, R"pbdoc(Returns the cache entry of the 'noise' point as a dict ('n_frames', 'n_be', 'n_fe', 'elapsed' in seconds and
+'n_runs', the number of simulations merged in the entry), or None if there is no cache or no entry.)pbdoc", "noise"_a);
+};
+
+std::vector<std::pair<float*, size_t>> Wrapper_Sweep_BFER
+::get_noise_buffers(const std::vector<py::array>& arrays)
+{
+	std::vector<std::pair<float*, size_t>> buffers;
+	for (auto& a : arrays)
+	{
+		if (!py::isinstance<py::array_t<float>>(a) || !(a.flags() & py::array::c_style) || !a.writeable())
+		{
+			std::stringstream message;
+			message << "The noise buffers must be writeable C-contiguous float32 arrays.";
+			throw std::runtime_error(message.str());
+		}
+		buffers.push_back(std::make_pair((float*)a.mutable_data(), (size_t)a.size()));
+	}
+	return buffers;
+}
+
+py::dict Wrapper_Sweep_BFER
+::to_dict(const std::vector<aff3ct::tools::Sweep_BFER::Point>& points, const int K)
+{
+	const size_t n = points.size();
+	py::array_t<float   > noise(n), ber(n), fer(n);
+	py::array_t<uint64_t> n_fra(n), n_be(n), n_fe(n);
+	py::array_t<double  > elapsed(n), throughput(n);
+	for (size_t i = 0; i < n; i++)
+	{
+		noise     .mutable_at(i) = points[i].noise;
+		ber       .mutable_at(i) = points[i].ber;
+		fer       .mutable_at(i) = points[i].fer;
+		n_fra     .mutable_at(i) = points[i].n_fra;
+		n_be      .mutable_at(i) = points[i].n_be;
+		n_fe      .mutable_at(i) = points[i].n_fe;
+		elapsed   .mutable_at(i) = points[i].elapsed;
+		throughput.mutable_at(i) = points[i].elapsed > 0. ? points[i].n_fra * K * 1e-6 / points[i].elapsed : 0.;
+	}
+
+	py::dict res;
+	res["noise"     ] = noise;
+	res["n_frames"  ] = n_fra;
+	res["n_be"      ] = n_be;
+	res["n_fe"      ] = n_fe;
+	res["ber"       ] = ber;
+	res["fer"       ] = fer;
+	res["elapsed"   ] = elapsed;
+	res["throughput"] = throughput;
+	return res;
+}
@@ -0,0 +1,35 @@
+#ifndef WRAPPER_SWEEP_BFER_HPP_
+#define WRAPPER_SWEEP_BFER_HPP_
+
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+#include <pybind11/numpy.h>
+#include <aff3ct.hpp>
+
+#include "Tools/Sweep/Sweep_BFER.hpp"
+#include "Wrapper_py/Wrapper_py.hpp"
+
+namespace py = pybind11;
+using namespace aff3ct;
+using namespace aff3ct::module;
+using namespace aff3ct::tools;
+
+namespace aff3ct
+{
+namespace wrapper
+{
+
+class Wrapper_Sweep_BFER : public Wrapper_py,
+                           public py::class_<aff3ct::tools::Sweep_BFER>
+{
+	public:
+	Wrapper_Sweep_BFER(py::handle scope);
+	virtual void definitions();
+	virtual ~Wrapper_Sweep_BFER() = default;
+
+	static std::vector<std::pair<float*, size_t>> get_noise_buffers(const std::vector<py::array>& arrays);
+	static py::dict to_dict(const std::vector<aff3ct::tools::Sweep_BFER::Point>& points, const int K);
+};
+}
+}
+#endif //WRAPPER_SWEEP_BFER_HPP_
@@ -0,0 +1,46 @@
+#include "Wrapper_py/Tools/Tracer/Tracer.hpp"
+
+namespace py = pybind11;
+using namespace py::literals;
+using namespace aff3ct;
+using namespace aff3ct::module;
+using namespace aff3ct::tools;
+using namespace aff3ct::wrapper;
+
+
+Wrapper_Tracer
+::Wrapper_Tracer(py::handle scope)
+: Wrapper_py(),
+  py::class_<aff3ct::tools::Tracer>(scope, "Tracer")
+{
+}
+
+
+void Wrapper_Tracer
+::definitions()
+{
+	this->doc() = R"pbdoc(Records the begin and end timestamps of each task execution of a Sequence or a Pipeline.
+
+The events are stored in one ring buffer per thread ('capacity' events each, the oldest are overwritten). The
+tracing should be started and stopped when the Sequence or the Pipeline is not running.)pbdoc";
+
+	this->def(py::init<tools::Sequence&, const size_t>(), "sequence"_a, "capacity"_a = 1 << 16, py::keep_alive<1, 2>(), py::return_value_policy::take_ownership);
+	this->def(py::init<tools::Pipeline&, const size_t>(), "pipeline"_a, "capacity"_a = 1 << 16, py::keep_alive<1, 2>(), py::return_value_policy::take_ownership);
+	this->def("start",     &Tracer::start,     "Starts the recording (the previous events are discarded).");
+	this->def("stop",      &Tracer::stop,      "Stops the recording.");
+	this->def("reset",     &Tracer::reset,     "Discards the recorded events.");
+	this->def("is_active", &Tracer::is_active);
+	this->def("get_events", [](const Tracer& self)
+	{
+		std::vector<std::vector<std::tuple<std::string, int64_t, int64_t>>> events;
+		for (auto& th : self.get_events())
+		{
+			events.push_back({});
+			for (auto& e : th)
+				events.back().push_back(std::make_tuple(e.task->get_name(), e.begin, e.end));
+		}
+		return events;
+	}, "Returns the (task name, begin, end) events per thread, the timestamps are in nanoseconds.");
+	this->def("export_chrome_trace", &Tracer::export_chrome_trace, "Exports the events in the Chrome trace JSON format (readable by Perfetto).", "file_name"_a);
+	this->def("export_binary",       &Tracer::export_binary,       "Exports the events in a compact binary format.",                             "file_name"_a);
+};
@@ -0,0 +1,32 @@
+#ifndef WRAPPER_TRACER_HPP_
+#define WRAPPER_TRACER_HPP_
+
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+#include <pybind11/iostream.h>
+#include <aff3ct.hpp>
+
+#include "Tools/Tracer/Tracer.hpp"
+#include "Wrapper_py/Wrapper_py.hpp"
+
+namespace py = pybind11;
+using namespace aff3ct;
+using namespace aff3ct::module;
+using namespace aff3ct::tools;
+
+namespace aff3ct
+{
+namespace wrapper
+{
+
+class Wrapper_Tracer : public Wrapper_py,
+                       public py::class_<aff3ct::tools::Tracer>
+{
+	public:
+	Wrapper_Tracer(py::handle scope);
+	virtual void definitions();
+	virtual ~Wrapper_Tracer() = default;
+};
+}
+}
+#endif //WRAPPER_TRACER_HPP_